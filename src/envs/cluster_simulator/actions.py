@@ -1,5 +1,7 @@
 from typing import NamedTuple, Tuple, TypeVar
 import gymnasium as gym
+import numpy as np
+import numpy.typing as npt
 
 from src.envs.cluster_simulator.base.internal.cluster import ClusterAction, ClusterABC
 
@@ -11,6 +13,13 @@ class EnvironmentAction(NamedTuple):
     schedule: Tuple[int, int]
 
 
+class BatchEnvironmentAction(NamedTuple):
+    """Many placements applied in a single step, see `ClusterABC.schedule_batch`."""
+
+    machines: npt.NDArray[np.intp]
+    jobs: npt.NDArray[np.intp]
+
+
 class DilationEnvironmentAction(NamedTuple):
     selected_machine_cell: Tuple[int, int]
     selected_job: int
@@ -33,7 +42,15 @@ class DilationEnvironmentAction(NamedTuple):
 
 class ActionConvertor:
     @staticmethod
-    def convert(original: EnvironmentAction) -> ClusterAction:
+    def convert(
+        original: EnvironmentAction | BatchEnvironmentAction,
+    ) -> ClusterAction:
+        if isinstance(original, BatchEnvironmentAction):
+            return ClusterAction.ScheduleBatch(
+                np.asarray(original.machines, dtype=np.intp),
+                np.asarray(original.jobs, dtype=np.intp),
+            )
+
         if original.should_schedule:
             return ClusterAction.SkipTime()
 
@@ -53,3 +70,129 @@ class ActionConvertor:
                 ),
             )
         )
+
+
+class DiscreteActionConvertor:
+    """
+    Flat `Discrete` encoding of `EnvironmentAction`: 0 skips time and
+    `1 + machine * n_jobs + job` schedules `job` on `machine`.
+    Decoding is a lookup in tables precomputed once per environment.
+    """
+
+    SKIP_TIME = 0
+
+    def __init__(self, n_machines: int, n_jobs: int) -> None:
+        self._n_machines = n_machines
+        self._n_jobs = n_jobs
+        n_actions = 1 + n_machines * n_jobs
+        self._skip_table = np.zeros(n_actions, dtype=np.bool_)
+        self._skip_table[self.SKIP_TIME] = True
+        self._machine_table = np.full(n_actions, -1, dtype=np.int64)
+        self._machine_table[1:] = np.repeat(np.arange(n_machines), n_jobs)
+        self._job_table = np.full(n_actions, -1, dtype=np.int64)
+        self._job_table[1:] = np.tile(np.arange(n_jobs), n_machines)
+        self._skip_time = ClusterAction.SkipTime()
+
+    @classmethod
+    def from_cluster(cls, cluster: Cluster) -> "DiscreteActionConvertor":
+        return cls(cluster.n_machines, cluster.n_jobs)  # type: ignore
+
+    def create_space(self) -> gym.spaces.Discrete:
+        return gym.spaces.Discrete(len(self._skip_table))
+
+    def convert(self, index: int) -> ClusterAction:
+        if index == self.SKIP_TIME:
+            return self._skip_time
+        return ClusterAction.Schedule(
+            int(self._machine_table[index]), int(self._job_table[index])
+        )
+
+    def encode(self, action: EnvironmentAction) -> int:
+        if action.should_schedule:
+            return self.SKIP_TIME
+        machine, job = action.schedule
+        return 1 + machine * self._n_jobs + job
+
+    def decode(self, index: int) -> EnvironmentAction:
+        return EnvironmentAction(
+            should_schedule=bool(self._skip_table[index]),
+            schedule=(int(self._machine_table[index]), int(self._job_table[index])),
+        )
+
+    def decode_batch(
+        self, indices: npt.ArrayLike
+    ) -> Tuple[npt.NDArray[np.bool_], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Decode many actions at once into (skip_time, machine, job) arrays."""
+        indices = np.asarray(indices)
+        return (
+            self._skip_table[indices],
+            self._machine_table[indices],
+            self._job_table[indices],
+        )
+
+
+class DilationDiscreteActionConvertor:
+    """
+    Flat `Discrete` encoding of `DilationEnvironmentAction`: 0 skips time, 1 contracts
+    and `2 + (x * kernel_y + y) * n_jobs + job` selects cell (x, y) with `job`.
+    """
+
+    SKIP_TIME = 0
+    CONTRACT = 1
+
+    def __init__(self, kernel_shape: Tuple[int, int], n_jobs: int) -> None:
+        kernel_x, kernel_y = kernel_shape
+        n_cells = kernel_x * kernel_y
+        n_actions = 2 + n_cells * n_jobs
+        self._kernel_y = kernel_y
+        self._n_jobs = n_jobs
+        self._skip_table = np.zeros(n_actions, dtype=np.bool_)
+        self._skip_table[self.SKIP_TIME] = True
+        self._contract_table = np.zeros(n_actions, dtype=np.bool_)
+        self._contract_table[self.CONTRACT] = True
+        self._cell_table = np.full((n_actions, 2), -1, dtype=np.int64)
+        cells = np.stack(np.divmod(np.arange(n_cells), kernel_y), axis=-1)
+        self._cell_table[2:] = np.repeat(cells, n_jobs, axis=0)
+        self._job_table = np.full(n_actions, -1, dtype=np.int64)
+        self._job_table[2:] = np.tile(np.arange(n_jobs), n_cells)
+        self._decoded = [self._decode(index) for index in range(n_actions)]
+
+    def create_space(self) -> gym.spaces.Discrete:
+        return gym.spaces.Discrete(len(self._skip_table))
+
+    def encode(self, action: DilationEnvironmentAction) -> int:
+        if action.execute_schedule_command:
+            return self.SKIP_TIME
+        if action.contract:
+            return self.CONTRACT
+        x, y = action.selected_machine_cell
+        return 2 + (x * self._kernel_y + y) * self._n_jobs + action.selected_job
+
+    def decode(self, index: int) -> DilationEnvironmentAction:
+        return self._decoded[index]
+
+    def decode_batch(
+        self, indices: npt.ArrayLike
+    ) -> Tuple[
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.int64],
+        npt.NDArray[np.int64],
+    ]:
+        """Decode many actions at once into (skip_time, contract, cell, job) arrays."""
+        indices = np.asarray(indices)
+        return (
+            self._skip_table[indices],
+            self._contract_table[indices],
+            self._cell_table[indices],
+            self._job_table[indices],
+        )
+
+    def _decode(self, index: int) -> DilationEnvironmentAction:
+        x, y = self._cell_table[index]
+        return DilationEnvironmentAction(
+            selected_machine_cell=(int(x), int(y)),
+            selected_job=int(self._job_table[index]),
+            execute_schedule_command=bool(self._skip_table[index]),
+            contract=bool(self._contract_table[index]),
+        )
@@ -1,8 +1,11 @@
 import abc
-from typing import TypeVar, TypedDict, Generic
+from typing import TypeVar, TypedDict, Generic, Optional
+import numpy as np
 import numpy.typing as npt
 
 from src.envs.cluster_simulator.base.extractors.observation import ClusterObservation
+from src.envs.cluster_simulator.base.internal.cluster import ClusterABC
+from src.envs.cluster_simulator.utils.array_operations import cell_capacity
 
 
 class ClusterBaseInformation(TypedDict):
@@ -10,17 +13,108 @@ class ClusterBaseInformation(TypedDict):
     n_jobs: int
     jobs_status: npt.ArrayLike
     current_tick: int
+    arrival_time: npt.NDArray[np.int64]
+    jobs_length: npt.NDArray[np.int64]
+    utilization: float
+
+
+class ClusterKPIInformation(ClusterBaseInformation):
+    utilization_per_resource: npt.NDArray[np.float64]
+    fragmentation: npt.NDArray[np.float64]
+    queue_length: int
+    mean_wait_time: float
+    running_jobs_per_machine: npt.NDArray[np.int64]
 
 
 ClusterInformation = TypeVar("ClusterInformation", bound=ClusterBaseInformation)
 
 
+def jobs_length(jobs_usage: npt.NDArray) -> npt.NDArray[np.int64]:
+    """
+    Ticks between the first and the last tick each job uses any resource in, for
+    [n_jobs, ..., n_ticks] usages. Jobs without timeline last a single tick.
+    """
+    jobs_usage = np.asarray(jobs_usage)
+    if jobs_usage.ndim == 1:
+        return np.ones(len(jobs_usage), dtype=np.int64)
+    active = np.any(
+        jobs_usage.reshape(*jobs_usage.shape[:1], -1, jobs_usage.shape[-1]) > 0, axis=1
+    )
+    n_ticks = active.shape[-1]
+    first = np.argmax(active, axis=-1)
+    last = n_ticks - 1 - np.argmax(active[:, ::-1], axis=-1)
+    return np.where(active.any(axis=-1), last - first + 1, 0).astype(np.int64)
+
+
 class BaceClusterInformationExtractor(Generic[ClusterObservation, ClusterInformation]):
+    def __init__(self) -> None:
+        # Jobs usage only changes on reset, lengths are kept until the array does
+        self._lengths_of: Optional[npt.NDArray] = None
+        self._lengths: npt.NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+
+    def attach(self, cluster: ClusterABC) -> None:
+        """Called by the environment with the cluster the observations come from."""
+
     @abc.abstractmethod
     def __call__(self, obs: ClusterObservation) -> ClusterInformation:
+        jobs_status = obs["jobs_status"]
+        n_jobs = obs["jobs_usage"].shape[0]
+        arrival_time = (
+            obs["arrival_time"]
+            if "arrival_time" in obs
+            else np.zeros(n_jobs, dtype=np.int64)
+        )
         return ClusterBaseInformation(
             n_machines=obs["machines"].shape[0],
-            n_jobs=obs["jobs_usage"].shape[0],
-            jobs_status=obs["jobs_status"],
+            n_jobs=n_jobs,
+            jobs_status=jobs_status,
             current_tick=obs["current_tick"],
+            arrival_time=arrival_time,
+            jobs_length=self.jobs_length(obs["jobs_usage"]),
+            utilization=self.utilization(obs["machines"]),
+        )
+
+    def jobs_length(self, jobs_usage: npt.NDArray) -> npt.NDArray[np.int64]:
+        if self._lengths_of is not jobs_usage:
+            self._lengths_of = jobs_usage
+            self._lengths = jobs_length(jobs_usage)
+        return self._lengths
+
+    @staticmethod
+    def utilization(machines: npt.NDArray) -> float:
+        """Used share of the current tick capacity (see `cell_capacity`)."""
+        machines = np.asarray(machines)
+        machines = machines.astype(np.float64) / cell_capacity(machines.dtype)
+        now = machines if machines.ndim == 1 else machines[..., 0]
+        now = now[np.isfinite(now)]  # Placeholder machines are infinitely free
+        return float(1.0 - now.mean()) if now.size else 0.0
+
+
+class KPIInformationExtractor(
+    BaceClusterInformationExtractor[ClusterObservation, ClusterKPIInformation]
+):
+    """
+    Adds the KPIs the attached cluster keeps up to date (see `ClusterABC.kpis`), so
+    nothing is rescanned per step.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._cluster: Optional[ClusterABC] = None
+
+    def attach(self, cluster: ClusterABC) -> None:
+        self._cluster = cluster
+
+    def __call__(self, obs: ClusterObservation) -> ClusterKPIInformation:
+        if self._cluster is None:
+            raise RuntimeError(f"{type(self).__name__} isn't attached to a cluster")
+        info = super().__call__(obs)
+        kpis = self._cluster.kpis()
+        return ClusterKPIInformation(
+            **info,
+            utilization_per_resource=kpis.utilization,
+            fragmentation=kpis.fragmentation,
+            queue_length=kpis.queue_length,
+            mean_wait_time=kpis.mean_wait_time,
+            running_jobs_per_machine=kpis.running_jobs_per_machine,
         )
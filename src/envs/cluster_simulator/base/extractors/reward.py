@@ -1,10 +1,27 @@
-from typing import Generic
+from typing import Generic, Sequence, Tuple
 import abc
 
+import numpy as np
+import numpy.typing as npt
+
 from src.envs.cluster_simulator.base.internal.job import Status
 from src.envs.cluster_simulator.base.extractors.information import ClusterInformation
 
 
+def _count(statuses: npt.ArrayLike, *targets: Status) -> int:
+    return int(np.isin(np.asarray(statuses), targets).sum())
+
+
+def _elapsed_ticks(
+    prev_extra_information: ClusterInformation,
+    current_extra_information: ClusterInformation,
+) -> int:
+    return int(
+        np.ravel(current_extra_information["current_tick"])[0]
+        - np.ravel(prev_extra_information["current_tick"])[0]
+    )
+
+
 class RewardCaculator(Generic[ClusterInformation]):
     @abc.abstractmethod
     def __call__(
@@ -20,10 +37,88 @@ class DifferentInPendingJobsRewardCaculator(RewardCaculator[ClusterInformation])
         prev_extra_information: ClusterInformation,
         current_extra_information: ClusterInformation,
     ) -> float:
-        prev_not_pending_jobs_count = sum(
-            s != Status.Pending for s in prev_extra_information["jobs_status"]
+        prev_not_pending_jobs_count = len(
+            prev_extra_information["jobs_status"]
+        ) - _count(prev_extra_information["jobs_status"], Status.Pending)
+        current_not_pending_jobs_count = len(
+            current_extra_information["jobs_status"]
+        ) - _count(current_extra_information["jobs_status"], Status.Pending)
+        return current_not_pending_jobs_count - prev_not_pending_jobs_count
+
+
+class SlowdownRewardCaculator(RewardCaculator[ClusterInformation]):
+    """
+    DeepRM slowdown penalty: every tick costs `-1 / length` for each job waiting or
+    running, so the episode return is minus the total slowdown of the jobs.
+    """
+
+    def __call__(
+        self,
+        prev_extra_information: ClusterInformation,
+        current_extra_information: ClusterInformation,
+    ) -> float:
+        in_system = np.isin(
+            np.asarray(prev_extra_information["jobs_status"]),
+            (Status.Pending, Status.Running),
         )
-        current_not_pending_jobs_count = sum(
-            s != Status.Pending for s in current_extra_information["jobs_status"]
+        lengths = np.maximum(prev_extra_information["jobs_length"], 1)
+        return -_elapsed_ticks(
+            prev_extra_information, current_extra_information
+        ) * float(np.sum(in_system / lengths))
+
+
+class UtilizationRewardCaculator(RewardCaculator[ClusterInformation]):
+    """Used share of the cluster capacity after the step."""
+
+    def __call__(
+        self,
+        prev_extra_information: ClusterInformation,
+        current_extra_information: ClusterInformation,
+    ) -> float:
+        return float(current_extra_information["utilization"])
+
+
+class MakespanRewardCaculator(RewardCaculator[ClusterInformation]):
+    """`-1` for every tick passed while some job isn't completed yet."""
+
+    def __call__(
+        self,
+        prev_extra_information: ClusterInformation,
+        current_extra_information: ClusterInformation,
+    ) -> float:
+        statuses = prev_extra_information["jobs_status"]
+        if _count(statuses, Status.Completed) == len(statuses):
+            return 0.0
+        return -float(_elapsed_ticks(prev_extra_information, current_extra_information))
+
+
+class QueueLengthRewardCaculator(RewardCaculator[ClusterInformation]):
+    """Minus the number of pending jobs after the step."""
+
+    def __call__(
+        self,
+        prev_extra_information: ClusterInformation,
+        current_extra_information: ClusterInformation,
+    ) -> float:
+        return -float(_count(current_extra_information["jobs_status"], Status.Pending))
+
+
+class WeightedRewardCaculator(RewardCaculator[ClusterInformation]):
+    """Weighted sum of rewards, e.g. `WeightedRewardCaculator([(1.0, a), (0.1, b)])`."""
+
+    def __init__(
+        self, terms: Sequence[Tuple[float, RewardCaculator[ClusterInformation]]]
+    ) -> None:
+        self._terms = list(terms)
+
+    def __call__(
+        self,
+        prev_extra_information: ClusterInformation,
+        current_extra_information: ClusterInformation,
+    ) -> float:
+        return float(
+            sum(
+                weight * reward(prev_extra_information, current_extra_information)
+                for weight, reward in self._terms
+            )
         )
-        return current_not_pending_jobs_count - prev_not_pending_jobs_count
@@ -1,11 +1,18 @@
 import typing as tp
 import abc
 
+import numpy as np
+import numpy.typing as npt
 from rust_enum import enum, Case
 
-from src.envs.cluster_simulator.base.internal.job import Job, JobCollection
+from src.envs.cluster_simulator.base.internal.job import (
+    Job,
+    JobCollection,
+    RunningJobsIndex,
+)
 from src.envs.cluster_simulator.base.internal.job import Status as JobStatus
 from src.envs.cluster_simulator.base.internal.machine import Machine, MachineCollection
+from src.envs.cluster_simulator.utils.array_operations import cell_capacity
 import logging
 
 T = tp.TypeVar("T")
@@ -18,6 +25,25 @@ Jobs = tp.TypeVar("Jobs", bound=JobCollection)
 class ClusterAction:
     SkipTime = Case()
     Schedule = Case(machine=int, job=int)
+    ScheduleBatch = Case(machines=np.ndarray, jobs=np.ndarray)
+    ScheduleAt = Case(machine=int, job=int, offset=int)
+    Preempt = Case(job=int)
+    Migrate = Case(job=int, machine=int)
+
+
+class ClusterKPIs(tp.NamedTuple):
+    utilization: npt.NDArray[np.float64]  # [n_resources] used share of capacity now
+    fragmentation: npt.NDArray[np.float64]  # [n_resources] free space spread share
+    queue_length: int
+    mean_wait_time: float  # Over the jobs started so far
+    running_jobs_per_machine: npt.NDArray[np.int64]
+
+
+class EpisodeStatistics(tp.NamedTuple):
+    makespan: int  # Tick the last job completed at
+    mean_completion_time: float  # Finish - arrival, over the completed jobs
+    slowdown_percentiles: npt.NDArray[np.float64]  # (finish - arrival) / length
+    utilization: npt.NDArray[np.float64]  # [n_ticks, n_resources] per passed tick
 
 
 class ClusterABC(tp.Generic[Machines, Jobs], abc.ABC):
@@ -35,14 +61,66 @@ class ClusterABC(tp.Generic[Machines, Jobs], abc.ABC):
     @abc.abstractmethod
     def allocation(self, machine: Machine[T], job: Job[T]) -> None: ...
 
+    def feasibility_matrix(
+        self, machines: Machines, jobs: Jobs
+    ) -> npt.NDArray[np.bool_]:
+        """[n_machines, n_jobs] mask of the pairs `is_allocation_possible` accepts."""
+        return np.array(
+            [
+                [self.is_allocation_possible(machine, job) for job in jobs]
+                for machine in iter(machines)
+            ],
+            dtype=np.bool_,
+        ).reshape(len(machines), len(jobs))
+
+    def placement_options(self, job: Job[T]) -> npt.NDArray[np.bool_]:
+        """
+        [n_machines, n_offsets] mask of the tick offsets (0 being now) at which the
+        job fits each machine timeline. Without timelines only now is an option.
+        """
+        return np.array(
+            [
+                [self.is_allocation_possible(machine, job)]
+                for machine in iter(self._machines)
+            ],
+            dtype=np.bool_,
+        ).reshape(len(self._machines), 1)
+
+    def earliest_start(self, job: Job[T]) -> npt.NDArray[np.int64]:
+        """Per machine, the first offset at which the job fits or -1 if none does."""
+        options = self.placement_options(job)
+        return np.where(options.any(axis=1), np.argmax(options, axis=1), -1)
+
+    def allocation_at(self, machine: Machine[T], job: Job[T], offset: int) -> None:
+        if offset != 0:
+            raise NotImplementedError(
+                f"{type(self).__name__} can only allocate jobs at offset 0"
+            )
+        self.allocation(machine, job)
+
+    def release(self, machine: Machine[T], job: Job[T], elapsed: int) -> None:
+        """
+        Gives back to the machine the part of the job profile that didn't run yet,
+        `elapsed` being the ticks the job already ran (negative while it waits for a
+        delayed start).
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't release jobs")
+
     def __init__(self, seed: tp.Optional[tp.SupportsFloat]):
         self._current_tick = 0
         self._machines = self.machine_creator(seed)
         self._jobs = self.workload_creator(seed)
         self._jobs.execute_clock_tick(self._current_tick)
-        self._running_job_to_machine: dict[int, int] = {}
+        self._running_jobs = RunningJobsIndex()
+        self._n_started_jobs = 0
+        self._total_wait_time = 0
+        self._reset_episode_records()
         self.logger = logging.getLogger(type(self).__name__)
 
+    @property
+    def running_jobs(self) -> RunningJobsIndex:
+        return self._running_jobs
+
     @property
     def n_jobs(self) -> int:
         return len(self._jobs)
@@ -87,21 +165,237 @@ class ClusterABC(tp.Generic[Machines, Jobs], abc.ABC):
             return False
 
         self.allocation(machine, job)
+        self._machines.notify_allocation(m_idx)
         self.logger.info(
             "Scheduling job %d on machine %d",
             j_idx,
             m_idx,
         )
+        self._start_job(m_idx, j_idx)
+        return True
+
+    def schedule_at(self, m_idx: int, j_idx: int, offset: int) -> bool:
+        """
+        Schedules the job to start `offset` ticks from now. The job holds its machine
+        (and status `Running`) from now on and completes `offset` ticks later.
+        """
+        if offset == 0:
+            return self.schedule(m_idx, j_idx)
+
+        job = self._jobs[j_idx]
+        if job.status != JobStatus.Pending:
+            self.logger.warning(
+                "Invalid action: job %d has status '%s' (expected: 'Pending')",
+                j_idx,
+                job.status.name,
+            )
+            return False
+
+        options = self.placement_options(job)
+        if not (0 < offset < options.shape[1] and options[m_idx, offset]):
+            self.logger.warning(
+                "Schedule rejected: no room at offset %d | machine=%d job=%d",
+                offset,
+                m_idx,
+                j_idx,
+            )
+            return False
+
+        self.allocation_at(self._machines[m_idx], job, offset)
+        self._machines.notify_allocation(m_idx)
+        self.logger.info(
+            "Scheduling job %d on machine %d in %d ticks", j_idx, m_idx, offset
+        )
+        self._start_job(m_idx, j_idx, offset)
+        return True
+
+    def schedule_batch(
+        self, m_indices: npt.ArrayLike, j_indices: npt.ArrayLike
+    ) -> npt.NDArray[np.bool_]:
+        """
+        Applies many (machine, job) placements in one call and returns which were
+        scheduled. Pairs are checked in order: only the first pair naming a job counts
+        and the pairs of a machine are admitted up to the first one it can't fit.
+        """
+        m_indices = np.asarray(m_indices, dtype=np.intp)
+        j_indices = np.asarray(j_indices, dtype=np.intp)
+        scheduled = np.zeros(len(j_indices), dtype=np.bool_)
+        full_machines: set[int] = set()
+        seen_jobs: set[int] = set()
+        for pair_idx, (m_idx, j_idx) in enumerate(zip(m_indices, j_indices)):
+            m_idx, j_idx = int(m_idx), int(j_idx)
+            if j_idx in seen_jobs:
+                continue
+            seen_jobs.add(j_idx)
+            if self._jobs[j_idx].status != JobStatus.Pending:
+                continue
+            if m_idx in full_machines:
+                continue
+            if not self.is_allocation_possible(
+                self._machines[m_idx], self._jobs[j_idx]
+            ):
+                full_machines.add(m_idx)
+                continue
+            scheduled[pair_idx] = self.schedule(m_idx, j_idx)
+        self.logger.info(
+            "Batch scheduled %d out of %d pairs", scheduled.sum(), len(scheduled)
+        )
+        return scheduled
+
+    def _start_job(self, m_idx: int, j_idx: int, offset: int = 0) -> None:
+        job = self._jobs[j_idx]
+        if job.status == JobStatus.Pending:
+            self._n_started_jobs += 1
+            self._total_wait_time += self._current_tick - job.arrival_time
+        self._start_ticks[j_idx] = self._current_tick + offset
         job.status = JobStatus.Running
-        job.run_time = 1  # Assume that if start running the in next one will finish
-        self._running_job_to_machine[m_idx] = j_idx
+        self._jobs.pending_index.discard(j_idx)
+        # Assume that if start running the in next one will finish, a delayed job
+        # waits `offset` ticks before actually running
+        job.run_time = 1 - offset
+        self._running_jobs.add(j_idx, m_idx)
         self.logger.debug(
             "Running job %d on machine %d",
             j_idx,
             m_idx,
         )
+
+    def kpis(self) -> ClusterKPIs:
+        """
+        Counters kept up to date on every transition, only the capacity figures
+        are read off the current tick of the machines (see `cell_capacity`).
+        """
+        free = np.asarray(self._machines.free_space_tensor())
+        free = free.astype(np.float64) / cell_capacity(free.dtype)
+        now = free[..., 0] if free.ndim > 1 else free
+        now = now.reshape(len(now), now.shape[1] if now.ndim > 1 else 1, -1)
+        now = now[np.isfinite(now).all(axis=(1, 2))].mean(axis=2)  # [M, R]
+        total_free = now.sum(axis=0)
+        fragmentation = np.divide(
+            now.max(axis=0, initial=0.0),
+            total_free,
+            out=np.ones_like(total_free),
+            where=total_free > 0,
+        )
+        return ClusterKPIs(
+            utilization=1.0 - now.mean(axis=0) if len(now) else total_free,
+            fragmentation=1.0 - fragmentation,
+            queue_length=len(self._jobs.pending_index),
+            mean_wait_time=self._total_wait_time / max(self._n_started_jobs, 1),
+            running_jobs_per_machine=self._running_jobs.load(self.n_machines),
+        )
+
+    def episode_statistics(
+        self, percentiles: tp.Sequence[float] = (50, 90, 99)
+    ) -> EpisodeStatistics:
+        """
+        Computed from the per job start / finish ticks recorded so far, the
+        utilization curve replaying the profile of the last run of every job.
+        """
+        arrival = np.array([job.arrival_time for job in self._jobs], dtype=np.int64)
+        length = np.array([max(job.length, 1) for job in self._jobs], dtype=np.int64)
+        is_done = self._finish_ticks >= 0
+        completion = (self._finish_ticks - arrival)[is_done]
+        slowdown = completion / length[is_done]
+        return EpisodeStatistics(
+            makespan=int(self._finish_ticks.max(initial=0)),
+            mean_completion_time=float(completion.mean()) if completion.size else 0.0,
+            slowdown_percentiles=(
+                np.percentile(slowdown, percentiles)
+                if slowdown.size
+                else np.full(len(percentiles), np.nan)
+            ),
+            utilization=self._utilization_curve(),
+        )
+
+    @property
+    def start_ticks(self) -> npt.NDArray[np.int64]:
+        """Tick the last run of every job started (or starts) at, -1 if none did."""
+        return self._start_ticks
+
+    @property
+    def finish_ticks(self) -> npt.NDArray[np.int64]:
+        """Tick every job completed at, -1 if it didn't."""
+        return self._finish_ticks
+
+    def _utilization_curve(self) -> npt.NDArray[np.float64]:
+        """[n_ticks, n_resources] used share of the capacity (1 per machine cell)."""
+        usage = np.asarray(self._jobs.usage_tensor())
+        usage = usage.astype(np.float64) / cell_capacity(usage.dtype)
+        if usage.ndim == 1:
+            usage = usage[:, None, None]
+        # [n_jobs, n_resources, n_ticks], units of a resource averaged together
+        usage = usage.reshape(*usage.shape[:2], -1, usage.shape[-1]).mean(axis=2)
+        free = np.asarray(self._machines.free_space_tensor(), dtype=np.float64)
+        n_real_machines = np.isfinite(free.reshape(len(free), -1)).all(axis=1).sum()
+
+        curve = np.zeros((self._current_tick, usage.shape[1]))
+        started = self._start_ticks >= 0
+        ticks = self._start_ticks[started, None] + np.arange(usage.shape[-1])
+        in_episode = ticks < self._current_tick
+        np.add.at(
+            curve,
+            ticks[in_episode],
+            np.swapaxes(usage[started], 1, 2)[in_episode],
+        )
+        return curve / max(n_real_machines, 1)
+
+    def _reset_episode_records(self) -> None:
+        self._start_ticks = np.full(len(self._jobs), -1, dtype=np.int64)
+        self._finish_ticks = np.full(len(self._jobs), -1, dtype=np.int64)
+
+    def preempt(self, j_idx: int) -> bool:
+        """
+        Stops a running job, releases what is left of its profile and requeues it.
+        The job loses its progress and runs its whole profile once scheduled again.
+        """
+        m_idx = self._running_jobs.machine_of(j_idx)
+        if m_idx is None:
+            self.logger.warning("Invalid action: job %d isn't running", j_idx)
+            return False
+
+        self._stop_job(m_idx, j_idx)
+        job = self._jobs[j_idx]
+        job.status = JobStatus.Pending
+        job.run_time = 0
+        self._start_ticks[j_idx] = -1
+        self._jobs.pending_index.push(j_idx)
+        self.logger.info("Preempted job %d from machine %d", j_idx, m_idx)
         return True
 
+    def migrate(self, j_idx: int, m_idx: int) -> bool:
+        """
+        Moves a running job to another machine, where it restarts its profile now.
+        The job keeps running on its machine when the target can't fit it.
+        """
+        source_idx = self._running_jobs.machine_of(j_idx)
+        if source_idx is None:
+            self.logger.warning("Invalid action: job %d isn't running", j_idx)
+            return False
+
+        job = self._jobs[j_idx]
+        machine = self._machines[m_idx]
+        if source_idx == m_idx or not self.is_allocation_possible(machine, job):
+            self.logger.warning(
+                "Migration rejected: machine %d can't take job %d", m_idx, j_idx
+            )
+            return False
+
+        self._stop_job(source_idx, j_idx)
+        self.allocation(machine, job)
+        self._machines.notify_allocation(m_idx)
+        self.logger.info(
+            "Migrated job %d from machine %d to machine %d", j_idx, source_idx, m_idx
+        )
+        self._start_job(m_idx, j_idx)
+        return True
+
+    def _stop_job(self, m_idx: int, j_idx: int) -> None:
+        job = self._jobs[j_idx]
+        self.release(self._machines[m_idx], job, job.run_time - 1)
+        self._machines.notify_allocation(m_idx)
+        self._running_jobs.remove(j_idx)
+
     def execute_clock_tick(self) -> None:
         self.logger.info(
             "Executing clock tick: %d → %d",
@@ -110,27 +404,39 @@ class ClusterABC(tp.Generic[Machines, Jobs], abc.ABC):
         )
         self._current_tick += 1
         self._jobs.execute_clock_tick(self._current_tick)
-        running_jobs = {
-            j_idx
-            for j_idx, job in enumerate(iter(self._jobs))
-            if job.status != JobStatus.Running
-        }
-        self._running_job_to_machine = {
-            k: v for k, v in self._running_job_to_machine.items() if k in running_jobs
-        }
+        for j_idx, _ in self._running_jobs:
+            if self._jobs[j_idx].status != JobStatus.Running:
+                self._running_jobs.remove(j_idx)
+                self._finish_ticks[j_idx] = self._current_tick
         self._machines.execute_clock_tick()
+        self._machines.invalidate_capacity_index()
 
     def reset(self, seed: tp.Optional[tp.SupportsFloat]) -> None:
         self._current_tick = 0
         self._jobs = self.workload_creator(seed)
         self._machines.clean_and_reset(seed)
+        self._running_jobs.clear()
+        self._n_started_jobs = 0
+        self._total_wait_time = 0
+        self._reset_episode_records()
+        self._machines.invalidate_capacity_index()
 
-    def execute(self, action: ClusterAction) -> tp.Optional[bool]:
+    def execute(
+        self, action: ClusterAction
+    ) -> tp.Optional[bool] | npt.NDArray[np.bool_]:
         match action:
             case ClusterAction.SkipTime():
                 return self.execute_clock_tick()
             case ClusterAction.Schedule(machine_idx, job_idx):
                 return self.schedule(machine_idx, job_idx)
+            case ClusterAction.ScheduleBatch(machine_indices, job_indices):
+                return self.schedule_batch(machine_indices, job_indices)
+            case ClusterAction.ScheduleAt(machine_idx, job_idx, offset):
+                return self.schedule_at(machine_idx, job_idx, offset)
+            case ClusterAction.Preempt(job_idx):
+                return self.preempt(job_idx)
+            case ClusterAction.Migrate(job_idx, machine_idx):
+                return self.migrate(job_idx, machine_idx)
             case _:
                 raise RuntimeError(
                     f"Provided command should be {ClusterAction.SkipTime.__class__} or {ClusterAction.Schedule.__class__} and not {type(action).__class__}"
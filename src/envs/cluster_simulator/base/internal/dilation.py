@@ -1,4 +1,5 @@
 import typing as tp
+import numpy as np
 import numpy.typing as npt
 import abc
 from rust_enum import enum, Case
@@ -41,6 +42,7 @@ class AbstractDilation(abc.ABC, tp.Generic[State]):
     _kernel: tp.Tuple[int, int]
     _dilation_levels: tp.List[State]
     _n_levels: int
+    _feasibility_levels: tp.Optional[tp.List[npt.NDArray[np.bool_]]] = None
     logger: logging.Logger
 
     @abc.abstractmethod
@@ -55,6 +57,11 @@ class AbstractDilation(abc.ABC, tp.Generic[State]):
     @abc.abstractclassmethod
     def cast_into_dilation_format(cls, array: State) -> State: ...
 
+    @classmethod
+    def from_machines(cls, machines: State, **params: tp.Any) -> "AbstractDilation":
+        """Build a dilator straight from the (n_machines, ...) machines array."""
+        return cls(**params, array=cls.cast_into_dilation_format(machines))
+
     def __init__(
         self,
         kernel: tp.Tuple[int, int],
@@ -80,7 +87,9 @@ class AbstractDilation(abc.ABC, tp.Generic[State]):
             case DilationState.Initial(_, level) | DilationState.Expanded(
                 _, _, _, level
             ) if level == 1:
-                value = self.get_window_from_cell(level=1, cell=cell)
+                value = self.get_window_from_cell(
+                    level=1, cell=self._global_cell(self.state, cell, self._kernel)
+                )
                 self.logger.debug(
                     "Expanding level: %d → %d",
                     1,
@@ -92,7 +101,10 @@ class AbstractDilation(abc.ABC, tp.Generic[State]):
             case DilationState.Initial(_, level) | DilationState.Expanded(
                 _, _, _, level
             ) if level > 1:
-                value = self.get_window_from_cell(level=level, cell=cell)
+                value = self.get_window_from_cell(
+                    level=level,
+                    cell=self._global_cell(self.state, cell, self._kernel),
+                )
                 self.logger.debug(
                     "Expanding level: %d → %d",
                     level,
@@ -120,6 +132,7 @@ class AbstractDilation(abc.ABC, tp.Generic[State]):
                 _, prev, _, _
             ):
                 self.logger.debug("Contracting to previous level")
+                self.state = prev
                 return prev
             case _:
                 raise ValueError("Unreachable code")
@@ -161,6 +174,50 @@ class AbstractDilation(abc.ABC, tp.Generic[State]):
     def get_kernel(self) -> tp.Tuple[int, int]:
         return self._kernel
 
+    def get_window_mask(self) -> npt.NDArray[np.bool_]:
+        """Cells of the current window backed by at least one real machine."""
+        return np.ones(self._kernel, dtype=np.bool_)
+
+    def set_feasibility(self, feasibility: npt.NDArray[np.bool_]) -> None:
+        """
+        Attach a [n_machines, n_jobs] feasibility matrix; every level then tells,
+        per block, whether any of its machines can host job j.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support feasibility pooling"
+        )
+
+    def get_window_feasibility(self) -> tp.Optional[npt.NDArray[np.bool_]]:
+        """[k_x, k_y, n_jobs] feasibility of the current window, if attached."""
+        if self._feasibility_levels is None:
+            return None
+        return self._current_window(self._feasibility_levels)[..., 0]
+
+    def get_candidate_cells(self) -> npt.NDArray[np.bool_]:
+        """
+        Cells of the current window backed by a real machine with free capacity, or,
+        when a feasibility matrix is attached, able to host a job.
+        """
+        feasibility = self.get_window_feasibility()
+        if feasibility is not None:
+            return self.get_window_mask() & np.any(feasibility, axis=-1)
+        value = np.asarray(self.state.value).reshape(*self._kernel, -1)
+        return self.get_window_mask() & np.any(value > 0, axis=-1)
+
+    def _current_window(self, levels: tp.List[npt.NDArray]) -> npt.NDArray:
+        """Slice of `levels` (a pyramid shaped like the dilation levels) in view."""
+        match self.state:
+            case DilationState.Initial(_, level):
+                return levels[level]
+            case DilationState.Expanded(
+                prev_action, prev_state, _, level
+            ) | DilationState.FullyExpanded(prev_action, prev_state, _, level):
+                k_x, k_y = self._kernel
+                x, y = self._global_cell(prev_state, prev_action, self._kernel)
+                return levels[level][x * k_x : (x + 1) * k_x, y * k_y : (y + 1) * k_y]
+            case _:
+                raise ValueError("Unreachable code")
+
     @classmethod
     def _calculate_original_cell_recursive(
         cls,
@@ -168,20 +225,33 @@ class AbstractDilation(abc.ABC, tp.Generic[State]):
         action: tp.Tuple[int, int],
         kernel: tp.Tuple[int, int],
     ) -> tp.Tuple[int, int]:
-        final_action = [action[0], action[1]]
-        while True:
-            match current_state:
-                case DilationState.FullyExpanded(
-                    prev_action, prev_state, _, _
-                ) | DilationState.Expanded(prev_action, prev_state, _, _):
-                    final_action[0] += prev_action[0] * kernel[0]
-                    final_action[1] += prev_action[1] * kernel[1]
-                    current_state = prev_state
-                case DilationState.Initial(_, _):
-                    break
-                case _:
-                    raise ValueError
-        return final_action[0], final_action[1]
+        return cls._global_cell(current_state, action, kernel)
+
+    @classmethod
+    def _global_cell(
+        cls,
+        current_state: DilationState,
+        action: tp.Tuple[int, int],
+        kernel: tp.Tuple[int, int],
+    ) -> tp.Tuple[int, int]:
+        """Translate a cell of the current window into a cell of its whole level."""
+        origin_x, origin_y = cls._window_origin(current_state, kernel)
+        return origin_x + action[0], origin_y + action[1]
+
+    @classmethod
+    def _window_origin(
+        cls, current_state: DilationState, kernel: tp.Tuple[int, int]
+    ) -> tp.Tuple[int, int]:
+        match current_state:
+            case DilationState.FullyExpanded(
+                prev_action, prev_state, _, _
+            ) | DilationState.Expanded(prev_action, prev_state, _, _):
+                prev_x, prev_y = cls._global_cell(prev_state, prev_action, kernel)
+                return prev_x * kernel[0], prev_y * kernel[1]
+            case DilationState.Initial(_, _):
+                return 0, 0
+            case _:
+                raise ValueError
 
     @staticmethod
     def reshape_machines(array: npt.NDArray) -> npt.ArrayLike:
@@ -1,7 +1,13 @@
 import abc
+import bisect
 import enum
+import heapq
+import itertools
 import typing as tp
 
+import numpy as np
+import numpy.typing as npt
+
 T = tp.TypeVar("T")
 R = tp.TypeVar("R", bound=tp.Iterable[T])
 JobsCollectionArgs = tp.TypeVar("JobsCollectionArgs", bound=tuple)
@@ -33,6 +39,152 @@ class Job(tp.Protocol[T]):
         return self.length - self.run_time
 
 
+class PendingJobsIndex:
+    """
+    Pending jobs kept in arrival (FIFO), length (min-heap) and index (for rotating
+    cursors) order, updated on status transitions instead of rescanning every job.
+    Jobs leaving `Pending` are dropped lazily when met, jobs entering it must be pushed.
+    """
+
+    def __init__(self, jobs: tp.Iterable[Job]) -> None:
+        self._jobs: tp.List[Job] = list(jobs)
+        self._generation = itertools.count()
+        self._fifo: tp.Dict[int, int] = {}
+        self._by_length: tp.List[tp.Tuple[int, int, int]] = []
+        self._by_index: tp.List[int] = []
+        pending = [
+            j_idx
+            for j_idx, job in enumerate(self._jobs)
+            if job.status == Status.Pending
+        ]
+        for j_idx in sorted(pending, key=lambda idx: self._jobs[idx].arrival_time):
+            self.push(j_idx)
+
+    def __len__(self) -> int:
+        return len(self._fifo)
+
+    def __contains__(self, j_idx: int) -> bool:
+        return j_idx in self._fifo
+
+    def push(self, j_idx: int) -> None:
+        if j_idx in self._fifo:
+            return
+        generation = next(self._generation)
+        self._fifo[j_idx] = generation
+        heapq.heappush(self._by_length, (self._jobs[j_idx].length, j_idx, generation))
+        bisect.insort(self._by_index, j_idx)
+
+    def discard(self, j_idx: int) -> None:
+        if self._fifo.pop(j_idx, None) is None:
+            return
+        del self._by_index[bisect.bisect_left(self._by_index, j_idx)]
+        # Heap entries are removed lazily, compact once they are mostly stale
+        if len(self._by_length) > 2 * len(self._fifo) + 16:
+            self._by_length = [
+                entry for entry in self._by_length if self._is_fresh(entry)
+            ]
+            heapq.heapify(self._by_length)
+
+    def by_arrival(self) -> tp.Iterator[int]:
+        return self._pending(iter(self._fifo))
+
+    def by_index(self) -> tp.List[int]:
+        return list(self._pending(iter(self._by_index)))
+
+    def by_length(self) -> tp.Iterator[int]:
+        """Shortest first, walking the heap without popping it: O(log n) per job."""
+        return self._pending(self._walk_heap())
+
+    def from_cursor(self, cursor: int) -> tp.Iterator[int]:
+        """Every pending job once, starting with the first index above `cursor`."""
+        ordered = self._by_index
+        start = bisect.bisect_right(ordered, cursor)
+        n_pending = len(ordered)
+        return self._pending(
+            ordered[(start + offset) % n_pending] for offset in range(n_pending)
+        )
+
+    def _walk_heap(self) -> tp.Iterator[int]:
+        heap = self._by_length
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            entry, position = heapq.heappop(frontier)
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+            if self._is_fresh(entry):
+                yield entry[1]
+
+    def _is_fresh(self, entry: tp.Tuple[int, int, int]) -> bool:
+        _, j_idx, generation = entry
+        return self._fifo.get(j_idx) == generation
+
+    def _pending(self, j_indices: tp.Iterator[int]) -> tp.Iterator[int]:
+        # Jobs that left `Pending` behind our back are discarded once iteration stops
+        stale = []
+        try:
+            for j_idx in j_indices:
+                if self._jobs[j_idx].status == Status.Pending:
+                    yield j_idx
+                else:
+                    stale.append(j_idx)
+        finally:
+            for j_idx in stale:
+                self.discard(j_idx)
+
+
+class RunningJobsIndex:
+    """
+    Running jobs mapped to their machine and machines to their running jobs, both
+    kept in sync in O(1) on every start, stop and completion.
+    """
+
+    def __init__(self) -> None:
+        self._job_to_machine: tp.Dict[int, int] = {}
+        self._machine_to_jobs: tp.Dict[int, tp.Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._job_to_machine)
+
+    def __contains__(self, j_idx: int) -> bool:
+        return j_idx in self._job_to_machine
+
+    def __iter__(self) -> tp.Iterator[tp.Tuple[int, int]]:
+        """(job, machine) pairs, in start order."""
+        return iter(list(self._job_to_machine.items()))
+
+    def add(self, j_idx: int, m_idx: int) -> None:
+        self.remove(j_idx)
+        self._job_to_machine[j_idx] = m_idx
+        self._machine_to_jobs.setdefault(m_idx, set()).add(j_idx)
+
+    def remove(self, j_idx: int) -> tp.Optional[int]:
+        m_idx = self._job_to_machine.pop(j_idx, None)
+        if m_idx is not None:
+            jobs = self._machine_to_jobs[m_idx]
+            jobs.discard(j_idx)
+            if not jobs:
+                del self._machine_to_jobs[m_idx]
+        return m_idx
+
+    def machine_of(self, j_idx: int) -> tp.Optional[int]:
+        return self._job_to_machine.get(j_idx)
+
+    def jobs_on(self, m_idx: int) -> tp.FrozenSet[int]:
+        return frozenset(self._machine_to_jobs.get(m_idx, ()))
+
+    def load(self, n_machines: int) -> npt.NDArray[np.int64]:
+        """Number of running jobs on each machine."""
+        load = np.zeros(n_machines, dtype=np.int64)
+        for m_idx, jobs in self._machine_to_jobs.items():
+            load[m_idx] = len(jobs)
+        return load
+
+    def clear(self) -> None:
+        self._job_to_machine.clear()
+        self._machine_to_jobs.clear()
+
+
 @tp.runtime_checkable
 class JobCollection(tp.Protocol[T]):
     @abc.abstractmethod
@@ -44,11 +196,25 @@ class JobCollection(tp.Protocol[T]):
     @abc.abstractmethod
     def __iter__(self) -> tp.Iterable[Job[T]]: ...
 
+    def usage_tensor(self) -> npt.NDArray:
+        """Every job usage stacked along a leading jobs axis."""
+        return np.stack([np.asarray(job.usage) for job in self])
+
+    @property
+    def pending_index(self) -> PendingJobsIndex:
+        index = getattr(self, "_pending_index", None)
+        if index is None:
+            index = self._pending_index = PendingJobsIndex(self)
+        return index
+
     def execute_clock_tick(self, current_time: int) -> None:
-        for job in self:
+        index = getattr(self, "_pending_index", None)
+        for j_idx, job in enumerate(self):
             match job.status:
                 case Status.NotCreated if job.arrival_time == current_time:
                     job.status = Status.Pending
+                    if index is not None:
+                        index.push(j_idx)
                 case Status.Running if job.tick_left == 0:
                     job.status = Status.Completed
                 case Status.Running:
@@ -1,6 +1,10 @@
 import abc
+import heapq
 import typing as tp
 
+import numpy as np
+import numpy.typing as npt
+
 T = tp.TypeVar("T")
 MachinesCollectionArgs = tp.TypeVar("MachinesCollectionArgs", bound=tuple)
 
@@ -24,6 +28,141 @@ class MachineCollection(tp.Protocol[T]):
     @abc.abstractmethod
     def execute_clock_tick(self) -> None: ...
 
+    def free_space_tensor(self) -> npt.NDArray:
+        """Every machine free space stacked along a leading machines axis."""
+        return np.stack(
+            [np.asarray(self[m_idx].free_space) for m_idx in range(len(self))]
+        )
+
+    @property
+    def capacity_index(self) -> "MachineCapacityIndex":
+        index = getattr(self, "_capacity_index", None)
+        if index is None:
+            index = self._capacity_index = MachineCapacityIndex(self)
+        return index
+
+    def notify_allocation(self, m_idx: int) -> None:
+        index = getattr(self, "_capacity_index", None)
+        if index is not None:
+            index.update(m_idx)
+
+    def invalidate_capacity_index(self) -> None:
+        self._capacity_index = None
+
+
+class CapacitySummary(tp.NamedTuple):
+    """Stands for a group of machines, any job fitting one of them fits it too."""
+
+    free_space: tp.Any
+
+
+class MachineCapacityIndex:
+    """
+    Segment tree over the machines free space. Every node keeps the elementwise max
+    of its machines free space and their minimal total free capacity.
+    Queries only descend into nodes whose summary passes `can_run_func`, which must
+    accept a `CapacitySummary` and never reject more free space, so a query costs
+    O(log n) checks while few subtrees pass the bound.
+    Allocations are pushed with `update`, other changes (tick, reset) rebuild it.
+    """
+
+    def __init__(self, machines: MachineCollection) -> None:
+        self._machines = machines
+        self._n_machines = len(machines)
+        self._size = 1 << max(self._n_machines - 1, 0).bit_length()
+        free_space = [
+            np.asarray(machines[m_idx].free_space) for m_idx in range(self._n_machines)
+        ]
+        leaves = np.stack([self._leaf(free) for free in free_space])
+        self._free = np.full(
+            (2 * self._size, *leaves.shape[1:]),
+            self._lowest(leaves.dtype),
+            dtype=leaves.dtype,
+        )
+        self._total = np.full(2 * self._size, np.inf)
+        self._free[self._size : self._size + self._n_machines] = leaves
+        self._total[self._size : self._size + self._n_machines] = [
+            np.sum(free) for free in free_space
+        ]
+        n_nodes = self._size
+        while n_nodes > 1:
+            parents = np.arange(n_nodes // 2, n_nodes)
+            self._free[parents] = np.maximum(
+                self._free[2 * parents], self._free[2 * parents + 1]
+            )
+            self._total[parents] = np.minimum(
+                self._total[2 * parents], self._total[2 * parents + 1]
+            )
+            n_nodes //= 2
+
+    def update(self, m_idx: int) -> None:
+        free_space = np.asarray(self._machines[m_idx].free_space)
+        node = self._size + m_idx
+        self._free[node] = self._leaf(free_space)
+        self._total[node] = np.sum(free_space)
+        node //= 2
+        while node > 0:
+            self._free[node] = np.maximum(
+                self._free[2 * node], self._free[2 * node + 1]
+            )
+            self._total[node] = min(self._total[2 * node], self._total[2 * node + 1])
+            node //= 2
+
+    def first_fit(
+        self, job: tp.Any, can_run_func: tp.Callable[[Machine, tp.Any], bool]
+    ) -> tp.Optional[int]:
+        """Lowest index machine that can run the job."""
+        stack = [1] if self._n_machines else []
+        while stack:
+            node = stack.pop()
+            if node >= self._size:
+                if self._fits_machine(node, job, can_run_func):
+                    return node - self._size
+            elif can_run_func(CapacitySummary(self._free[node]), job):
+                stack.extend((2 * node + 1, 2 * node))
+        return None
+
+    def best_fit(
+        self, job: tp.Any, can_run_func: tp.Callable[[Machine, tp.Any], bool]
+    ) -> tp.Optional[int]:
+        """Machine with the least total free capacity that can run the job."""
+        # Best first on the subtree minimal total: the first fitting leaf is optimal
+        heap = [(self._total[1], 1)] if self._n_machines else []
+        while heap:
+            _, node = heapq.heappop(heap)
+            if node >= self._size:
+                if self._fits_machine(node, job, can_run_func):
+                    return node - self._size
+            elif can_run_func(CapacitySummary(self._free[node]), job):
+                for child in (2 * node, 2 * node + 1):
+                    heapq.heappush(heap, (self._total[child], child))
+        return None
+
+    def _fits_machine(
+        self, node: int, job: tp.Any, can_run_func: tp.Callable[[Machine, tp.Any], bool]
+    ) -> bool:
+        m_idx = node - self._size
+        return m_idx < self._n_machines and bool(
+            can_run_func(self._machines[m_idx], job)
+        )
+
+    @classmethod
+    def _leaf(cls, free_space: npt.NDArray) -> npt.NDArray:
+        # Infinite free space marks a placeholder machine, it must not bound a subtree
+        if np.issubdtype(free_space.dtype, np.floating) and np.any(
+            np.isposinf(free_space)
+        ):
+            return np.full_like(free_space, cls._lowest(free_space.dtype))
+        return free_space
+
+    @staticmethod
+    def _lowest(dtype: np.dtype) -> tp.Any:
+        if np.issubdtype(dtype, np.floating):
+            return -np.inf
+        if np.issubdtype(dtype, np.integer):
+            return np.iinfo(dtype).min
+        return False
+
 
 @tp.runtime_checkable
 class MachinesCollectionConvertor(tp.Protocol[T, MachinesCollectionArgs]):
@@ -1,8 +1,14 @@
+import itertools
 import gymnasium as gym
 import typing as tp
 import numpy as np
 
-from src.envs.cluster_simulator.actions import EnvironmentAction, ActionConvertor
+from src.envs.cluster_simulator.actions import (
+    EnvironmentAction,
+    BatchEnvironmentAction,
+    ActionConvertor,
+    DiscreteActionConvertor,
+)
 from src.envs.cluster_simulator.base.extractors.reward import RewardCaculator
 from src.envs.cluster_simulator.base.extractors.information import (
     ClusterInformation,
@@ -12,7 +18,7 @@ from src.envs.cluster_simulator.base.extractors.observation import (
     ClusterObservation,
     BaseObservationCreatorProtocol,
 )
-from src.envs.cluster_simulator.base.internal.cluster import ClusterABC
+from src.envs.cluster_simulator.base.internal.cluster import ClusterABC, ClusterAction
 
 InputActType = np.int64
 T = tp.TypeVar("T", bound=type)
@@ -31,13 +37,25 @@ class BasicClusterEnv(
             ClusterObservation, ClusterInformation
         ],
         obs_extractor: BaseObservationCreatorProtocol[Cluster, ClusterObservation],
+        *,
+        discrete_actions: bool = False,
     ):
+        """
+        With `discrete_actions` the action space is a flat `Discrete` (see
+        `DiscreteActionConvertor`); tuple actions are accepted either way.
+        """
         self._cluster = cluster
         self._reward_caculator = reward_caculator
         self._info_builder = info_builder
+        self._info_builder.attach(self._cluster)
         self._obs_creator = obs_extractor
         self.observation_space = self._obs_creator.create_space(self._cluster)
-        self.action_space = ActionConvertor.create_space(self._cluster)
+        self._discrete_convertor = DiscreteActionConvertor.from_cluster(self._cluster)
+        self.action_space = (
+            self._discrete_convertor.create_space()
+            if discrete_actions
+            else ActionConvertor.create_space(self._cluster)
+        )
         self._seed = None
 
     def reset(
@@ -57,14 +75,11 @@ class BasicClusterEnv(
         return observation, info
 
     def step(
-        self, action: EnvironmentAction
+        self, action: EnvironmentAction | BatchEnvironmentAction | int
     ) -> tuple[ClusterObservation, tp.SupportsFloat, bool, bool, ClusterInformation]:
-        if isinstance(action, tuple) and not isinstance(action, EnvironmentAction):
-            action = EnvironmentAction(*action)
-        assert isinstance(action, EnvironmentAction)
         prev_observation = self._obs_creator.create(self._cluster)
         prev_info = self._info_builder(prev_observation)
-        cluster_action = ActionConvertor.convert(action)
+        cluster_action = self.convert_action(action)
         self._cluster.execute(cluster_action)
         observation = self._obs_creator.create(self._cluster)
         info = self._info_builder(observation)
@@ -72,3 +87,37 @@ class BasicClusterEnv(
         reward = self._reward_caculator(prev_info, info)
         truncated = self._cluster.are_all_jobs_executed()
         return observation, reward, terminated, truncated, info
+
+    def replay(
+        self,
+        seed: int | None,
+        actions: tp.Iterable[EnvironmentAction | BatchEnvironmentAction | int],
+        *,
+        until: int | None = None,
+    ) -> tuple[ClusterObservation, ClusterInformation]:
+        """
+        Resets with `seed` and executes the first `until` logged actions (all of them
+        by default) straight on the cluster, without building observations or
+        rewards, then returns the observation and information reached.
+        """
+        if seed is not None:
+            self._seed = seed
+        super().reset(seed=self._seed)
+        self._cluster.reset(self._seed)
+        for action in itertools.islice(actions, until):
+            self._cluster.execute(self.convert_action(action))
+
+        observation = self._obs_creator.create(self._cluster)
+        return observation, self._info_builder(observation)
+
+    def convert_action(
+        self, action: EnvironmentAction | BatchEnvironmentAction | int
+    ) -> ClusterAction:
+        if isinstance(action, (int, np.integer)):
+            return self._discrete_convertor.convert(int(action))
+        if isinstance(action, BatchEnvironmentAction):
+            return ActionConvertor.convert(action)
+        if isinstance(action, tuple) and not isinstance(action, EnvironmentAction):
+            action = EnvironmentAction(*action)
+        assert isinstance(action, EnvironmentAction)
+        return ActionConvertor.convert(action)
@@ -1,6 +1,7 @@
 import typing as tp
 
 import numpy as np
+import numpy.typing as npt
 
 from src.envs.cluster_simulator.base.internal.job import Status
 
@@ -22,6 +23,10 @@ from src.envs.cluster_simulator.deep_rm.internal.machines import (
 )
 
 from src.envs.cluster_simulator.base.internal.cluster import ClusterABC
+from src.envs.cluster_simulator.utils.array_operations import (
+    remaining_profile_slices,
+    timeline_windows,
+)
 
 
 class DeepRMCluster(ClusterABC[DeepRMMachines, DeepRMJobs]):
@@ -54,6 +59,50 @@ class DeepRMCluster(ClusterABC[DeepRMMachines, DeepRMJobs]):
     def allocation(self, machine: DeepRMMachine, job: DeepRMJobSlot) -> None:
         machine.free_space &= ~job.usage
 
+    def feasibility_matrix(
+        self, machines: DeepRMMachines, jobs: DeepRMJobs
+    ) -> npt.NDArray[np.bool_]:
+        free_space = machines._machines_usage
+        usage = jobs._job_slots
+        return np.all(free_space[:, None] | ~usage[None], axis=(2, 3, 4))
+
+    def placement_options(self, job: DeepRMJobSlot) -> npt.NDArray[np.bool_]:
+        return self.placement_tensor(job.usage[None], [job.length])[:, 0]
+
+    def placement_tensor(
+        self, usage: npt.NDArray[np.bool_], lengths: npt.ArrayLike
+    ) -> npt.NDArray[np.bool_]:
+        """
+        [n_machines, n_jobs, n_ticks] mask of the offsets at which every job usage
+        ([n_jobs, n_resources, n_resource_unit, n_ticks]) fits every machine.
+        A placement fits when no occupied cell of the shifted machine timeline is
+        used by the job, so the conflicts of all machines, offsets and jobs are
+        counted by a single matrix product.
+        """
+        occupied = ~self._machines._machines_usage
+        n_machines, n_ticks = occupied.shape[0], occupied.shape[-1]
+        windows = timeline_windows(occupied, False)[..., :n_ticks, :]
+        windows = np.moveaxis(windows, -2, 1).reshape(n_machines, n_ticks, -1)
+        usage = usage.reshape(usage.shape[0], -1)
+        conflicts = windows.astype(np.float32) @ usage.T.astype(np.float32)
+        options = np.swapaxes(conflicts == 0, 1, 2)
+        # The whole profile has to start within the horizon to be recorded
+        last_offset = n_ticks - np.maximum(np.asarray(lengths), 1)
+        options &= np.arange(n_ticks)[None, :] <= last_offset[:, None]
+        return options
+
+    def allocation_at(
+        self, machine: DeepRMMachine, job: DeepRMJobSlot, offset: int
+    ) -> None:
+        n_ticks = machine.free_space.shape[-1]
+        machine.free_space[..., offset:] &= ~job.usage[..., : n_ticks - offset]
+
+    def release(self, machine: DeepRMMachine, job: DeepRMJobSlot, elapsed: int) -> None:
+        on_machine, remaining = remaining_profile_slices(
+            machine.free_space.shape[-1], elapsed
+        )
+        machine.free_space[..., on_machine] |= job.usage[..., remaining]
+
 
 class DeepRMCreators:
     @staticmethod
@@ -32,7 +32,7 @@ class DeepRMJobSlot(Job[_JOB_TYPE]):
 
     @classmethod
     def _calculate_job_length(cls, job: _JOB_TYPE) -> int:
-        active = np.any(job > 0, axis=1)
+        active = np.any(job > 0, axis=(0, 1))  # ticks in which any resource is used
         idx = np.where(active)[0]
         return int(idx[-1] - idx[0] + 1) if idx.size > 0 else 0
 
@@ -69,6 +69,9 @@ class DeepRMJobs(JobCollection[npt.NDArray[_JOB_TYPE]]):
     def __iter__(self) -> tp.Iterable[DeepRMJobSlot]:
         return iter(self._jobs)
 
+    def usage_tensor(self) -> _JOBS_TYPE:
+        return self._job_slots
+
 
 class DeepRMJobsConvertor(JobCollectionConvertor[_JOB_TYPE, DeepRMJobsArgs]):
     def to_representation(self, value: DeepRMJobs) -> DeepRMJobsArgs:
@@ -41,6 +41,9 @@ class DeepRMMachines(MachineCollection[npt.NDArray[_MACHINE_TYPE]]):
     def __getitem__(self, item: int) -> DeepRMMachine:
         return self._machines[item]
 
+    def free_space_tensor(self) -> _MACHINES_TYPE:
+        return self._machines_usage
+
     def clean_and_reset(self, seed: tp.Optional[int]) -> None:
         self._machines_usage[:] = True
 
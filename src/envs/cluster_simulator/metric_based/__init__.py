@@ -1,6 +1,7 @@
 import typing as tp
 
 import numpy as np
+import numpy.typing as npt
 
 from src.envs.cluster_simulator.base.internal.job import Status
 from src.envs.cluster_simulator.metric_based.internal.custom_type import (
@@ -20,6 +21,12 @@ from src.envs.cluster_simulator.metric_based.internal.machines import (
 )
 
 from src.envs.cluster_simulator.base.internal.cluster import ClusterABC
+from src.envs.cluster_simulator.utils.array_operations import (
+    cell_capacity,
+    remaining_profile_slices,
+    timeline_windows,
+    to_fixed_point,
+)
 
 
 class MetricCluster(ClusterABC[MetricMachines, MetricJobs]):
@@ -54,16 +61,95 @@ class MetricCluster(ClusterABC[MetricMachines, MetricJobs]):
     def allocation(self, machine: MetricMachine, job: MetricJobSlot) -> None:
         machine.free_space -= job.usage
 
+    def placement_options(self, job: MetricJobSlot) -> npt.NDArray[np.bool_]:
+        free_space = self._machines._machines_usage
+        n_ticks = free_space.shape[-1]
+        windows = timeline_windows(free_space, self._machines.capacity)
+        options = np.all(windows > job.usage[None, :, None, :], axis=(1, 3))
+        # The whole profile has to start within the horizon to be recorded
+        options = options[:, :n_ticks]
+        options[:, n_ticks - max(job.length, 1) + 1 :] = False
+        is_real_machine = np.max(free_space, axis=(1, 2)) != np.inf
+        return options & is_real_machine[:, None]
+
+    def allocation_at(
+        self, machine: MetricMachine, job: MetricJobSlot, offset: int
+    ) -> None:
+        n_ticks = machine.free_space.shape[-1]
+        machine.free_space[:, offset:] -= job.usage[:, : n_ticks - offset]
+
+    def release(self, machine: MetricMachine, job: MetricJobSlot, elapsed: int) -> None:
+        on_machine, remaining = remaining_profile_slices(
+            machine.free_space.shape[-1], elapsed
+        )
+        machine.free_space[:, on_machine] += job.usage[:, remaining]
+
+    def feasibility_matrix(
+        self, machines: MetricMachines, jobs: MetricJobs
+    ) -> npt.NDArray[np.bool_]:
+        free_space = machines._machines_usage
+        usage = jobs._job_slots
+        is_real_machine = np.max(free_space, axis=(1, 2)) != np.inf
+        fits = np.all(free_space[:, None] > usage[None], axis=(2, 3))
+        return fits & is_real_machine[:, None]
+
+    def schedule_batch(
+        self, m_indices: npt.ArrayLike, j_indices: npt.ArrayLike
+    ) -> npt.NDArray[np.bool_]:
+        m_indices = np.asarray(m_indices, dtype=np.intp)
+        j_indices = np.asarray(j_indices, dtype=np.intp)
+        free_space = self._machines._machines_usage
+        scheduled = np.zeros(len(j_indices), dtype=np.bool_)
+
+        is_pending = np.array(
+            [self._jobs[j_idx].status == Status.Pending for j_idx in j_indices],
+            dtype=np.bool_,
+        ).reshape(-1)
+        is_first = np.zeros_like(is_pending)
+        is_first[np.unique(j_indices, return_index=True)[1]] = True
+        is_real_machine = np.max(free_space, axis=(1, 2)) != np.inf
+        candidates = np.flatnonzero(is_pending & is_first & is_real_machine[m_indices])
+        if candidates.size == 0:
+            return scheduled
+        # Group the candidates by machine, keeping the pairs order inside a group
+        candidates = candidates[np.argsort(m_indices[candidates], kind="stable")]
+        machines = m_indices[candidates]
+        usage = self._jobs._job_slots[j_indices[candidates]]
+
+        is_group_start = np.r_[True, machines[1:] != machines[:-1]]
+        group = np.cumsum(is_group_start) - 1
+        total_usage = np.cumsum(usage, axis=0)
+        usage_before_group = (total_usage - usage)[is_group_start]
+        group_usage = total_usage - usage_before_group[group]
+        fits = np.all(free_space[machines] > group_usage, axis=(1, 2))
+        failures = np.cumsum(~fits)
+        failures_before_group = (failures - ~fits)[is_group_start]
+        admitted = failures - failures_before_group[group] == 0
+
+        np.subtract.at(free_space, machines[admitted], usage[admitted])
+        for m_idx in np.unique(machines[admitted]):
+            self._machines.notify_allocation(int(m_idx))
+        for pair_idx in candidates[admitted]:
+            self._start_job(int(m_indices[pair_idx]), int(j_indices[pair_idx]))
+        scheduled[candidates[admitted]] = True
+        self.logger.info(
+            "Batch scheduled %d out of %d pairs", scheduled.sum(), len(scheduled)
+        )
+        return scheduled
+
 
 class MetricClusterCreator:
     @staticmethod
     def generate_homogeneous_machines(
-        n_machines: int, n_resources: int, n_ticks: int
+        n_machines: int,
+        n_resources: int,
+        n_ticks: int,
+        dtype: npt.DTypeLike = np.float64,
     ) -> tp.Callable[[tp.Optional[tp.SupportsFloat]], MetricMachines]:
         def inner(seed: tp.Optional[tp.SupportsFloat]) -> MetricMachines:
             np.random.seed(seed)
-            machine_usage = np.ones(
-                (n_machines, n_resources, n_ticks), dtype=np.float64
+            machine_usage = np.full(
+                (n_machines, n_resources, n_ticks), cell_capacity(dtype), dtype=dtype
             )
             return MetricMachines(machine_usage)
 
@@ -76,6 +162,7 @@ class MetricClusterCreator:
         n_ticks: int,
         poisson_lambda: float = 5.0,
         offline: bool = True,
+        dtype: npt.DTypeLike = np.float64,
     ) -> tp.Callable[[tp.Optional[tp.SupportsFloat]], MetricJobs]:
         def inner(seed: tp.Optional[tp.SupportsFloat]) -> MetricJobs:
             np.random.seed(seed)
@@ -131,7 +218,10 @@ class MetricClusterCreator:
                 ],
                 dtype=Status,
             )
-            return MetricJobs(jobs_slot, jobs_status, job_arrivals_tick)
+            # Drawn in float64 so every dtype sees the same workload, then rounded
+            return MetricJobs(
+                to_fixed_point(jobs_slot, dtype), jobs_status, job_arrivals_tick
+            )
 
         return inner
 
@@ -145,11 +235,12 @@ class MetricClusterCreator:
         is_offline: bool = True,
         poisson_lambda: float = 6.0,
         seed: tp.Optional[tp.SupportsFloat] = None,
+        dtype: npt.DTypeLike = np.float64,
     ) -> MetricCluster:
         return MetricCluster(
             cls.generate_workload(
-                n_jobs, n_resources, n_ticks, poisson_lambda, is_offline
+                n_jobs, n_resources, n_ticks, poisson_lambda, is_offline, dtype
             ),
-            cls.generate_homogeneous_machines(n_machines, n_resources, n_ticks),
+            cls.generate_homogeneous_machines(n_machines, n_resources, n_ticks, dtype),
             seed=seed,
         )
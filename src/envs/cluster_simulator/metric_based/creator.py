@@ -5,8 +5,10 @@ from src.envs.cluster_simulator.base.extractors.information import (
 )
 from src.envs.cluster_simulator.base.extractors.reward import RewardCaculator
 from src.envs.cluster_simulator.basic import BasicClusterEnv
+import numpy as np
+import numpy.typing as npt
 from typing import TypedDict, Optional
-from typing_extensions import Unpack
+from typing_extensions import NotRequired, Unpack
 
 from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
 from src.envs.cluster_simulator.metric_based.observation import (
@@ -25,12 +27,14 @@ class MetricBasedCreatorParameters(TypedDict):
     offline: bool
     reward_caculator: RewardCaculator
     seed: Optional[int]
+    dtype: NotRequired[npt.DTypeLike]  # float64 when missing, uint8 / uint16 quanta
 
 
 class MetricBasedEnvCreator(EnvCreator):
     def __call__(
         self, **kwargs: Unpack[MetricBasedCreatorParameters]
     ) -> BasicClusterEnv:
+        dtype = kwargs.get("dtype", np.float64)
         cluster = MetricCluster(
             workload_creator=MetricClusterCreator.generate_workload(
                 kwargs["n_jobs"],
@@ -38,9 +42,13 @@ class MetricBasedEnvCreator(EnvCreator):
                 kwargs["n_ticks"],
                 kwargs["poisson_lambda"],
                 offline=kwargs["offline"],
+                dtype=dtype,
             ),
             machine_creator=MetricClusterCreator.generate_homogeneous_machines(
-                kwargs["n_machines"], kwargs["n_resources"], kwargs["n_ticks"]
+                kwargs["n_machines"],
+                kwargs["n_resources"],
+                kwargs["n_ticks"],
+                dtype=dtype,
             ),
             seed=kwargs["seed"],
         )
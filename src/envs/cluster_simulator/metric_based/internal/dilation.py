@@ -6,6 +6,12 @@ from src.envs.cluster_simulator.base.internal.dilation import (
     AbstractDilation,
     SelectCellAction,
 )
+from src.envs.cluster_simulator.metric_based.internal.layout import (
+    MachineGridLayout,
+    Permutation,
+    RowMajorLayout,
+    near_square_grid_shape,
+)
 from src.envs.cluster_simulator.utils.array_operations import (
     hierarchical_pooling,
     get_window_from_cell,
@@ -19,7 +25,7 @@ Action = tp.Tuple[int, int]
 class MetricBasedDilator(AbstractDilation[State]):
     def get_window_from_cell(self, cell: SelectCellAction, level: int) -> State:
         return get_window_from_cell(
-            self._dilation_levels, level=1, cell=cell, kernel=self._kernel
+            self._dilation_levels, level=level, cell=cell, kernel=self._kernel
         )
 
     def generate_dilation_levels(self, original: State) -> tp.List[State]:
@@ -32,29 +38,67 @@ class MetricBasedDilator(AbstractDilation[State]):
 
     @classmethod
     def cast_into_dilation_format(
-        cls, array: State, *, fill_value: float = 0.0
+        cls,
+        array: State,
+        *,
+        fill_value: float = 0.0,
+        layout: tp.Optional[MachineGridLayout] = None,
+    ) -> State:
+        if layout is None:
+            reorganize_shape = cls._reorganize_array_shape(array)
+            permutation = None
+        else:
+            reorganize_shape = layout.grid_shape(array.shape[0])
+            permutation = layout.permutation(array)
+        return cls._arrange_on_grid(array, reorganize_shape, permutation, fill_value)
+
+    @classmethod
+    def from_machines(
+        cls,
+        machines: State,
+        *,
+        layout: tp.Optional[MachineGridLayout] = None,
+        **params: tp.Any,
+    ) -> "MetricBasedDilator":
+        layout = RowMajorLayout() if layout is None else layout
+        permutation = layout.permutation(machines)
+        array = cls._arrange_on_grid(
+            machines, layout.grid_shape(machines.shape[0]), permutation
+        )
+        return cls(
+            **params,
+            array=array,
+            machine_permutation=permutation,
+            n_machines=machines.shape[0],
+        )
+
+    @staticmethod
+    def _arrange_on_grid(
+        array: State,
+        grid_shape: tp.Tuple[int, int],
+        permutation: tp.Optional[Permutation],
+        fill_value: float = 0.0,
     ) -> State:
         n_machines, n_resources, n_ticks = array.shape
-        reorganize_shape = cls._reorganize_array_shape(array)
-        grid_size = reorganize_shape[0] * reorganize_shape[1]
+        grid_size = grid_shape[0] * grid_shape[1]
 
         if grid_size > n_machines:
             pad = grid_size - n_machines
             padding = ((0, pad), (0, 0), (0, 0))
             array = np.pad(array, padding, mode="constant", constant_values=fill_value)
 
+        if permutation is not None:
+            array = array[permutation]
+
         return array.reshape(
-            *reorganize_shape,
+            *grid_shape,
             n_resources,
             n_ticks,
         )
 
     @staticmethod
     def _reorganize_array_shape(array: State) -> tp.Tuple[int, int]:
-        n_machines = array.shape[0]
-        window_x = int(np.ceil(np.sqrt(n_machines)))
-        window_y = int(np.ceil(n_machines / window_x))
-        return window_x, window_y
+        return near_square_grid_shape(array.shape[0])
 
     def __init__(
         self,
@@ -63,17 +107,58 @@ class MetricBasedDilator(AbstractDilation[State]):
         *,
         operation: tp.Callable,
         fill_value: float = 0.0,
+        machine_permutation: tp.Optional[Permutation] = None,
+        n_machines: tp.Optional[int] = None,
     ) -> None:
         self._fill_value = fill_value
         self._operation = operation
         self._original_grid_shape: tp.Tuple[int, int] = array.shape[:2]  # type: ignore
+        self._machine_permutation = machine_permutation
         super().__init__(kernel, array)
+        self._occupancy_levels = hierarchical_pooling(
+            self._grid_occupancy(n_machines)[:, :, None, None],
+            self._kernel,
+            fill_value=False,
+            operation=np.any,
+        )
+
+    def _grid_occupancy(self, n_machines: tp.Optional[int]) -> npt.NDArray[np.bool_]:
+        if n_machines is None:
+            return np.ones(self._original_grid_shape, dtype=np.bool_)
+        if self._machine_permutation is None:
+            machine_idx = np.arange(np.prod(self._original_grid_shape))
+        else:
+            machine_idx = self._machine_permutation
+        return (machine_idx < n_machines).reshape(self._original_grid_shape)
+
+    def get_window_mask(self) -> npt.NDArray[np.bool_]:
+        return self._current_window(self._occupancy_levels)[..., 0, 0]
+
+    def set_feasibility(self, feasibility: npt.NDArray[np.bool_]) -> None:
+        grid_feasibility = self._arrange_on_grid(
+            feasibility[:, :, None],
+            self._original_grid_shape,
+            self._machine_permutation,
+            fill_value=False,
+        )
+        self._feasibility_levels = hierarchical_pooling(
+            grid_feasibility, self._kernel, fill_value=False, operation=np.any
+        )
 
     def get_selected_machine(self, action: SelectCellAction) -> int:
         un_dilated_action = self.get_selected_initialize_cell(action)
-        return self._calculate_original_machine_index(
+        rows, cols = self._original_grid_shape
+
+        if un_dilated_action[0] >= rows or un_dilated_action[1] >= cols:
+            # Cell added by the hierarchy padding, no machine is behind it
+            return rows * cols
+
+        m_idx = self._calculate_original_machine_index(
             un_dilated_action, self._original_grid_shape
         )
+        if self._machine_permutation is None:
+            return m_idx
+        return int(self._machine_permutation[m_idx])
 
     @staticmethod
     def _calculate_original_machine_index(
@@ -24,11 +24,11 @@ class MetricJobSlot(Job[_JOB_TYPE]):
         self.status = status
         self.arrival_time = arrival_time
         self.length = self._calculate_job_length(self._usage)
-        self.run_time = self.length
+        self.run_time = 0
 
     @classmethod
     def _calculate_job_length(cls, job: _JOB_TYPE) -> int:
-        active = np.any(job > 0, axis=1)
+        active = np.any(job > 0, axis=0)  # ticks in which any resource is used
         idx = np.where(active)[0]
         return int(idx[-1] - idx[0] + 1) if idx.size > 0 else 0
 
@@ -70,6 +70,9 @@ class MetricJobs(JobCollection[npt.NDArray[_JOB_TYPE]]):
     def __iter__(self) -> tp.Iterable[MetricJobSlot]:
         return iter(self._jobs)
 
+    def usage_tensor(self) -> _JOBS_TYPE:
+        return self._job_slots
+
 
 class MetricJobsConvertor(JobCollectionConvertor[_JOB_TYPE, MetricJobsArgs]):
     def to_representation(self, value: MetricJobs) -> MetricJobsArgs:
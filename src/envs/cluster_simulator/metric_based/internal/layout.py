@@ -0,0 +1,139 @@
+import abc
+import functools
+import typing as tp
+
+import numpy as np
+import numpy.typing as npt
+
+GridShape = tp.Tuple[int, int]
+Permutation = npt.NDArray[np.intp]
+
+
+def near_square_grid_shape(n_machines: int) -> GridShape:
+    window_x = int(np.ceil(np.sqrt(n_machines)))
+    window_y = int(np.ceil(n_machines / window_x))
+    return window_x, window_y
+
+
+def hilbert_distance(
+    x: npt.NDArray[np.integer], y: npt.NDArray[np.integer], side: int
+) -> npt.NDArray[np.int64]:
+    """
+    Distance along the Hilbert curve filling a `side` x `side` square (side is a
+    power of two) of every (x, y) cell, vectorized over the cells.
+    """
+    x = np.array(x, dtype=np.int64)
+    y = np.array(y, dtype=np.int64)
+    distance = np.zeros_like(x)
+    s = side // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        distance += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant so the sub-curve keeps the canonical orientation
+        flip = ~ry & rx
+        x = np.where(flip, side - 1 - x, x)
+        y = np.where(flip, side - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s //= 2
+    return distance
+
+
+class MachineGridLayout(abc.ABC):
+    """
+    Decides which grid cell every machine occupies before the dilator pools the
+    grid. A layout is a permutation over the flattened (row-major) grid cells:
+    `permutation[cell] = machine index`, where indices >= n_machines are padding.
+    """
+
+    def __init__(self, grid_shape: tp.Optional[GridShape] = None) -> None:
+        self._grid_shape = grid_shape
+
+    @abc.abstractmethod
+    def machine_order(self, array: npt.NDArray) -> Permutation:
+        """Machines indices in the order they are laid along the grid."""
+
+    def cell_order(self, grid_shape: GridShape) -> Permutation:
+        """Flattened grid cells in the order they are filled."""
+        return np.arange(grid_shape[0] * grid_shape[1])
+
+    def grid_shape(self, n_machines: int) -> GridShape:
+        if self._grid_shape is None:
+            return near_square_grid_shape(n_machines)
+
+        grid_x, grid_y = self._grid_shape
+        if grid_x * grid_y < n_machines:
+            raise ValueError(
+                f"Grid of shape {self._grid_shape} can't hold {n_machines} machines"
+            )
+        return grid_x, grid_y
+
+    def permutation(self, array: npt.NDArray) -> Permutation:
+        n_machines = array.shape[0]
+        grid_shape = self.grid_shape(n_machines)
+        n_cells = grid_shape[0] * grid_shape[1]
+
+        order = np.concatenate(
+            [self.machine_order(array), np.arange(n_machines, n_cells)]
+        )
+        permutation = np.empty(n_cells, dtype=np.intp)
+        permutation[self.cell_order(grid_shape)] = order
+        return permutation
+
+
+class RowMajorLayout(MachineGridLayout):
+    """Machines are laid row after row, in their original order."""
+
+    def machine_order(self, array: npt.NDArray) -> Permutation:
+        return np.arange(array.shape[0])
+
+
+class HilbertCurveLayout(RowMajorLayout):
+    """
+    Machines are laid along a Hilbert curve, so machines with close indices end up
+    in the same pooled block instead of being spread over a row.
+    """
+
+    def cell_order(self, grid_shape: GridShape) -> Permutation:
+        return _hilbert_cell_order(grid_shape)
+
+
+class FreeCapacityLayout(HilbertCurveLayout):
+    """
+    Machines are laid along a Hilbert curve from the most to the least free one, so
+    the first pooled blocks hold the machines with the most available capacity.
+    """
+
+    def machine_order(self, array: npt.NDArray) -> Permutation:
+        free_capacity = array.reshape(array.shape[0], -1).sum(axis=1)
+        return np.argsort(-free_capacity, kind="stable")
+
+
+class TopologyLayout(HilbertCurveLayout):
+    """
+    Machines are grouped by a topology label (e.g. rack id) and laid along a
+    Hilbert curve, so machines sharing a label share pooled blocks.
+    """
+
+    def __init__(
+        self, groups: tp.Sequence[int], grid_shape: tp.Optional[GridShape] = None
+    ) -> None:
+        super().__init__(grid_shape)
+        self._order = np.argsort(np.asarray(groups), kind="stable")
+
+    def machine_order(self, array: npt.NDArray) -> Permutation:
+        if len(self._order) != array.shape[0]:
+            raise ValueError(
+                f"Topology holds {len(self._order)} machines and not {array.shape[0]}"
+            )
+        return self._order
+
+
+@functools.lru_cache(maxsize=32)
+def _hilbert_cell_order(grid_shape: GridShape) -> Permutation:
+    grid_x, grid_y = grid_shape
+    side = 1 << max(int(np.ceil(np.log2(max(grid_x, grid_y, 1)))), 0)
+    xs, ys = np.divmod(np.arange(grid_x * grid_y), grid_y)
+    order = np.argsort(hilbert_distance(xs, ys, side), kind="stable")
+    order.setflags(write=False)
+    return order
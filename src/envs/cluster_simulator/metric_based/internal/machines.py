@@ -12,6 +12,7 @@ from src.envs.cluster_simulator.metric_based.internal.custom_type import (
     _MACHINE_TYPE,
     _MACHINES_TYPE,
 )
+from src.envs.cluster_simulator.utils.array_operations import cell_capacity
 
 MetricsMachinesArgs: TypeAlias = _MACHINES_TYPE
 
@@ -22,6 +23,8 @@ class MetricMachine(Machine[_MACHINE_TYPE]):
 
 
 class MetricMachines(MachineCollection[npt.NDArray[_MACHINE_TYPE]]):
+    CAPACITY = 1.0  # free space of an idle float machine, per resource and tick
+
     def __init__(self, *args: Unpack[MetricsMachinesArgs]) -> None:
         self._machines_usage = args[0]
         assert len(self._machines_usage.shape) == 3, (
@@ -30,6 +33,8 @@ class MetricMachines(MachineCollection[npt.NDArray[_MACHINE_TYPE]]):
         assert self._machines_usage.shape[2] > 1, (
             "Machine should've more than single time slot (a.k.a time tick)."
         )
+        # Integer machines count fixed-point quanta, an idle cell holding all of them
+        self.capacity = cell_capacity(self._machines_usage.dtype)
         self._machines = [
             MetricMachine(self._machines_usage[idx, :])
             for idx in range(self._machines_usage.shape[0])
@@ -41,12 +46,15 @@ class MetricMachines(MachineCollection[npt.NDArray[_MACHINE_TYPE]]):
     def __getitem__(self, item: int) -> Machine[_MACHINE_TYPE]:
         return self._machines[item]
 
+    def free_space_tensor(self) -> _MACHINES_TYPE:
+        return self._machines_usage
+
     def clean_and_reset(self, seed: tp.Optional[int]) -> None:
-        self._machines_usage[:] = 1.0
+        self._machines_usage[:] = self.capacity
 
     def execute_clock_tick(self) -> None:
         self._machines_usage[:, :, :-1] = self._machines_usage[:, :, 1:]
-        self._machines_usage[:, :, -1] = 1.0
+        self._machines_usage[:, :, -1] = self.capacity
 
 
 class MetricMachinesConvertor(
@@ -14,6 +14,7 @@ from src.envs.cluster_simulator.metric_based.internal.jobs import MetricJobsConv
 from src.envs.cluster_simulator.metric_based.internal.machines import (
     MetricMachinesConvertor,
 )
+from src.envs.cluster_simulator.utils.array_operations import cell_capacity
 
 
 class MetricClusterObservation(TypedDict):
@@ -47,14 +48,19 @@ class MetricClusterObservationCreator(
         jobs_usage, job_status, job_arrival_time = (
             self._jobs_convertor.to_representation(cluster._jobs)
         )
+        machines = self._machines_convertor.to_representation(cluster._machines)
+        # The spaces follow the cluster arrays dtype, fixed-point integers included
         machines_space = gym.spaces.Box(
-            low=0.0,
-            high=1.0,
-            shape=self._machines_convertor.to_representation(cluster._machines).shape,
-            dtype=np.float64,
+            low=0,
+            high=cell_capacity(machines.dtype),
+            shape=machines.shape,
+            dtype=machines.dtype,
         )
         jobs_usage_space = gym.spaces.Box(
-            low=0.0, high=1.0, shape=jobs_usage.shape, dtype=np.float64
+            low=0,
+            high=cell_capacity(jobs_usage.dtype),
+            shape=jobs_usage.shape,
+            dtype=jobs_usage.dtype,
         )
         jobs_status_space = gym.spaces.Box(
             low=0.0,
@@ -82,3 +82,8 @@ class SingleSlotCluster(ClusterABC[SingleSlotMachines, SingleSlotJobs]):
 
     def allocation(self, machine: SingleSlotMachine, job: SingleSlotJob) -> None:
         machine.free_space -= job.usage
+
+    def release(
+        self, machine: SingleSlotMachine, job: SingleSlotJob, elapsed: int
+    ) -> None:
+        machine.free_space += job.usage
@@ -82,7 +82,17 @@ def pad_for_hierarchy(
     This ensures that after repeated pooling, the resulting array dimensions
     remain divisible by the kernel at every level.
     """
-    m_x, m_y = array.shape[:2]
+    pad_x, pad_y = _hierarchy_padding(array.shape[:2], kernel)
+    pad_width = ((0, pad_x), (0, pad_y)) + ((0, 0),) * (array.ndim - 2)
+    return np.pad(
+        array, pad_width=pad_width, mode="constant", constant_values=fill_value
+    )
+
+
+def _hierarchy_padding(
+    shape: tp.Tuple[int, int], kernel: tp.Tuple[int, int]
+) -> tp.Tuple[int, int]:
+    m_x, m_y = shape
     k_x, k_y = kernel
 
     if k_x < 1 or k_y < 1:
@@ -107,13 +117,7 @@ def pad_for_hierarchy(
     target_m_x = max(target_m_x, m_x)
     target_m_y = max(target_m_y, m_y)
 
-    pad_x = target_m_x - m_x
-    pad_y = target_m_y - m_y
-
-    pad_width = ((0, pad_x), (0, pad_y)) + ((0, 0),) * (array.ndim - 2)
-    return np.pad(
-        array, pad_width=pad_width, mode="constant", constant_values=fill_value
-    )
+    return target_m_x - m_x, target_m_y - m_y
 
 
 def hierarchical_pooling(
@@ -195,3 +199,152 @@ def global_cell_from_local(
     global_y = py * k_y + cy
 
     return global_x, global_y
+
+
+def batch_pool_2d_first_two_dimensions(
+    arr: npt.NDArray[tp.Any], kernel: tp.Tuple[int, int], operation
+) -> npt.NDArray[tp.Any]:
+    """
+    arr shape: (Batch, WindowX, WindowY, OtherDim, OtherDim)
+    Same as `pool_2d_first_two_dimensions` applied independently on every batch
+    entry, in a single reduction.
+    """
+    if len(arr.shape) != 5:
+        raise ValueError(
+            f"Array shape should have 5 dimension of (Batch, WindowX, WindowY, OtherDim, OtherDim) and not {arr.shape}."
+        )
+    if len(kernel) != 2:
+        raise ValueError(f"Kernel should be of size 2, not {len(kernel)}")
+
+    batch, m_x, m_y, n_resources, n_ticks = arr.shape
+    k_x, k_y = kernel
+
+    if m_x % k_x != 0 or m_y % k_y != 0:
+        raise ValueError(
+            f"The array dimensions {arr.shape[1:3]} are not divisible by the kernel size {kernel}. "
+            "Each dimension of the array must be an exact multiple of the corresponding kernel dimension "
+            "to perform block operations."
+        )
+
+    adjusted_array = arr.reshape(
+        batch, m_x // k_x, k_x, m_y // k_y, k_y, n_resources, n_ticks
+    )
+
+    return operation(adjusted_array, axis=(2, 4))
+
+
+def batch_pad_for_hierarchy(
+    array: npt.NDArray[tp.Any], kernel: tp.Tuple[int, int], *, fill_value: float = 0
+) -> np.ndarray:
+    """
+    Batched `pad_for_hierarchy`: pads axes 1 and 2 of a (Batch, WindowX, WindowY, ...)
+    array, every batch entry receiving the same padding.
+    """
+    pad_x, pad_y = _hierarchy_padding(array.shape[1:3], kernel)
+    pad_width = ((0, 0), (0, pad_x), (0, pad_y)) + ((0, 0),) * (array.ndim - 3)
+    return np.pad(
+        array, pad_width=pad_width, mode="constant", constant_values=fill_value
+    )
+
+
+def batch_hierarchical_pooling(
+    array: npt.NDArray[tp.Any],
+    kernel: tp.Tuple[int, int],
+    operation: tp.Callable,
+    fill_value: float = 0,
+) -> tp.List[npt.NDArray[tp.Any]]:
+    """
+    Batched `hierarchical_pooling` over a (Batch, WindowX, WindowY, R, T) array.
+    Every level keeps the batch axis first, so level `l` of entry `b` equals
+    `hierarchical_pooling(array[b], ...)[l]`.
+    """
+    padded = batch_pad_for_hierarchy(array, kernel, fill_value=fill_value)
+    outputs = [padded]
+    max_levels = compute_levels(padded.shape[1:3], kernel)
+    current = padded
+
+    for _ in range(max(max_levels)):
+        if current.shape[1] <= kernel[0] or current.shape[2] <= kernel[1]:
+            break
+
+        current = batch_pool_2d_first_two_dimensions(
+            current, kernel, operation=operation
+        )
+        outputs.append(current)
+
+    return outputs
+
+
+def batch_get_window_from_cell(
+    outputs: tp.List[npt.NDArray[tp.Any]],
+    level: int,
+    cells: npt.NDArray[np.integer],
+    kernel: tp.Tuple[int, int],
+) -> npt.NDArray[tp.Any]:
+    """
+    Batched `get_window_from_cell`: `cells` has shape (Batch, 2) and holds one
+    (x, y) cell per batch entry. Returns the (Batch, k_x, k_y, ...) windows of the
+    previous level, gathered with a single fancy-indexing operation.
+    """
+    if level == 0:
+        raise ValueError("Already on Bottom level; no next window exists")
+
+    prev_level = outputs[level - 1]
+    cells = np.asarray(cells)
+
+    if cells.shape != (prev_level.shape[0], 2):
+        raise ValueError(
+            f"Cells shape should be (Batch, 2) = ({prev_level.shape[0]}, 2) and not {cells.shape}"
+        )
+
+    k_x, k_y = kernel
+    rows = cells[:, 0, None] * k_x + np.arange(k_x)
+    cols = cells[:, 1, None] * k_y + np.arange(k_y)
+    batch = np.arange(prev_level.shape[0])
+
+    return prev_level[batch[:, None, None], rows[:, :, None], cols[:, None, :], ...]
+
+
+def timeline_windows(timeline: npt.NDArray, fill_value: tp.Any) -> npt.NDArray:
+    """
+    Every window as long as the timeline (last axis) starting at offsets 0 … n_ticks,
+    the timeline going on with `fill_value` past its end: [..., n_ticks + 1, n_ticks].
+    Windows are strided views, nothing is copied but the padding.
+    """
+    n_ticks = timeline.shape[-1]
+    padding = np.full((*timeline.shape[:-1], n_ticks), fill_value, dtype=timeline.dtype)
+    extended = np.concatenate([timeline, padding], axis=-1)
+    return np.lib.stride_tricks.sliding_window_view(extended, n_ticks, axis=-1)
+
+
+def cell_capacity(dtype: npt.DTypeLike) -> tp.Any:
+    """
+    Free space of an idle cell stored as `dtype`: 1 for floats (and booleans), and
+    for integers the largest value, which then count fixed-point quanta of it.
+    """
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        return dtype.type(np.iinfo(dtype).max)
+    return dtype.type(1)
+
+
+def to_fixed_point(values: npt.ArrayLike, dtype: npt.DTypeLike) -> npt.NDArray:
+    """
+    Shares of a cell within [0, 1] as `dtype`; integer demands are rounded up to
+    whole quanta (see `cell_capacity`), so they never under-reserve.
+    """
+    values = np.asarray(values)
+    if not np.issubdtype(np.dtype(dtype), np.integer):
+        return values.astype(dtype, copy=False)
+    return np.ceil(values * cell_capacity(dtype)).astype(dtype)
+
+
+def remaining_profile_slices(n_ticks: int, elapsed: int) -> tp.Tuple[slice, slice]:
+    """
+    (machine timeline, job profile) slices of the part of a job profile still on a
+    machine after the job ran `elapsed` ticks; a negative `elapsed` is a job whose
+    start is `-elapsed` ticks away.
+    """
+    if elapsed >= 0:
+        return slice(0, max(n_ticks - elapsed, 0)), slice(elapsed, n_ticks)
+    return slice(-elapsed, n_ticks), slice(0, max(n_ticks + elapsed, 0))
@@ -1,7 +1,24 @@
+from .best_fit_scheduler import BestFitScheduler
+from .dot_product_scheduler import DotProductScheduler
+from .easy_backfilling_scheduler import EASYBackfillingScheduler
 from .first_come_first_served_scheduler import FCFSScheduler
+from .first_fit_scheduler import FirstFitScheduler
+from .l2_norm_diff_scheduler import L2NormDiffScheduler
 from .random_scheduler import RandomScheduler
 from .round_robin_scheduler import RoundRobinScheduler
 from .shortest_job_first_scheduler import SJFScheduler
+from .tetris_scheduler import TetrisScheduler
 
 
-__all__ = [FCFSScheduler, RandomScheduler, RoundRobinScheduler, SJFScheduler]
+__all__ = [
+    BestFitScheduler,
+    DotProductScheduler,
+    EASYBackfillingScheduler,
+    FCFSScheduler,
+    FirstFitScheduler,
+    L2NormDiffScheduler,
+    RandomScheduler,
+    RoundRobinScheduler,
+    SJFScheduler,
+    TetrisScheduler,
+]
@@ -1,7 +1,11 @@
+import copy
 import logging
 import typing as tp
 import abc
 
+import numpy as np
+import numpy.typing as npt
+
 from src.envs.cluster_simulator.base.internal.job import JobCollection, Job, Status
 from src.envs.cluster_simulator.base.internal.machine import MachineCollection, Machine
 
@@ -11,17 +15,18 @@ JobT = tp.TypeVar("JobT", bound=Job)
 
 
 class ABCScheduler(abc.ABC, tp.Generic[T]):
-    def __init__(self, can_run_func: tp.Callable[[MachineT, JobT], bool]):
+    def __init__(
+        self,
+        can_run_func: tp.Callable[[MachineT, JobT], bool],
+        allocate_func: tp.Optional[tp.Callable[[MachineT, JobT], None]] = None,
+    ):
         self._can_run_func = can_run_func
+        self._allocate_func = allocate_func
         self.logger = logging.getLogger(type(self).__name__)
 
     @staticmethod
     def pending_jobs(jobs: JobCollection[T]) -> tp.List[int]:
-        return [
-            j_idx
-            for j_idx, job in enumerate(iter(jobs))
-            if job.status == Status.Pending
-        ]
+        return jobs.pending_index.by_index()
 
     def possible_machines(
         self, job: Job[T], machines: MachineCollection[T]
@@ -32,7 +37,44 @@ class ABCScheduler(abc.ABC, tp.Generic[T]):
             if self._can_run_func(machine, job)
         ]
 
+    def first_possible_machine(
+        self, job: Job[T], machines: MachineCollection[T]
+    ) -> tp.Optional[int]:
+        return next(
+            (
+                m_idx
+                for m_idx, machine in enumerate(iter(machines))
+                if self._can_run_func(machine, job)
+            ),
+            None,
+        )
+
     @abc.abstractmethod
     def schedule(
         self, machines: MachineCollection[T], jobs: JobCollection[T]
     ) -> tp.Optional[tp.Tuple[int, int]]: ...
+
+    def schedule_batch(
+        self, machines: MachineCollection[T], jobs: JobCollection[T]
+    ) -> tp.Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """
+        Every placement `schedule` would make before time has to move, as
+        (machines, jobs) arrays for `ClusterAction.ScheduleBatch`. Decisions are
+        applied with `allocate_func` on copies, the given collections are untouched.
+        """
+        if self._allocate_func is None:
+            raise ValueError("Batch scheduling requires an `allocate_func`")
+
+        machines, jobs = copy.deepcopy(machines), copy.deepcopy(jobs)
+        placements = []
+        while (output := self.schedule(machines, jobs)) is not None:
+            m_idx, j_idx = output
+            self._allocate_func(machines[m_idx], jobs[j_idx])
+            machines.notify_allocation(m_idx)
+            jobs[j_idx].status = Status.Running
+            jobs.pending_index.discard(j_idx)
+            placements.append(output)
+
+        self.logger.debug("Batch of %d placements", len(placements))
+        m_indices, j_indices = np.array(placements, dtype=np.intp).reshape(-1, 2).T
+        return m_indices, j_indices
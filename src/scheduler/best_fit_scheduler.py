@@ -0,0 +1,37 @@
+import typing as tp
+
+from src.envs.cluster_simulator.base.internal.job import JobCollection
+from src.envs.cluster_simulator.base.internal.machine import MachineCollection
+from src.scheduler.base_scheduler import ABCScheduler
+
+T = tp.TypeVar("T")
+
+
+class BestFitScheduler(ABCScheduler[T]):
+    """
+    Best Fit scheduler.
+    Takes pending jobs by arrival and places the first one that fits anywhere on
+    the tightest machine (least total free capacity) that can run it.
+    """
+
+    def schedule(
+        self, machines: MachineCollection[T], jobs: JobCollection[T]
+    ) -> tp.Optional[tp.Tuple[int, int]]:
+        pending = jobs.pending_index
+
+        if not pending:
+            self.logger.debug("No pending jobs.")
+            return None
+
+        capacity_index = machines.capacity_index
+        for job_idx in pending.by_arrival():
+            machine_idx = capacity_index.best_fit(jobs[job_idx], self._can_run_func)
+
+            if machine_idx is not None:
+                self.logger.debug(
+                    "Scheduling job %d on tightest machine %d", job_idx, machine_idx
+                )
+                return machine_idx, job_idx
+
+        self.logger.debug("No available machines for any pending job.")
+        return None
@@ -0,0 +1,25 @@
+import typing as tp
+
+import numpy as np
+import numpy.typing as npt
+
+from src.envs.cluster_simulator.base.internal.job import JobCollection
+from src.scheduler.packing_scheduler import PackingScheduler
+
+T = tp.TypeVar("T")
+
+
+class DotProductScheduler(PackingScheduler[T]):
+    """
+    Dot-Product scheduler.
+    Scores a pair by the dot product of the machine free space and the job usage
+    over every resource and tick, favouring machines with room where the job needs it.
+    """
+
+    def score(
+        self,
+        free_space: npt.NDArray[np.float64],
+        usage: npt.NDArray[np.float64],
+        jobs: JobCollection[T],
+    ) -> npt.NDArray[np.float64]:
+        return np.einsum("mrt,jrt->mj", free_space, usage)
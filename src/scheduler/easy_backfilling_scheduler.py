@@ -0,0 +1,102 @@
+import typing as tp
+
+import numpy as np
+import numpy.typing as npt
+
+from src.envs.cluster_simulator.base.internal.job import Job, JobCollection
+from src.envs.cluster_simulator.metric_based.internal.machines import MetricMachines
+from src.envs.cluster_simulator.utils.array_operations import (
+    cell_capacity,
+    timeline_windows,
+)
+from src.scheduler.base_scheduler import ABCScheduler
+
+T = tp.TypeVar("T")
+
+
+class Reservation(tp.NamedTuple):
+    job: int
+    machine: int
+    offset: int  # ticks from now until the job is guaranteed to fit
+
+
+class EASYBackfillingScheduler(ABCScheduler[T]):
+    """
+    EASY Backfilling scheduler (for metric machines).
+    The earliest pending job runs as soon as it fits. When it doesn't, it reserves
+    the earliest tick at which it fits on some machine timeline, and later jobs are
+    backfilled now only if the reservation still holds with them placed.
+    """
+
+    def __init__(self, can_run_func: tp.Callable, allocate_func=None):
+        super().__init__(can_run_func, allocate_func)
+        self.reservation: tp.Optional[Reservation] = None
+
+    def schedule(
+        self, machines: MetricMachines, jobs: JobCollection[T]
+    ) -> tp.Optional[tp.Tuple[int, int]]:
+        pending = list(jobs.pending_index.by_arrival())
+        self.reservation = None
+
+        if not pending:
+            self.logger.debug("No pending jobs.")
+            return None
+
+        head, *queue = pending
+        machine_idx = self.first_possible_machine(jobs[head], machines)
+        if machine_idx is not None:
+            self.logger.debug("Scheduling head job %d on machine %d", head, machine_idx)
+            return machine_idx, head
+
+        free_space = machines.free_space_tensor()
+        self.reservation = self.reserve(free_space, head, jobs[head])
+        self.logger.debug("Head job %d reservation: %s", head, self.reservation)
+
+        for job_idx in queue:
+            job = jobs[job_idx]
+            for machine_idx in self.possible_machines(job, machines):
+                if self.keeps_reservation(free_space, machine_idx, job, jobs):
+                    self.logger.debug(
+                        "Backfilling job %d on machine %d", job_idx, machine_idx
+                    )
+                    return machine_idx, job_idx
+
+        self.logger.debug("No job can be backfilled.")
+        return None
+
+    def keeps_reservation(
+        self,
+        free_space: npt.NDArray[np.float64],
+        machine_idx: int,
+        job: Job,
+        jobs: JobCollection[T],
+    ) -> bool:
+        reservation = self.reservation
+        if reservation is None or reservation.machine != machine_idx:
+            return True
+        head = jobs[reservation.job]
+        free_after = free_space[machine_idx] - job.usage
+        fits = self.start_offsets(free_after[None], head.usage)
+        return bool(fits[0, reservation.offset])
+
+    @classmethod
+    def reserve(
+        cls, free_space: npt.NDArray[np.float64], job_idx: int, job: Job
+    ) -> tp.Optional[Reservation]:
+        fits = cls.start_offsets(free_space, job.usage)
+        fits &= np.isfinite(free_space).all(axis=(1, 2))[:, None]
+        if not fits.any():
+            return None  # The job never fits, it must not block the queue
+        offset = int(np.argmax(fits.any(axis=0)))
+        return Reservation(job_idx, int(np.argmax(fits[:, offset])), offset)
+
+    @staticmethod
+    def start_offsets(
+        free_space: npt.NDArray[np.float64], usage: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.bool_]:
+        """
+        [n_machines, n_ticks + 1] mask of the offsets at which the job usage fits
+        the machines timelines, which are idle past their horizon.
+        """
+        windows = timeline_windows(free_space, cell_capacity(free_space.dtype))
+        return np.all(windows > usage[None, :, None, :], axis=(1, 3))
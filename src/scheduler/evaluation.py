@@ -0,0 +1,157 @@
+import concurrent.futures
+import logging
+import time
+import typing as tp
+
+import gymnasium as gym
+import numpy as np
+
+from src import envs  # noqa: F401
+from src.envs.cluster_simulator.actions import EnvironmentAction
+from src.envs.cluster_simulator.basic import BasicClusterEnv
+from src.scheduler.base_scheduler import ABCScheduler
+from src.scheduler.packing_scheduler import PackingScheduler
+
+logger = logging.getLogger(__name__)
+
+SchedulerType = tp.Type[ABCScheduler]
+
+
+class EpisodeResult(tp.NamedTuple):
+    seed: int
+    makespan: int  # ticks until every job completed (or the tick budget)
+    mean_slowdown: float  # (completion - arrival) / length, averaged over jobs
+    utilization: float  # used share of the capacity, averaged over ticks
+    n_decisions: int  # `schedule` calls
+    decision_time: float  # seconds spent inside `schedule`
+    completed: bool
+
+
+class EvaluationReport(tp.NamedTuple):
+    scheduler: str
+    env_id: str
+    n_episodes: int
+    makespan: float
+    makespan_std: float
+    mean_slowdown: float
+    utilization: float
+    decisions_per_second: float
+    completion_rate: float
+    episodes: tp.Tuple[EpisodeResult, ...]
+
+    @classmethod
+    def from_episodes(
+        cls, scheduler: str, env_id: str, episodes: tp.Sequence[EpisodeResult]
+    ) -> "EvaluationReport":
+        makespan = np.array([episode.makespan for episode in episodes], dtype=float)
+        decision_time = sum(episode.decision_time for episode in episodes)
+        n_decisions = sum(episode.n_decisions for episode in episodes)
+        return cls(
+            scheduler=scheduler,
+            env_id=env_id,
+            n_episodes=len(episodes),
+            makespan=float(makespan.mean()),
+            makespan_std=float(makespan.std()),
+            mean_slowdown=float(np.mean([e.mean_slowdown for e in episodes])),
+            utilization=float(np.mean([e.utilization for e in episodes])),
+            decisions_per_second=n_decisions / decision_time if decision_time else 0.0,
+            completion_rate=float(np.mean([e.completed for e in episodes])),
+            episodes=tuple(episodes),
+        )
+
+
+def evaluate(
+    scheduler_cls: SchedulerType,
+    env_id: str,
+    seeds: tp.Iterable[int],
+    *,
+    env_kwargs: tp.Optional[dict] = None,
+    scheduler_kwargs: tp.Optional[dict] = None,
+    max_ticks: int = 10_000,
+    n_workers: tp.Optional[int] = None,
+) -> EvaluationReport:
+    """
+    Runs one seeded episode of `env_id` per seed, driven by `scheduler_cls`, over a
+    process pool (`n_workers=1` runs them in this process) and aggregates them.
+    """
+    seeds = list(seeds)
+    run = _EpisodeRunner(
+        scheduler_cls, env_id, env_kwargs or {}, scheduler_kwargs or {}, max_ticks
+    )
+    if n_workers == 1:
+        episodes = [run(seed) for seed in seeds]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(n_workers) as executor:
+            episodes = list(executor.map(run, seeds))
+
+    report = EvaluationReport.from_episodes(scheduler_cls.__name__, env_id, episodes)
+    logger.info(
+        "%s on %s: makespan=%.2f slowdown=%.2f utilization=%.2f",
+        report.scheduler,
+        env_id,
+        report.makespan,
+        report.mean_slowdown,
+        report.utilization,
+    )
+    return report
+
+
+class _EpisodeRunner(tp.NamedTuple):
+    scheduler_cls: SchedulerType
+    env_id: str
+    env_kwargs: dict
+    scheduler_kwargs: dict
+    max_ticks: int
+
+    def __call__(self, seed: int) -> EpisodeResult:
+        env: BasicClusterEnv = gym.make(self.env_id, **self.env_kwargs).unwrapped
+        return run_episode(
+            env, self.scheduler_cls, seed, self.scheduler_kwargs, self.max_ticks
+        )
+
+
+def run_episode(
+    env: BasicClusterEnv,
+    scheduler_cls: SchedulerType,
+    seed: int,
+    scheduler_kwargs: tp.Optional[dict] = None,
+    max_ticks: int = 10_000,
+) -> EpisodeResult:
+    _, info = env.reset(seed=seed)
+    cluster = env._cluster
+    scheduler_kwargs = dict(scheduler_kwargs or {})
+    if issubclass(scheduler_cls, PackingScheduler):
+        scheduler_kwargs.setdefault("feasibility_func", cluster.feasibility_matrix)
+    scheduler = scheduler_cls(
+        cluster.is_allocation_possible, cluster.allocation, **scheduler_kwargs
+    )
+    skip_time = EnvironmentAction(should_schedule=True, schedule=(-1, -1))
+    n_decisions, decision_time, terminated = 0, 0.0, False
+
+    while not terminated and cluster._current_tick < max_ticks:
+        start = time.perf_counter()
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        decision_time += time.perf_counter() - start
+        n_decisions += 1
+        if output is None:
+            action = skip_time
+        else:
+            action = EnvironmentAction(should_schedule=False, schedule=output)
+        _, _, terminated, _, info = env.step(action)
+
+    statistics = cluster.episode_statistics()
+    is_done = cluster.finish_ticks >= 0
+    arrival = np.array([job.arrival_time for job in cluster._jobs], dtype=float)
+    length = np.array([max(job.length, 1) for job in cluster._jobs], dtype=float)
+    slowdown = (cluster.finish_ticks - arrival)[is_done] / length[is_done]
+    return EpisodeResult(
+        seed=seed,
+        makespan=int(cluster._current_tick),
+        mean_slowdown=float(slowdown.mean()) if slowdown.size else float("nan"),
+        utilization=(
+            float(statistics.utilization.mean()) if statistics.utilization.size else 0.0
+        ),
+        n_decisions=n_decisions,
+        decision_time=decision_time,
+        completed=bool(is_done.all()),
+    )
@@ -16,17 +16,16 @@ class FCFSScheduler(ABCScheduler[T]):
     def schedule(
         self, machines: MachineCollection[T], jobs: JobCollection[T]
     ) -> tp.Optional[tp.Tuple[int, int]]:
-        pending = self.pending_jobs(jobs)
+        pending = jobs.pending_index
 
         if not pending:
             self.logger.debug("No pending jobs.")
             return None
 
-        for job_idx in pending:
-            job = jobs[job_idx]
+        for job_idx in pending.by_arrival():
+            machine_idx = self.first_possible_machine(jobs[job_idx], machines)
 
-            if available := self.possible_machines(job, machines):
-                machine_idx = available[0]
+            if machine_idx is not None:
                 self.logger.debug(
                     "Scheduling job %d on machine %d", job_idx, machine_idx
                 )
@@ -0,0 +1,29 @@
+import typing as tp
+
+import numpy as np
+import numpy.typing as npt
+
+from src.envs.cluster_simulator.base.internal.job import JobCollection
+from src.scheduler.packing_scheduler import PackingScheduler
+
+T = tp.TypeVar("T")
+
+
+class L2NormDiffScheduler(PackingScheduler[T]):
+    """
+    L2-Norm-Diff scheduler.
+    Scores a pair by minus the squared L2 distance between the machine free space
+    and the job usage, expanded so it's a single contraction over all pairs:
+    |f - u|^2 = |f|^2 - 2 f.u + |u|^2.
+    """
+
+    def score(
+        self,
+        free_space: npt.NDArray[np.float64],
+        usage: npt.NDArray[np.float64],
+        jobs: JobCollection[T],
+    ) -> npt.NDArray[np.float64]:
+        free_norm = np.einsum("mrt,mrt->m", free_space, free_space)
+        usage_norm = np.einsum("jrt,jrt->j", usage, usage)
+        cross = np.einsum("mrt,jrt->mj", free_space, usage)
+        return -(free_norm[:, None] - 2 * cross + usage_norm[None, :])
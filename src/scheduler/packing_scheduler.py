@@ -0,0 +1,93 @@
+import abc
+import typing as tp
+
+import numpy as np
+import numpy.typing as npt
+
+from src.envs.cluster_simulator.base.internal.job import JobCollection
+from src.envs.cluster_simulator.base.internal.machine import MachineCollection
+from src.scheduler.base_scheduler import ABCScheduler
+
+T = tp.TypeVar("T")
+FeasibilityFunc = tp.Callable[[MachineCollection, JobCollection], npt.NDArray[np.bool_]]
+
+
+class PackingScheduler(ABCScheduler[T]):
+    """
+    Scores every (machine, job) pair at once from the stacked free space
+    [n_machines, n_resources, n_ticks] and usage [n_jobs, n_resources, n_ticks]
+    tensors, then places the best scoring feasible pending pair.
+    With `feasibility_func` (e.g. `ClusterABC.feasibility_matrix`) the feasibility
+    mask is computed in one pass instead of a `can_run_func` call per pair.
+    """
+
+    def __init__(
+        self,
+        can_run_func: tp.Callable,
+        allocate_func: tp.Optional[tp.Callable] = None,
+        *,
+        feasibility_func: tp.Optional[FeasibilityFunc] = None,
+    ):
+        super().__init__(can_run_func, allocate_func)
+        self._feasibility_func = feasibility_func
+
+    @abc.abstractmethod
+    def score(
+        self,
+        free_space: npt.NDArray[np.float64],
+        usage: npt.NDArray[np.float64],
+        jobs: JobCollection[T],
+    ) -> npt.NDArray[np.float64]:
+        """[n_machines, n_jobs] score of every pair, higher is better."""
+
+    def schedule(
+        self, machines: MachineCollection[T], jobs: JobCollection[T]
+    ) -> tp.Optional[tp.Tuple[int, int]]:
+        pending = jobs.pending_index.by_index()
+
+        if not pending:
+            self.logger.debug("No pending jobs.")
+            return None
+
+        is_candidate = np.zeros((len(machines), len(jobs)), dtype=np.bool_)
+        is_candidate[:, pending] = self.feasibility(machines, jobs)[:, pending]
+        if not is_candidate.any():
+            self.logger.debug("No available machines for any pending job.")
+            return None
+
+        # Placeholder machines hold infinite free space, their pairs are masked anyway
+        with np.errstate(invalid="ignore", over="ignore"):
+            scores = self.score(
+                self.as_resource_tick(machines.free_space_tensor()),
+                self.as_resource_tick(jobs.usage_tensor()),
+                jobs,
+            )
+        scores = np.where(is_candidate, scores, -np.inf)
+        machine_idx, job_idx = np.unravel_index(np.argmax(scores), scores.shape)
+        self.logger.debug(
+            "Scheduling job %d on machine %d (score=%f)",
+            job_idx,
+            machine_idx,
+            scores[machine_idx, job_idx],
+        )
+        return int(machine_idx), int(job_idx)
+
+    def feasibility(
+        self, machines: MachineCollection[T], jobs: JobCollection[T]
+    ) -> npt.NDArray[np.bool_]:
+        if self._feasibility_func is not None:
+            return self._feasibility_func(machines, jobs)
+        return np.array(
+            [
+                [self._can_run_func(machine, job) for job in jobs]
+                for machine in machines
+            ],
+            dtype=np.bool_,
+        ).reshape(len(machines), len(jobs))
+
+    @staticmethod
+    def as_resource_tick(tensor: npt.NDArray) -> npt.NDArray[np.float64]:
+        """View any cell layout as [n, resources, ticks], the ticks being last."""
+        tensor = np.asarray(tensor, dtype=np.float64)
+        n_ticks = tensor.shape[-1] if tensor.ndim >= 3 else 1
+        return tensor.reshape(tensor.shape[0], -1, n_ticks)
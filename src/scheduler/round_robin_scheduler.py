@@ -14,30 +14,27 @@ class RoundRobinScheduler(ABCScheduler[T]):
     before returning to the beginning of the queue.
     """
 
-    def __init__(self, can_run_func: tp.Callable):
-        super().__init__(can_run_func)
+    def __init__(
+        self,
+        can_run_func: tp.Callable,
+        allocate_func: tp.Optional[tp.Callable] = None,
+    ):
+        super().__init__(can_run_func, allocate_func)
         self._last_job_idx: int = -1
 
     def schedule(
         self, machines: MachineCollection[T], jobs: JobCollection[T]
     ) -> tp.Optional[tp.Tuple[int, int]]:
-        pending = self.pending_jobs(jobs)
+        pending = jobs.pending_index
 
         if not pending:
             self.logger.debug("No pending jobs.")
             return None
 
-        # Sort pending jobs to ensure consistent cycling order
-        pending = sorted(pending)
-
-        # Find the next job after the last scheduled one (wrap around)
-        next_candidates = [i for i in pending if i > self._last_job_idx]
-        ordered = next_candidates if next_candidates else pending  # wrap around
-
-        for job_idx in ordered:
-            available = self.possible_machines(jobs[job_idx], machines)
-            if available:
-                machine_idx = available[0]
+        # Cycle from the job after the last scheduled one, wrapping around
+        for job_idx in pending.from_cursor(self._last_job_idx):
+            machine_idx = self.first_possible_machine(jobs[job_idx], machines)
+            if machine_idx is not None:
                 self._last_job_idx = job_idx
                 self.logger.debug(
                     "Scheduling job %d on machine %d (last_idx=%d)",
@@ -17,31 +17,24 @@ class SJFScheduler(ABCScheduler[T]):
     def schedule(
         self, machines: MachineCollection[T], jobs: JobCollection[T]
     ) -> tp.Optional[tp.Tuple[int, int]]:
-        pending = self.pending_jobs(jobs)
+        pending = jobs.pending_index
 
         if not pending:
             self.logger.debug("No pending jobs.")
             return None
 
-        # Filter to only jobs that can actually run on at least one machine
-        schedulable = [
-            (job_idx, self.possible_machines(jobs[job_idx], machines))
-            for job_idx in pending
-            if self.possible_machines(jobs[job_idx], machines)
-        ]
-
-        if not schedulable:
-            self.logger.debug("No available machines for any pending job.")
-            return None
-
-        # SJF: pick the job with the smallest duration
-        job_idx, available_machines = min(schedulable, key=lambda x: jobs[x[0]].length)
-
-        machine_idx = available_machines[0]
-        self.logger.debug(
-            "Scheduling job %d (duration=%s) on machine %d",
-            job_idx,
-            jobs[job_idx].length,
-            machine_idx,
-        )
-        return machine_idx, job_idx
+        # Jobs come shortest first, the first one that can run anywhere wins
+        for job_idx in pending.by_length():
+            machine_idx = self.first_possible_machine(jobs[job_idx], machines)
+
+            if machine_idx is not None:
+                self.logger.debug(
+                    "Scheduling job %d (duration=%s) on machine %d",
+                    job_idx,
+                    jobs[job_idx].length,
+                    machine_idx,
+                )
+                return machine_idx, job_idx
+
+        self.logger.debug("No available machines for any pending job.")
+        return None
@@ -0,0 +1,34 @@
+import typing as tp
+
+import numpy as np
+import numpy.typing as npt
+
+from src.envs.cluster_simulator.base.internal.job import JobCollection
+from src.scheduler.packing_scheduler import PackingScheduler
+
+T = tp.TypeVar("T")
+
+
+class TetrisScheduler(PackingScheduler[T]):
+    """
+    Tetris scheduler (as the DeepRM baseline).
+    Scores a pair by the alignment between the machine currently free resources
+    and the job peak demand, minus `duration_weight` times the job length so
+    shorter jobs win close alignments.
+    """
+
+    def __init__(self, *args, duration_weight: float = 0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._duration_weight = duration_weight
+
+    def score(
+        self,
+        free_space: npt.NDArray[np.float64],
+        usage: npt.NDArray[np.float64],
+        jobs: JobCollection[T],
+    ) -> npt.NDArray[np.float64]:
+        alignment = np.einsum("mr,jr->mj", free_space[..., 0], usage.max(axis=-1))
+        if not self._duration_weight:
+            return alignment
+        lengths = np.array([job.length for job in jobs], dtype=np.float64)
+        return alignment - self._duration_weight * lengths[None, :]
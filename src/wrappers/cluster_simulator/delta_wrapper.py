@@ -0,0 +1,113 @@
+from typing import Any, SupportsFloat, TypeVar, TypedDict
+
+import gymnasium as gym
+import numpy as np
+import numpy.typing as npt
+import typing as tp
+
+from src.envs.cluster_simulator.actions import EnvironmentAction
+from src.envs.cluster_simulator.basic import BasicClusterEnv
+from src.envs.cluster_simulator.base.extractors.observation import (
+    BaseClusterObservation,
+)
+
+EnvironmentObservation = TypeVar("EnvironmentObservation", bound=BaseClusterObservation)
+
+
+class ObservationDelta(TypedDict):
+    keyframe: bool  # `changed` holds the whole observation
+    machine_indices: npt.NDArray[np.int64]
+    machines: npt.NDArray  # [len(machine_indices), ...] new rows
+    job_indices: npt.NDArray[np.int64]
+    jobs_status: npt.NDArray  # [len(job_indices)] new statuses
+    changed: tp.Dict[str, npt.NDArray]  # Every other key whose value changed
+
+
+def _changed_rows(current: npt.NDArray, previous: npt.NDArray) -> npt.NDArray[np.int64]:
+    different = current != previous
+    if different.ndim > 1:
+        different = different.reshape(len(different), -1).any(axis=1)
+    return np.flatnonzero(different)
+
+
+class DeltaObservationWrapper(
+    gym.Wrapper[
+        EnvironmentObservation, EnvironmentAction, ObservationDelta, EnvironmentAction
+    ]
+):
+    """
+    Emits only what changed since the previous observation: the machine rows and
+    job statuses that changed (with their indices) and the other keys whose value
+    changed. Resets emit a keyframe holding the whole observation.
+    `DeltaObservationDecoder` rebuilds the full observations on the receiving side,
+    those live in the wrapped environment `observation_space`.
+    """
+
+    def __init__(self, env: BasicClusterEnv):
+        super().__init__(env)
+        self._previous: tp.Dict[str, npt.NDArray] = {}
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[ObservationDelta, dict[str, Any]]:
+        observation, info = self.env.reset(seed=seed, options=options)
+        self._previous = {key: np.array(value) for key, value in observation.items()}
+        return ObservationDelta(
+            keyframe=True,
+            machine_indices=np.zeros(0, dtype=np.int64),
+            machines=self._previous["machines"][:0],
+            job_indices=np.zeros(0, dtype=np.int64),
+            jobs_status=self._previous["jobs_status"][:0],
+            changed={key: value.copy() for key, value in self._previous.items()},
+        ), info
+
+    def step(
+        self, action: EnvironmentAction
+    ) -> tuple[ObservationDelta, SupportsFloat, bool, bool, dict[str, Any]]:
+        observation, reward, terminated, truncated, info = self.env.step(action)
+        return self.encode(observation), reward, terminated, truncated, info
+
+    def encode(self, observation: EnvironmentObservation) -> ObservationDelta:
+        machines = np.asarray(observation["machines"])
+        jobs_status = np.asarray(observation["jobs_status"])
+        machine_indices = _changed_rows(machines, self._previous["machines"])
+        job_indices = _changed_rows(jobs_status, self._previous["jobs_status"])
+        self._previous["machines"][machine_indices] = machines[machine_indices]
+        self._previous["jobs_status"][job_indices] = jobs_status[job_indices]
+
+        changed = {}
+        for key, value in observation.items():
+            if key in ("machines", "jobs_status"):
+                continue
+            if not np.array_equal(value, self._previous[key]):
+                self._previous[key] = np.array(value)
+                changed[key] = self._previous[key].copy()
+        return ObservationDelta(
+            keyframe=False,
+            machine_indices=machine_indices,
+            machines=machines[machine_indices],
+            job_indices=job_indices,
+            jobs_status=jobs_status[job_indices],
+            changed=changed,
+        )
+
+
+class DeltaObservationDecoder:
+    """Receiving side of `DeltaObservationWrapper`: applies deltas in emission order."""
+
+    def __init__(self) -> None:
+        self._observation: tp.Optional[tp.Dict[str, npt.NDArray]] = None
+
+    def apply(self, delta: ObservationDelta) -> tp.Dict[str, npt.NDArray]:
+        """The full observation after `delta`, the returned arrays are copies."""
+        if delta["keyframe"]:
+            self._observation = {}
+        elif self._observation is None:
+            raise ValueError("The first decoded delta has to be a keyframe")
+
+        observation = self._observation
+        for key, value in delta["changed"].items():
+            observation[key] = np.array(value)
+        observation["machines"][delta["machine_indices"]] = delta["machines"]
+        observation["jobs_status"][delta["job_indices"]] = delta["jobs_status"]
+        return {key: value.copy() for key, value in observation.items()}
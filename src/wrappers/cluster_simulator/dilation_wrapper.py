@@ -12,7 +12,11 @@ from src.envs.cluster_simulator.base.internal.dilation import (
     DilationState,
     AbstractDilationParams,
 )
-from src.envs.cluster_simulator.actions import DilationEnvironmentAction
+from src.envs.cluster_simulator.actions import (
+    DilationEnvironmentAction,
+    DilationDiscreteActionConvertor,
+)
+from src.envs.cluster_simulator.base.internal.job import Status
 from src.envs.cluster_simulator.basic import BasicClusterEnv, EnvironmentAction
 from src.envs.cluster_simulator.base.extractors.information import ClusterInformation
 from src.envs.cluster_simulator.base.extractors.observation import (
@@ -35,37 +39,57 @@ class DilatorWrapper(
         env: BasicClusterEnv,
         *,
         dilator_cls: tp.Type[Dilator],
+        auto_descend: bool = False,
+        feasibility: bool = False,
+        discrete_actions: bool = False,
         **dilation_params: AbstractDilationParams,
     ):
+        """
+        With `auto_descend` levels offering a single candidate cell (a real machine
+        block with free capacity) are expanded without asking the agent, and
+        contracting climbs back over them.
+        With `feasibility` the observation carries a `feasible_jobs` [k_x, k_y, n_jobs]
+        mask telling which pending jobs fit on some machine of each cell, and
+        candidate cells are the ones hosting at least one pending job.
+        With `discrete_actions` the action space is a flat `Discrete` (see
+        `DilationDiscreteActionConvertor`); tuple actions are accepted either way.
+        """
         super().__init__(env)
         self.dilator_type = dilator_cls
+        self._auto_descend = auto_descend
+        self._feasibility = feasibility
         self._dilation_params = dilation_params
         sampled_obs = self.observation_space.sample()
-        reformated_array = self.dilator_type.cast_into_dilation_format(
-            sampled_obs["machines"]
-        )
         n_jobs = sampled_obs["jobs_usage"].shape[0]
         self._n_machines = sampled_obs["machines"].shape[0]
-        self._dilator = self.dilator_type(
-            **self._dilation_params, array=reformated_array
-        )  # type: ignore
-        self.observation_space = self.cast_original_observation_space()
-        self.action_space = self.cast_original_action_space(self._dilator, n_jobs)
+        self._dilator = self.dilator_from_machines_obs(sampled_obs["machines"])
+        self.observation_space = self.cast_original_observation_space(n_jobs)
+        self._discrete_convertor = DilationDiscreteActionConvertor(
+            self._dilator.get_kernel(), n_jobs
+        )
+        self.action_space = (
+            self._discrete_convertor.create_space()
+            if discrete_actions
+            else self.cast_original_action_space(self._dilator, n_jobs)
+        )
         self._dilator = None
         self._current_observation = None
         self.logger = logging.getLogger(type(self).__name__)
 
     def step(
-        self, action: DilationEnvironmentAction
+        self, action: DilationEnvironmentAction | int
     ) -> tuple[WrapperObservation, SupportsFloat, bool, bool, WrapperInformation]:
         if self._dilator is None:
             raise ValueError("Should always call rest before running")
 
+        if isinstance(action, (int, np.integer)):
+            action = self._discrete_convertor.decode(int(action))
+
         converted_action = self.run_and_convert(action)
         is_in_dilation = converted_action is None
 
         if is_in_dilation:
-            self._current_observation["machines"] = self._dilator.state.value
+            self.update_window_observation()
             return self._current_observation, 0, False, False, None
 
         obs, reward, terminated, truncated, info = self.env.step(converted_action)
@@ -83,7 +107,9 @@ class DilatorWrapper(
         obs, info = self.env.reset(seed=seed, options=options)
         return self.update_and_convert_observation(obs), info
 
-    def cast_original_observation_space(self) -> gym.Space[WrapperObservation]:
+    def cast_original_observation_space(
+        self, n_jobs: int
+    ) -> gym.Space[WrapperObservation]:
         original_obs_space = {k: v for k, v in self.env.observation_space.items()}
         original_machines_space = original_obs_space.pop("machines")
 
@@ -98,6 +124,13 @@ class DilatorWrapper(
             dtype=original_machines_space.dtype,
         )
         original_obs_space["machines"] = machines_space
+        if self._feasibility:
+            original_obs_space["feasible_jobs"] = gym.spaces.Box(
+                low=0,
+                high=1,
+                shape=(*self._dilator.get_kernel(), n_jobs),
+                dtype=np.bool_,
+            )
         return gym.spaces.Dict(original_obs_space)
 
     @staticmethod
@@ -126,6 +159,7 @@ class DilatorWrapper(
 
         if action.contract:
             self._dilator.execute(DilationAction.Contract())
+            self.contract_trivial_levels()
             return None
         else:
             self._dilator.execute(
@@ -133,11 +167,32 @@ class DilatorWrapper(
                     x=action.selected_machine_cell[0], y=action.selected_machine_cell[1]
                 )
             )
+            self.expand_trivial_levels()
             return None
 
+    def expand_trivial_levels(self) -> None:
+        if not self._auto_descend:
+            return
+        while not isinstance(self._dilator.state, DilationState.FullyExpanded):
+            candidates = np.argwhere(self._dilator.get_candidate_cells())
+            if len(candidates) != 1:
+                break
+            x, y = candidates[0]
+            self.logger.debug("Auto expanding single candidate cell (%d, %d)", x, y)
+            self._dilator.execute(DilationAction.Expand(x=int(x), y=int(y)))
+
+    def contract_trivial_levels(self) -> None:
+        if not self._auto_descend:
+            return
+        while (
+            not isinstance(self._dilator.state, DilationState.Initial)
+            and np.count_nonzero(self._dilator.get_candidate_cells()) == 1
+        ):
+            self.logger.debug("Auto contracting single candidate level")
+            self._dilator.execute(DilationAction.Contract())
+
     def dilator_from_machines_obs(self, machines: np.ndarray) -> Dilator:
-        array = self.dilator_type.cast_into_dilation_format(machines)
-        return self.dilator_type(**self._dilation_params, array=array)
+        return self.dilator_type.from_machines(machines, **self._dilation_params)
 
     def update_and_convert_observation(
         self, obs: EnvironmentObservation
@@ -146,5 +201,21 @@ class DilatorWrapper(
         self._dilator = self.dilator_from_machines_obs(
             self._current_observation["machines"]
         )
-        self._current_observation["machines"] = self._dilator.state.value
+        if self._feasibility:
+            self._dilator.set_feasibility(self.pending_feasibility(obs))
+        self.expand_trivial_levels()
+        self.update_window_observation()
         return self._current_observation
+
+    def pending_feasibility(self, obs: EnvironmentObservation) -> np.ndarray:
+        cluster = self.env.unwrapped._cluster
+        feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+        is_pending = np.asarray(obs["jobs_status"]) == Status.Pending
+        return feasibility & is_pending[None, :]
+
+    def update_window_observation(self) -> None:
+        self._current_observation["machines"] = self._dilator.state.value
+        if self._feasibility:
+            self._current_observation["feasible_jobs"] = (
+                self._dilator.get_window_feasibility()
+            )
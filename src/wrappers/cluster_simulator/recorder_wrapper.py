@@ -0,0 +1,190 @@
+import logging
+import pathlib
+from typing import Any, SupportsFloat, TypeVar
+
+import gymnasium as gym
+import numpy as np
+import numpy.typing as npt
+import typing as tp
+
+from src.envs.cluster_simulator.actions import EnvironmentAction
+from src.envs.cluster_simulator.basic import BasicClusterEnv
+from src.envs.cluster_simulator.base.extractors.observation import (
+    BaseClusterObservation,
+)
+
+EnvironmentObservation = TypeVar("EnvironmentObservation", bound=BaseClusterObservation)
+
+SEGMENT_PATTERN = "segment_{:06d}.npz"
+
+
+def _as_bits(array: npt.ArrayLike) -> npt.NDArray[np.unsignedinteger]:
+    """Same bytes viewed as unsigned integers, so XOR deltas are exact."""
+    array = np.ascontiguousarray(array)
+    return array.view(np.dtype(f"u{array.dtype.itemsize}"))
+
+
+def _flatten_action(action: Any) -> npt.NDArray[np.int64]:
+    if isinstance(action, (int, np.integer)):
+        return np.array([action], dtype=np.int64)
+    if isinstance(action, np.ndarray):
+        return action.astype(np.int64).ravel()
+    return np.hstack(
+        [_flatten_action(item) for item in action] or [np.zeros(0, np.int64)]
+    ).astype(np.int64)
+
+
+class TrajectoryRecorderWrapper(
+    gym.Wrapper[
+        EnvironmentObservation,
+        EnvironmentAction,
+        EnvironmentObservation,
+        EnvironmentAction,
+    ]
+):
+    """
+    Streams every (observation, action, reward, terminated, truncated) row into
+    compressed `.npz` segments of `chunk_size` rows in `directory`.
+    Observation arrays are stored as XOR deltas against the previous row, the first
+    row of a segment against zeros, so segments decode on their own and the mostly
+    unchanged machine and job tensors compress to almost nothing.
+    Reset rows carry the reset observation, an empty action and `is_first`.
+    Read segments back with `load_trajectories`.
+    """
+
+    def __init__(
+        self,
+        env: BasicClusterEnv,
+        directory: tp.Union[str, pathlib.Path],
+        *,
+        chunk_size: int = 1024,
+        compress: bool = True,
+    ):
+        super().__init__(env)
+        self._directory = pathlib.Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._chunk_size = chunk_size
+        self._save = np.savez_compressed if compress else np.savez
+        self._n_segments = 0
+        self._episode = -1
+        self._new_segment()
+        self.logger = logging.getLogger(type(self).__name__)
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[EnvironmentObservation, dict[str, Any]]:
+        observation, info = self.env.reset(seed=seed, options=options)
+        self._episode += 1
+        self._record(observation, (), 0.0, False, False, is_first=True)
+        return observation, info
+
+    def step(
+        self, action: EnvironmentAction
+    ) -> tuple[EnvironmentObservation, SupportsFloat, bool, bool, dict[str, Any]]:
+        observation, reward, terminated, truncated, info = self.env.step(action)
+        self._record(observation, action, reward, terminated, truncated)
+        return observation, reward, terminated, truncated, info
+
+    def close(self):
+        self.flush()
+        super().close()
+
+    def flush(self) -> None:
+        if not self._rewards:
+            return
+        path = self._directory / SEGMENT_PATTERN.format(self._n_segments)
+        columns: dict[str, npt.NDArray] = {
+            "episode": np.array(self._episodes, dtype=np.int64),
+            "is_first": np.array(self._is_first, dtype=np.bool_),
+            "reward": np.array(self._rewards, dtype=np.float64),
+            "terminated": np.array(self._terminated, dtype=np.bool_),
+            "truncated": np.array(self._truncated, dtype=np.bool_),
+            "action": np.concatenate(self._actions),
+            "action_offsets": np.cumsum(
+                [0] + [len(action) for action in self._actions], dtype=np.int64
+            ),
+        }
+        for key, deltas in self._deltas.items():
+            columns[f"obs/{key}"] = np.stack(deltas)
+            columns[f"dtype/{key}"] = np.array(self._dtypes[key])
+        self._save(path, **columns)
+        self.logger.debug("Recorded %d rows into %s", len(self._rewards), path)
+        self._n_segments += 1
+        self._new_segment()
+
+    def _new_segment(self) -> None:
+        self._episodes: tp.List[int] = []
+        self._is_first: tp.List[bool] = []
+        self._rewards: tp.List[float] = []
+        self._terminated: tp.List[bool] = []
+        self._truncated: tp.List[bool] = []
+        self._actions: tp.List[npt.NDArray[np.int64]] = []
+        self._deltas: tp.Dict[str, tp.List[npt.NDArray]] = {}
+        self._dtypes: tp.Dict[str, str] = {}
+        self._previous: tp.Dict[str, npt.NDArray] = {}
+
+    def _record(
+        self,
+        observation: EnvironmentObservation,
+        action: Any,
+        reward: SupportsFloat,
+        terminated: bool,
+        truncated: bool,
+        *,
+        is_first: bool = False,
+    ) -> None:
+        for key, value in observation.items():
+            value = np.asarray(value)
+            bits = _as_bits(value)
+            previous = self._previous.get(key)
+            self._deltas.setdefault(key, []).append(
+                bits.copy() if previous is None else bits ^ previous
+            )
+            self._dtypes[key] = value.dtype.str
+            self._previous[key] = bits.copy()
+        self._episodes.append(self._episode)
+        self._is_first.append(is_first)
+        self._rewards.append(float(reward))
+        self._terminated.append(bool(terminated))
+        self._truncated.append(bool(truncated))
+        self._actions.append(_flatten_action(action))
+        if len(self._rewards) >= self._chunk_size:
+            self.flush()
+
+
+def load_trajectories(
+    directory: tp.Union[str, pathlib.Path],
+) -> tp.Dict[str, tp.Any]:
+    """
+    Every recorded row of `directory`, segments concatenated in order: one array per
+    column, `observations` being a dict of [n_rows, ...] arrays and `actions` a list
+    of flat int64 arrays.
+    """
+    columns: tp.Dict[str, tp.List[npt.NDArray]] = {}
+    observations: tp.Dict[str, tp.List[npt.NDArray]] = {}
+    actions: tp.List[npt.NDArray[np.int64]] = []
+    for path in sorted(pathlib.Path(directory).glob("segment_*.npz")):
+        with np.load(path) as segment:
+            for key in ("episode", "is_first", "reward", "terminated", "truncated"):
+                columns.setdefault(key, []).append(segment[key])
+            offsets = segment["action_offsets"]
+            flat = segment["action"]
+            actions.extend(
+                flat[start:end] for start, end in zip(offsets[:-1], offsets[1:])
+            )
+            for name in segment.files:
+                if not name.startswith("obs/"):
+                    continue
+                key = name.removeprefix("obs/")
+                bits = np.bitwise_xor.accumulate(segment[name], axis=0)
+                dtype = np.dtype(str(segment[f"dtype/{key}"]))
+                observations.setdefault(key, []).append(bits.view(dtype))
+
+    loaded: tp.Dict[str, tp.Any] = {
+        key: np.concatenate(values) for key, values in columns.items()
+    }
+    loaded["observations"] = {
+        key: np.concatenate(values) for key, values in observations.items()
+    }
+    loaded["actions"] = actions
+    return loaded
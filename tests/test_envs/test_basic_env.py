@@ -1,17 +1,20 @@
 import logging
+import random
 from typing import Tuple
 
 import numpy as np
 
 from src.envs.cluster_simulator.base.internal.job import Status
 from src.envs.cluster_simulator.basic import BasicClusterEnv
-from hypothesis import given, settings
+from hypothesis import given, settings, strategies as st
 
 from src.envs.cluster_simulator.base.extractors.information import ClusterInformation
 from src.envs.cluster_simulator.base.extractors.observation import ClusterObservation
 from src.scheduler.random_scheduler import RandomScheduler
 from tests.strategies.env_strategies.basic_env_st import BasicGymEnvironmentStrategies
 from src.envs.cluster_simulator.basic import EnvironmentAction
+from src.envs.cluster_simulator.actions import BatchEnvironmentAction
+from src.scheduler import FCFSScheduler
 
 
 @given(env=BasicGymEnvironmentStrategies.creation())
@@ -101,3 +104,66 @@ def test_env_run_with_random_scheduler_until_completion(env: BasicClusterEnv) ->
         current_obs, reward, terminated, truncated, current_info = env.step(action)
         assert env.observation_space.contains(current_obs)
     assert terminated and all(job.status == Status.Completed for job in cluster._jobs)
+
+
+@given(params=BasicGymEnvironmentStrategies.creation_with_schedule_option())
+def test_step_discrete_schedule(
+    params: Tuple[BasicClusterEnv, ClusterObservation, ClusterInformation, int, int],
+):
+    env, prev_obs, prev_info, m_idx, j_idx = params
+
+    action = env._discrete_convertor.encode(EnvironmentAction(False, (m_idx, j_idx)))
+    _, _, _, _, current_info = env.step(np.int64(action))
+
+    assert current_info["jobs_status"][j_idx] == Status.Running
+
+
+@given(env=BasicGymEnvironmentStrategies.creation())
+def test_step_schedule_batch(env: BasicClusterEnv):
+    env.reset()
+    cluster = env._cluster
+    scheduler = FCFSScheduler(cluster.is_allocation_possible, cluster.allocation)
+    m_indices, j_indices = scheduler.schedule_batch(cluster._machines, cluster._jobs)
+
+    _, _, _, _, info = env.step(BatchEnvironmentAction(m_indices, j_indices))
+
+    assert all(info["jobs_status"][j_idx] == Status.Running for j_idx in j_indices)
+    assert info["current_tick"] == 0
+
+
+@given(
+    env=BasicGymEnvironmentStrategies.creation(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+@settings(deadline=None)
+def test_replay_reaches_logged_step_state(
+    env: BasicClusterEnv, seed: int, data: st.DataObject
+) -> None:
+    random.seed(seed)
+    observation, _ = env.reset(seed=seed)
+    cluster = env._cluster
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    observations = [{k: np.copy(v) for k, v in observation.items()}]
+    actions = []
+    terminated = False
+    while not terminated:
+        match scheduler.schedule(cluster._machines, cluster._jobs):
+            case None:
+                action = EnvironmentAction(True, (-1, -1))
+            case m_idx, j_idx:
+                action = EnvironmentAction(False, (m_idx, j_idx))
+        observation, _, terminated, _, _ = env.step(action)
+        observations.append({k: np.copy(v) for k, v in observation.items()})
+        actions.append(action)
+
+    step = data.draw(st.integers(0, len(actions)), label="step")
+    observation, info = env.replay(seed, actions, until=step)
+
+    assert info["current_tick"] == observations[step]["current_tick"]
+    for key, value in observation.items():
+        np.testing.assert_array_equal(value, observations[step][key])
+    if step < len(actions):
+        observation, *_ = env.step(actions[step])
+        for key, value in observation.items():
+            np.testing.assert_array_equal(value, observations[step + 1][key])
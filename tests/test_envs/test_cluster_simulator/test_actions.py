@@ -0,0 +1,71 @@
+import numpy as np
+from hypothesis import given, strategies as st
+
+from src.envs.cluster_simulator.actions import (
+    ActionConvertor,
+    DilationDiscreteActionConvertor,
+    DilationEnvironmentAction,
+    DiscreteActionConvertor,
+)
+from src.envs.cluster_simulator.base.internal.cluster import ClusterAction
+
+sizes = st.integers(1, 8)
+
+
+@given(n_machines=sizes, n_jobs=sizes, data=st.data())
+def test_discrete_action_round_trip(n_machines, n_jobs, data):
+    convertor = DiscreteActionConvertor(n_machines, n_jobs)
+    space = convertor.create_space()
+    assert space.n == 1 + n_machines * n_jobs
+
+    index = data.draw(st.integers(0, space.n - 1))
+    action = convertor.decode(index)
+    assert convertor.encode(action) == index
+    assert convertor.convert(index) == ActionConvertor.convert(action)
+
+
+@given(n_machines=sizes, n_jobs=sizes)
+def test_discrete_action_decode_batch_matches_single(n_machines, n_jobs):
+    convertor = DiscreteActionConvertor(n_machines, n_jobs)
+    indices = np.arange(convertor.create_space().n)
+    skip, machines, jobs = convertor.decode_batch(indices)
+
+    for index in indices:
+        action = convertor.decode(index)
+        assert skip[index] == action.should_schedule
+        if not action.should_schedule:
+            assert (machines[index], jobs[index]) == action.schedule
+
+
+def test_discrete_action_skip_time():
+    convertor = DiscreteActionConvertor(3, 2)
+    match convertor.convert(DiscreteActionConvertor.SKIP_TIME):
+        case ClusterAction.SkipTime():
+            pass
+        case _:
+            raise AssertionError("Index 0 should skip time")
+    match convertor.convert(1 + 2 * 2 + 1):
+        case ClusterAction.Schedule(m_idx, j_idx):
+            assert (m_idx, j_idx) == (2, 1)
+        case _:
+            raise AssertionError("Index should schedule")
+
+
+@given(kernel=st.tuples(sizes, sizes), n_jobs=sizes, data=st.data())
+def test_dilation_discrete_action_round_trip(kernel, n_jobs, data):
+    convertor = DilationDiscreteActionConvertor(kernel, n_jobs)
+    space = convertor.create_space()
+    assert space.n == 2 + kernel[0] * kernel[1] * n_jobs
+
+    index = data.draw(st.integers(0, space.n - 1))
+    action = convertor.decode(index)
+    assert isinstance(action, DilationEnvironmentAction)
+    assert convertor.encode(action) == index
+
+    skip, contract, cells, jobs = convertor.decode_batch(np.array([index]))
+    assert skip[0] == action.execute_schedule_command
+    assert contract[0] == action.contract
+    if index >= 2:
+        assert tuple(cells[0]) == action.selected_machine_cell
+        assert jobs[0] == action.selected_job
+        assert 0 <= cells[0, 0] < kernel[0] and 0 <= cells[0, 1] < kernel[1]
@@ -0,0 +1,90 @@
+import random
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.deep_rm import DeepRMCreators
+from src.envs.cluster_simulator.metric_based import MetricClusterCreator
+from src.scheduler.random_scheduler import RandomScheduler
+from tests.strategies.cluster_strategies import (
+    DeepRMStrategies,
+    MetricClusterStrategies,
+)
+
+clusters = st.one_of(
+    st.builds(
+        lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+        MetricClusterStrategies.initialization_parameters(),
+        st.integers(0, 10_000),
+    ),
+    st.builds(
+        lambda params, seed: DeepRMCreators.generate_default_cluster(
+            **params, seed=seed
+        ),
+        DeepRMStrategies.initialization_parameters(),
+        st.integers(0, 10_000),
+    ),
+)
+
+
+@settings(deadline=None, max_examples=50)
+@given(cluster=clusters, seed=st.integers(0, 10_000))
+def test_recorded_ticks_match_status_transitions(cluster, seed: int) -> None:
+    random.seed(seed)
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    start = np.full(cluster.n_jobs, -1)
+    finish = np.full(cluster.n_jobs, -1)
+    curve = []
+
+    while not cluster.has_completed():
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if output is None:
+            curve.append(cluster.kpis().utilization)
+            cluster.execute_clock_tick()
+            for j_idx, job in enumerate(cluster._jobs):
+                if job.status == Status.Completed and finish[j_idx] < 0:
+                    finish[j_idx] = cluster._current_tick
+        else:
+            assert cluster.schedule(*output)
+            start[output[1]] = cluster._current_tick
+        np.testing.assert_array_equal(cluster.start_ticks, start)
+        np.testing.assert_array_equal(cluster.finish_ticks, finish)
+
+    statistics = cluster.episode_statistics(percentiles=(0, 50, 100))
+    arrival = np.array([job.arrival_time for job in cluster._jobs])
+    length = np.array([max(job.length, 1) for job in cluster._jobs])
+    slowdown = (finish - arrival) / length
+
+    assert statistics.makespan == finish.max()
+    assert np.isclose(statistics.mean_completion_time, np.mean(finish - arrival))
+    np.testing.assert_allclose(
+        statistics.slowdown_percentiles,
+        [slowdown.min(), np.median(slowdown), slowdown.max()],
+    )
+    np.testing.assert_allclose(statistics.utilization, curve, atol=1e-9)
+
+
+@settings(deadline=None)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_delayed_start_is_recorded_at_its_offset(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = MetricClusterCreator.generate_default(**params, seed=seed)
+    pending = [j for j, job in enumerate(cluster._jobs) if job.status == Status.Pending]
+    j_idx = data.draw(st.sampled_from(pending) if pending else st.nothing())
+    options = cluster.placement_options(cluster._jobs[j_idx])
+    feasible = np.argwhere(options)
+    m_idx, offset = data.draw(
+        st.sampled_from([tuple(p) for p in feasible]) if len(feasible) else st.nothing()
+    )
+
+    assert cluster.schedule_at(int(m_idx), j_idx, int(offset))
+    assert cluster.start_ticks[j_idx] == offset
+
+    assert cluster.preempt(j_idx)
+    assert cluster.start_ticks[j_idx] == -1
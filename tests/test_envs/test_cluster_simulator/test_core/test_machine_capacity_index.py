@@ -0,0 +1,81 @@
+import random
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.cluster import ClusterABC
+from src.envs.cluster_simulator.deep_rm import DeepRMCreators
+from src.envs.cluster_simulator.metric_based import MetricClusterCreator
+from src.scheduler.random_scheduler import RandomScheduler
+from tests.strategies.cluster_strategies import (
+    DeepRMStrategies,
+    MetricClusterStrategies,
+)
+
+clusters = st.one_of(
+    st.builds(
+        lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+        MetricClusterStrategies.initialization_parameters(),
+        st.integers(0, 10_000),
+    ),
+    st.builds(
+        lambda params, seed: DeepRMCreators.generate_default_cluster(
+            **params, seed=seed
+        ),
+        DeepRMStrategies.initialization_parameters(),
+        st.integers(0, 10_000),
+    ),
+)
+
+
+def assert_index_matches_scan(cluster: ClusterABC) -> None:
+    index = cluster._machines.capacity_index
+    can_run = cluster.is_allocation_possible
+    for job in cluster._jobs:
+        fitting = [
+            m_idx
+            for m_idx in range(cluster.n_machines)
+            if can_run(cluster._machines[m_idx], job)
+        ]
+        totals = [np.sum(cluster._machines[m_idx].free_space) for m_idx in fitting]
+
+        assert index.first_fit(job, can_run) == (fitting[0] if fitting else None)
+        best = index.best_fit(job, can_run)
+        if not fitting:
+            assert best is None
+        else:
+            assert best in fitting
+            assert np.sum(cluster._machines[best].free_space) == min(totals)
+
+
+@settings(deadline=None)
+@given(cluster=clusters, seed=st.integers(0, 10_000))
+def test_capacity_index_matches_linear_scan(cluster: ClusterABC, seed: int):
+    random.seed(seed)
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    assert_index_matches_scan(cluster)
+
+    for _ in range(3 * cluster.n_jobs):
+        if cluster.has_completed():
+            break
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if output is None:
+            cluster.execute_clock_tick()
+        else:
+            assert cluster.schedule(*output)
+        assert_index_matches_scan(cluster)
+
+
+def test_capacity_index_skips_placeholder_machines():
+    cluster = MetricClusterCreator.generate_default(
+        n_machines=4, n_jobs=2, n_resources=1, n_ticks=2, seed=0
+    )
+    usage = cluster._machines._machines_usage
+    usage[:2] = np.inf
+    usage[2:] = 1.0
+    cluster._machines.invalidate_capacity_index()
+    index = cluster._machines.capacity_index
+    job = cluster._jobs[0]
+
+    assert index.first_fit(job, cluster.is_allocation_possible) == 2
+    assert index.best_fit(job, cluster.is_allocation_possible) == 2
@@ -0,0 +1,73 @@
+import random
+
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from src.scheduler.random_scheduler import RandomScheduler
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+
+
+def scan_pending(cluster: MetricCluster) -> list[int]:
+    return [
+        j_idx for j_idx, job in enumerate(cluster._jobs) if job.status == Status.Pending
+    ]
+
+
+def assert_index_matches_scan(cluster: MetricCluster) -> None:
+    index = cluster._jobs.pending_index
+    pending = scan_pending(cluster)
+    jobs = cluster._jobs
+
+    assert index.by_index() == pending
+    assert list(index.by_length()) == sorted(
+        pending, key=lambda j_idx: (jobs[j_idx].length, j_idx)
+    )
+    arrivals = [jobs[j_idx].arrival_time for j_idx in index.by_arrival()]
+    assert sorted(index.by_arrival()) == pending
+    assert arrivals == sorted(arrivals)
+
+
+@settings(deadline=None)
+@given(cluster=clusters, seed=st.integers(0, 10_000))
+def test_pending_index_follows_status_transitions(cluster: MetricCluster, seed: int):
+    random.seed(seed)
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    assert_index_matches_scan(cluster)
+
+    while not cluster.has_completed():
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if output is None:
+            cluster.execute_clock_tick()
+        else:
+            assert cluster.schedule(*output)
+        assert_index_matches_scan(cluster)
+
+
+@settings(deadline=None)
+@given(cluster=clusters, cursor=st.integers(-1, 40))
+def test_pending_index_cursor_wraps_around(cluster: MetricCluster, cursor: int):
+    pending = scan_pending(cluster)
+    rotated = list(cluster._jobs.pending_index.from_cursor(cursor))
+
+    assert sorted(rotated) == pending
+    after = [j_idx for j_idx in pending if j_idx > cursor]
+    assert rotated[: len(after)] == after
+
+
+@settings(deadline=None)
+@given(cluster=clusters)
+def test_pending_index_drops_jobs_changed_behind_its_back(cluster: MetricCluster):
+    index = cluster._jobs.pending_index
+    for job in cluster._jobs:
+        if job.status == Status.Pending:
+            job.status = Status.Failed
+
+    assert list(index.by_length()) == []
+    assert len(index) == 0
@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import RunningJobsIndex, Status
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from src.scheduler.random_scheduler import RandomScheduler
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+
+
+def assert_index_matches(cluster: MetricCluster, placements: dict[int, int]) -> None:
+    index = cluster.running_jobs
+    running = {
+        j_idx for j_idx, job in enumerate(cluster._jobs) if job.status == Status.Running
+    }
+
+    assert dict(iter(index)) == placements
+    assert set(placements) == running
+    for m_idx in range(cluster.n_machines):
+        on_machine = {j for j, m in placements.items() if m == m_idx}
+        assert index.jobs_on(m_idx) == on_machine
+    expected_load = np.bincount(list(placements.values()), minlength=cluster.n_machines)
+    np.testing.assert_array_equal(index.load(cluster.n_machines), expected_load)
+
+
+@settings(deadline=None)
+@given(cluster=clusters, seed=st.integers(0, 10_000))
+def test_running_index_follows_status_transitions(cluster: MetricCluster, seed: int):
+    random.seed(seed)
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    placements: dict[int, int] = {}
+
+    for _ in range(200):
+        if cluster.has_completed():
+            break
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if placements and random.random() < 0.2:
+            j_idx = random.choice(sorted(placements))
+            if random.random() < 0.5:
+                assert cluster.preempt(j_idx)
+                del placements[j_idx]
+            else:
+                m_idx = random.randrange(cluster.n_machines)
+                if cluster.migrate(j_idx, m_idx):
+                    placements[j_idx] = m_idx
+        elif output is None:
+            cluster.execute_clock_tick()
+            placements = {
+                j_idx: m_idx
+                for j_idx, m_idx in placements.items()
+                if cluster._jobs[j_idx].status == Status.Running
+            }
+        else:
+            assert cluster.schedule(*output)
+            placements[output[1]] = output[0]
+        assert_index_matches(cluster, placements)
+
+
+def test_running_index_moves_job_between_machines():
+    index = RunningJobsIndex()
+    index.add(0, 1)
+    index.add(1, 1)
+    index.add(0, 2)
+
+    assert index.machine_of(0) == 2
+    assert index.jobs_on(1) == {1}
+    assert index.jobs_on(2) == {0}
+    assert index.remove(1) == 1
+    assert index.remove(1) is None
+    assert index.jobs_on(1) == frozenset()
+    assert len(index) == 1 and 0 in index
@@ -1,6 +1,7 @@
 from src.envs.cluster_simulator.deep_rm.internal.jobs import DeepRMJobsConvertor
 from src.envs.cluster_simulator.deep_rm.internal.machines import DeepRMMachinesConvertor
 from src.scheduler.random_scheduler import RandomScheduler
+from src.envs.cluster_simulator.base.internal.cluster import ClusterABC, ClusterAction
 from hypothesis import given, strategies as st, assume, settings, HealthCheck
 from src.envs.cluster_simulator.deep_rm import DeepRMCreators, DeepRMCluster
 from src.envs.cluster_simulator.base.internal.job import Status
@@ -361,3 +362,121 @@ def test_cluster_reset_functionality(params: dict, seed: int) -> None:
 def test_cluster_execute_with_none_possible_action(cluster: DeepRMCluster) -> None:
     with pytest.raises(RuntimeError):
         cluster.execute(5)
+
+
+@given(
+    params=DeepRMStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_feasibility_matrix_matches_is_allocation_possible(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = DeepRMCreators.generate_default_cluster(**params, seed=seed)
+    pending = [
+        j_idx for j_idx, job in enumerate(cluster._jobs) if job.status == Status.Pending
+    ]
+    assume(len(pending) > 0)
+    for j_idx in data.draw(st.lists(st.sampled_from(pending), max_size=3)):
+        cluster.schedule(data.draw(st.integers(0, cluster.n_machines - 1)), j_idx)
+
+    expected = ClusterABC.feasibility_matrix(cluster, cluster._machines, cluster._jobs)
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+
+    assert feasibility.shape == (cluster.n_machines, cluster.n_jobs)
+    np.testing.assert_array_equal(feasibility, expected)
+
+
+@settings(deadline=None)
+@given(
+    params=DeepRMStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_placement_tensor_matches_shifted_allocation_check(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = DeepRMCreators.generate_default_cluster(**params, seed=seed)
+    free = cluster._machines._machines_usage
+    rng = np.random.default_rng(data.draw(st.integers(0, 10_000), label="free_seed"))
+    free[:] = rng.random(free.shape) < data.draw(st.sampled_from([0.5, 0.9, 1.0]))
+    n_ticks = free.shape[-1]
+    jobs = list(cluster._jobs)
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+    tensor = cluster.placement_tensor(
+        cluster._jobs._job_slots, [job.length for job in jobs]
+    )
+
+    assert tensor.shape == (cluster.n_machines, cluster.n_jobs, n_ticks)
+    for j_idx, job in enumerate(jobs):
+        options = cluster.placement_options(job)
+        np.testing.assert_array_equal(tensor[:, j_idx], options)
+        np.testing.assert_array_equal(
+            options[:, 0], feasibility[:, j_idx] & (job.length <= n_ticks)
+        )
+        for m_idx in range(cluster.n_machines):
+            for offset in range(n_ticks):
+                expected = offset <= n_ticks - max(job.length, 1) and np.all(
+                    free[m_idx, ..., offset:] | ~job.usage[..., : n_ticks - offset]
+                )
+                assert options[m_idx, offset] == expected
+
+
+@settings(deadline=None)
+@given(
+    params=DeepRMStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_schedule_at_offset_occupies_shifted_timeline(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = DeepRMCreators.generate_default_cluster(**params, seed=seed)
+    pending = [j for j, job in enumerate(cluster._jobs) if job.status == Status.Pending]
+    assume(pending)
+    j_idx = data.draw(st.sampled_from(pending), label="job")
+    job = cluster._jobs[j_idx]
+    n_ticks = cluster._machines._machines_usage.shape[-1]
+    assume(job.length < n_ticks)
+    offset = data.draw(st.integers(1, n_ticks - job.length), label="offset")
+    before = cluster._machines._machines_usage[0].copy()
+
+    assert cluster.schedule_at(0, j_idx, offset)
+
+    after = cluster._machines._machines_usage[0]
+    np.testing.assert_array_equal(after[..., :offset], before[..., :offset])
+    np.testing.assert_array_equal(
+        after[..., offset:], before[..., offset:] & ~job.usage[..., : n_ticks - offset]
+    )
+    for _ in range(job.length + offset):
+        assert job.status == Status.Running
+        cluster.execute_clock_tick()
+    assert job.status == Status.Completed
+
+
+@settings(deadline=None)
+@given(
+    params=DeepRMStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_preempt_frees_delayed_or_running_profile(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = DeepRMCreators.generate_default_cluster(**params, seed=seed)
+    pending = [j for j, job in enumerate(cluster._jobs) if job.status == Status.Pending]
+    assume(pending)
+    j_idx = data.draw(st.sampled_from(pending), label="job")
+    job = cluster._jobs[j_idx]
+    n_ticks = cluster._machines._machines_usage.shape[-1]
+    assume(job.length < n_ticks)
+    offset = data.draw(st.integers(0, n_ticks - job.length), label="offset")
+    assume(cluster.schedule_at(0, j_idx, offset))
+    for _ in range(data.draw(st.integers(0, job.length + offset - 1), label="ticks")):
+        cluster.execute_clock_tick()
+
+    assert cluster.execute(ClusterAction.Preempt(j_idx))
+
+    assert job.status == Status.Pending
+    assert np.all(cluster._machines._machines_usage[0])
+    assert cluster.schedule(0, j_idx)
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from src.envs.cluster_simulator.base.internal.job import Status
@@ -12,6 +14,11 @@ from src.envs.cluster_simulator.metric_based import (
 from hypothesis import given, strategies as st, assume, settings, HealthCheck
 
 from src.scheduler.random_scheduler import RandomScheduler
+from src.envs.cluster_simulator.base.internal.cluster import ClusterABC, ClusterAction
+from src.envs.cluster_simulator.metric_based.internal.machines import MetricMachines
+from src.envs.cluster_simulator.metric_based.observation import (
+    MetricClusterObservationCreator,
+)
 from tests.strategies.cluster_strategies import MetricClusterStrategies
 from tests.test_envs.test_cluster_simulator.test_single_slot.test_single_slot_cluster import (
     seed_strategy,
@@ -218,3 +225,275 @@ def test_cluster_run_with_random_scheduler_until_completion_1(
             is_schedule_succeed = cluster.schedule(*output)
             assert is_schedule_succeed
     assert all(job.status == Status.Completed for job in cluster._jobs)
+
+
+@given(cluster=MetricClusterStrategies.creation(), data=st.data())
+def test_feasibility_matrix_matches_is_allocation_possible(
+    cluster: MetricCluster, data: st.DataObject
+) -> None:
+    usage = cluster._machines._machines_usage
+    usage[:] = data.draw(
+        st.sampled_from([0.2, 0.5, 0.9]), label="free_space"
+    ) * np.ones_like(usage)
+
+    expected = ClusterABC.feasibility_matrix(cluster, cluster._machines, cluster._jobs)
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+
+    assert feasibility.shape == (cluster.n_machines, cluster.n_jobs)
+    np.testing.assert_array_equal(feasibility, expected)
+
+
+@settings(deadline=None)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_schedule_batch_matches_sequential_schedule(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    vectorized = MetricClusterCreator.generate_default(**params, seed=seed)
+    sequential = MetricClusterCreator.generate_default(**params, seed=seed)
+    vectorized._machines._machines_usage[:] = sequential._machines._machines_usage[
+        :
+    ] = data.draw(st.sampled_from([0.5, 1.0, 2.0]), label="free_space")
+    n_pairs = data.draw(st.integers(0, 3 * vectorized.n_jobs), label="n_pairs")
+    m_indices = data.draw(
+        st.lists(
+            st.integers(0, vectorized.n_machines - 1),
+            min_size=n_pairs,
+            max_size=n_pairs,
+        ),
+        label="machines",
+    )
+    j_indices = data.draw(
+        st.lists(
+            st.integers(0, vectorized.n_jobs - 1), min_size=n_pairs, max_size=n_pairs
+        ),
+        label="jobs",
+    )
+
+    scheduled = vectorized.schedule_batch(m_indices, j_indices)
+    expected = ClusterABC.schedule_batch(sequential, m_indices, j_indices)
+
+    assert np.array_equal(scheduled, expected)
+    assert np.allclose(
+        vectorized._machines._machines_usage, sequential._machines._machines_usage
+    )
+    assert [job.status for job in vectorized._jobs] == [
+        job.status for job in sequential._jobs
+    ]
+    assert list(vectorized._jobs.pending_index.by_arrival()) == list(
+        sequential._jobs.pending_index.by_arrival()
+    )
+
+
+@settings(deadline=None)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_placement_options_match_shifted_allocation_check(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = MetricClusterCreator.generate_default(**params, seed=seed)
+    usage = cluster._machines._machines_usage
+    usage[:] = data.draw(
+        st.lists(
+            st.sampled_from([0.05, 0.5, 1.0]),
+            min_size=usage.size,
+            max_size=usage.size,
+        ).map(lambda values: np.reshape(values, usage.shape)),
+        label="free_space",
+    )
+    n_ticks = usage.shape[-1]
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+
+    for j_idx, job in enumerate(cluster._jobs):
+        options = cluster.placement_options(job)
+        assert np.array_equal(options[:, 0], feasibility[:, j_idx])
+        for m_idx in range(cluster.n_machines):
+            for offset in range(n_ticks):
+                expected = offset <= n_ticks - max(job.length, 1) and np.all(
+                    usage[m_idx, :, offset:] > job.usage[:, : n_ticks - offset]
+                )
+                assert options[m_idx, offset] == expected
+        earliest = cluster.earliest_start(job)
+        assert np.array_equal(
+            earliest, [row.argmax() if row.any() else -1 for row in options]
+        )
+
+
+@settings(deadline=None)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_schedule_at_offset_holds_machine_until_profile_ends(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = MetricClusterCreator.generate_default(**params, seed=seed)
+    pending = [j for j, job in enumerate(cluster._jobs) if job.status == Status.Pending]
+    assume(pending)
+    j_idx = data.draw(st.sampled_from(pending), label="job")
+    job = cluster._jobs[j_idx]
+    n_ticks = cluster._machines._machines_usage.shape[-1]
+    assume(job.length < n_ticks)
+    offset = data.draw(st.integers(1, n_ticks - job.length), label="offset")
+    before = cluster._machines._machines_usage[0].copy()
+
+    assert cluster.execute(ClusterAction.ScheduleAt(0, j_idx, offset))
+
+    after = cluster._machines._machines_usage[0]
+    assert np.array_equal(after[:, :offset], before[:, :offset])
+    assert np.allclose(
+        after[:, offset:], before[:, offset:] - job.usage[:, : n_ticks - offset]
+    )
+    for _ in range(job.length + offset):
+        assert job.status == Status.Running
+        cluster.execute_clock_tick()
+    assert job.status == Status.Completed
+    assert not cluster.schedule_at(0, j_idx, offset)
+
+
+@settings(deadline=None)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_preempt_releases_remaining_profile_and_requeues_job(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = MetricClusterCreator.generate_default(**params, seed=seed)
+    pending = [j for j, job in enumerate(cluster._jobs) if job.status == Status.Pending]
+    assume(pending)
+    j_idx = data.draw(st.sampled_from(pending), label="job")
+    job = cluster._jobs[j_idx]
+    untouched = cluster._machines._machines_usage[0].copy()
+    assume(cluster.schedule(0, j_idx))
+    n_ticks = data.draw(st.integers(0, max(job.length - 1, 0)), label="ticks")
+    for _ in range(n_ticks):
+        cluster.execute_clock_tick()
+        untouched[:, :-1] = untouched[:, 1:]
+        untouched[:, -1] = MetricMachines.CAPACITY
+
+    assert cluster.execute(ClusterAction.Preempt(j_idx))
+
+    assert job.status == Status.Pending
+    assert j_idx in cluster._jobs.pending_index
+    assert j_idx not in cluster.running_jobs
+    assert np.allclose(cluster._machines._machines_usage[0], untouched)
+    assert not cluster.preempt(j_idx)
+
+
+@settings(deadline=None)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    data=st.data(),
+)
+def test_migrate_moves_running_job_to_target_machine(
+    params: dict, seed: int, data: st.DataObject
+) -> None:
+    cluster = MetricClusterCreator.generate_default(**params, seed=seed)
+    assume(cluster.n_machines > 1)
+    pending = [j for j, job in enumerate(cluster._jobs) if job.status == Status.Pending]
+    assume(pending)
+    j_idx = data.draw(st.sampled_from(pending), label="job")
+    job = cluster._jobs[j_idx]
+    expected = cluster._machines._machines_usage.copy()
+    assume(cluster.schedule(0, j_idx))
+    target = data.draw(st.integers(1, cluster.n_machines - 1), label="target")
+    assume(cluster.is_allocation_possible(cluster._machines[target], job))
+
+    assert cluster.execute(ClusterAction.Migrate(j_idx, target))
+
+    usage = cluster._machines._machines_usage
+    assert cluster.running_jobs.machine_of(j_idx) == target
+    assert np.allclose(usage[0], expected[0])
+    assert np.allclose(usage[target], expected[target] - job.usage)
+    assert not cluster.migrate(j_idx, target)
+    for _ in range(job.length):
+        assert job.status == Status.Running
+        cluster.execute_clock_tick()
+    assert job.status == Status.Completed
+    assert not cluster.execute(ClusterAction.Migrate(j_idx, 0))
+
+
+@settings(deadline=None, max_examples=50)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    dtype=st.sampled_from([np.float32, np.float16]),
+)
+def test_reduced_precision_cluster_keeps_its_dtype(
+    params: dict, seed: int, dtype: type
+) -> None:
+    cluster = MetricClusterCreator.generate_default(**params, seed=seed, dtype=dtype)
+    reference = MetricClusterCreator.generate_default(**params, seed=seed)
+    obs_creator = MetricClusterObservationCreator()
+    space = obs_creator.create_space(cluster)
+
+    assert space["machines"].dtype == space["jobs_usage"].dtype == dtype
+    np.testing.assert_allclose(
+        cluster._jobs._job_slots, reference._jobs._job_slots, rtol=1e-3
+    )
+    if dtype == np.float32:
+        np.testing.assert_array_equal(
+            cluster.feasibility_matrix(cluster._machines, cluster._jobs),
+            reference.feasibility_matrix(reference._machines, reference._jobs),
+        )
+
+    random.seed(seed)
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    while not cluster.has_completed():
+        assert space.contains(obs_creator.create(cluster))
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if output is None:
+            cluster.execute_clock_tick()
+        else:
+            assert cluster.schedule(*output)
+        assert cluster._machines._machines_usage.dtype == dtype
+        assert cluster._jobs._job_slots.dtype == dtype
+
+
+@settings(deadline=None, max_examples=50)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    dtype=st.sampled_from([np.uint8, np.uint16]),
+)
+def test_quantized_cluster_accounts_capacity_exactly(
+    params: dict, seed: int, dtype: type
+) -> None:
+    cluster = MetricClusterCreator.generate_default(**params, seed=seed, dtype=dtype)
+    obs_creator = MetricClusterObservationCreator()
+    space = obs_creator.create_space(cluster)
+    capacity = np.iinfo(dtype).max
+
+    assert cluster._machines.capacity == capacity
+    assert np.all(cluster._machines._machines_usage == capacity)
+
+    random.seed(seed)
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    while not cluster.has_completed():
+        assert space.contains(obs_creator.create(cluster))
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if output is None:
+            cluster.execute_clock_tick()
+            continue
+        m_idx, j_idx = output
+        before = cluster._machines._machines_usage.copy()
+        assert cluster.schedule(m_idx, j_idx)
+        after = cluster._machines._machines_usage
+        assert after.dtype == dtype
+        np.testing.assert_array_equal(
+            after[m_idx], before[m_idx] - cluster._jobs._job_slots[j_idx]
+        )
+        assert cluster.preempt(j_idx)
+        np.testing.assert_array_equal(cluster._machines._machines_usage, before)
+        assert cluster.schedule(m_idx, j_idx)
+    assert np.all(cluster.kpis().utilization == 0)
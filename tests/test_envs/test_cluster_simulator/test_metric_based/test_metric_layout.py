@@ -0,0 +1,96 @@
+import numpy as np
+from hypothesis import given, strategies as st, settings, HealthCheck, assume
+
+from src.envs.cluster_simulator.base.internal.dilation import DilationState
+from src.envs.cluster_simulator.metric_based.internal.dilation import MetricBasedDilator
+from src.envs.cluster_simulator.metric_based.internal.layout import (
+    FreeCapacityLayout,
+    HilbertCurveLayout,
+    RowMajorLayout,
+    TopologyLayout,
+)
+
+machines_strategy = st.builds(
+    lambda n_machines, n_resources, n_ticks: np.random.rand(
+        n_machines, n_resources, n_ticks
+    ),
+    n_machines=st.integers(1, 60),
+    n_resources=st.integers(1, 3),
+    n_ticks=st.integers(2, 4),
+)
+
+layout_strategy = st.sampled_from(
+    [RowMajorLayout(), HilbertCurveLayout(), FreeCapacityLayout()]
+)
+
+
+def navigate_to_machine(dilator: MetricBasedDilator, m_idx: int) -> int:
+    position = int(np.flatnonzero(dilator._machine_permutation == m_idx)[0])
+    x, y = divmod(position, dilator._original_grid_shape[1])
+    k_x, k_y = dilator.get_kernel()
+    while not isinstance(dilator.state, DilationState.FullyExpanded):
+        level = dilator.state.level
+        dilator.expand(((x // k_x**level) % k_x, (y // k_y**level) % k_y))
+    return dilator.get_selected_machine((x % k_x, y % k_y))
+
+
+@given(machines=machines_strategy, layout=layout_strategy)
+def test_layout_permutation_is_a_bijection(machines, layout):
+    n_machines = machines.shape[0]
+    permutation = layout.permutation(machines)
+    grid_x, grid_y = layout.grid_shape(n_machines)
+
+    assert permutation.shape == (grid_x * grid_y,)
+    assert np.array_equal(np.sort(permutation), np.arange(grid_x * grid_y))
+    assert np.all(permutation[np.isin(permutation, np.arange(n_machines))] < n_machines)
+
+
+@given(
+    machines=machines_strategy,
+    layout=layout_strategy,
+    kernel=st.tuples(st.integers(2, 3), st.integers(2, 3)),
+    data=st.data(),
+)
+@settings(suppress_health_check=[HealthCheck.filter_too_much], deadline=None)
+def test_selected_machine_follows_layout(machines, layout, kernel, data):
+    grid_x, grid_y = layout.grid_shape(machines.shape[0])
+    assume(grid_x >= kernel[0] and grid_y >= kernel[1])
+    dilator = MetricBasedDilator.from_machines(
+        machines, layout=layout, kernel=kernel, operation=np.max
+    )
+    assume(dilator._n_levels > 1)
+    m_idx = data.draw(st.integers(0, machines.shape[0] - 1))
+
+    assert navigate_to_machine(dilator, m_idx) == m_idx
+
+
+def test_hilbert_layout_fills_blocks_contiguously():
+    machines = np.ones((16, 1, 2))
+    permutation = HilbertCurveLayout().permutation(machines)
+    grid = permutation.reshape(4, 4)
+
+    for block_x in range(2):
+        for block_y in range(2):
+            block = grid[2 * block_x : 2 * block_x + 2, 2 * block_y : 2 * block_y + 2]
+            assert np.ptp(block // 4) == 0, "Consecutive machines share a 2x2 block"
+
+
+def test_free_capacity_layout_groups_free_machines():
+    machines = np.zeros((16, 2, 3))
+    free_machines = np.array([3, 7, 11, 15])
+    machines[free_machines] = 1.0
+    dilator = MetricBasedDilator.from_machines(
+        machines, layout=FreeCapacityLayout(), kernel=(2, 2), operation=np.max
+    )
+
+    assert np.all(dilator.state.value[0, 0] == 1.0)
+    assert np.all(dilator.state.value.reshape(4, -1)[1:] == 0.0)
+
+
+def test_topology_layout_groups_machines_by_label():
+    racks = [0, 1, 0, 1, 0, 1, 0, 1]
+    machines = np.ones((8, 1, 2))
+    permutation = TopologyLayout(racks, grid_shape=(2, 4)).permutation(machines)
+
+    assert set(permutation.reshape(2, 4)[:, :2].ravel()) == {0, 2, 4, 6}
+    assert set(permutation.reshape(2, 4)[:, 2:].ravel()) == {1, 3, 5, 7}
@@ -275,3 +275,107 @@ def test_global_cell_from_local(
 
     assert global_cell[0] >= 0
     assert global_cell[1] >= 0
+
+
+batch_array_strategy = st.builds(
+    lambda batch, m_x, m_y, n_res, n_ticks: np.random.rand(
+        batch, m_x, m_y, n_res, n_ticks
+    ).astype(np.float64),
+    batch=st.integers(min_value=1, max_value=6),
+    m_x=st.integers(min_value=1, max_value=20),
+    m_y=st.integers(min_value=1, max_value=20),
+    n_res=st.integers(min_value=1, max_value=4),
+    n_ticks=st.integers(min_value=1, max_value=4),
+)
+
+
+@given(
+    array=batch_array_strategy,
+    kernel=kernel_strategy,
+    fill_value=st.floats(-10, 10),
+    operation=reduction_operation_strategy,
+)
+@settings(suppress_health_check=[HealthCheck.filter_too_much], deadline=None)
+def test_batch_hierarchical_pooling_matches_single(
+    array: npt.NDArray[tp.Any],
+    kernel: tp.Tuple[int, int],
+    fill_value: float,
+    operation: tp.Callable,
+):
+    m_x, m_y = array.shape[1:3]
+    assume(m_x > kernel[0] and m_y > kernel[1])
+
+    batch_outputs = array_operations.batch_hierarchical_pooling(
+        array, kernel, operation=operation, fill_value=fill_value
+    )
+
+    for b_idx in range(array.shape[0]):
+        single_outputs = array_operations.hierarchical_pooling(
+            array[b_idx], kernel, operation=operation, fill_value=fill_value
+        )
+        assert len(single_outputs) == len(batch_outputs)
+        for single_level, batch_level in zip(single_outputs, batch_outputs):
+            assert np.allclose(single_level, batch_level[b_idx])
+
+
+@given(
+    array=batch_array_strategy,
+    kernel=kernel_strategy,
+    operation=reduction_operation_strategy,
+    data=st.data(),
+)
+@settings(suppress_health_check=[HealthCheck.filter_too_much], deadline=None)
+def test_batch_get_window_from_cell_matches_single(
+    array: npt.NDArray[tp.Any],
+    kernel: tp.Tuple[int, int],
+    operation: tp.Callable,
+    data: st.DataObject,
+):
+    m_x, m_y = array.shape[1:3]
+    assume(m_x > kernel[0] and m_y > kernel[1])
+
+    batch_outputs = array_operations.batch_hierarchical_pooling(
+        array, kernel, operation=operation
+    )
+    max_level = len(batch_outputs) - 1
+    assume(max_level > 0)
+
+    level = data.draw(st.integers(1, max_level))
+    n_cells_x, n_cells_y = batch_outputs[level].shape[1:3]
+    cells = np.array(
+        data.draw(
+            st.lists(
+                st.tuples(st.integers(0, n_cells_x - 1), st.integers(0, n_cells_y - 1)),
+                min_size=array.shape[0],
+                max_size=array.shape[0],
+            )
+        )
+    )
+
+    windows = array_operations.batch_get_window_from_cell(
+        batch_outputs, level, cells, kernel
+    )
+
+    assert windows.shape == (array.shape[0], *kernel, *array.shape[3:])
+    for b_idx, cell in enumerate(cells):
+        single_outputs = [output[b_idx] for output in batch_outputs]
+        expected = array_operations.get_window_from_cell(
+            single_outputs, level, tuple(cell), kernel
+        )
+        assert np.allclose(windows[b_idx], expected)
+
+
+@given(
+    values=st.lists(st.floats(0.0, 1.0), min_size=1, max_size=50),
+    dtype=st.sampled_from([np.uint8, np.uint16]),
+)
+def test_to_fixed_point_rounds_demands_up_to_whole_quanta(
+    values: tp.List[float], dtype: type
+):
+    quanta = array_operations.to_fixed_point(values, dtype)
+    capacity = array_operations.cell_capacity(dtype)
+
+    assert quanta.dtype == dtype
+    assert capacity == np.iinfo(dtype).max
+    assert np.all(quanta / capacity >= np.asarray(values) - 1e-12)
+    assert np.all(quanta / capacity < np.asarray(values) + 1 / capacity + 1e-12)
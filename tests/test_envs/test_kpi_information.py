@@ -0,0 +1,66 @@
+import random
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.extractors.information import (
+    KPIInformationExtractor,
+)
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.basic import BasicClusterEnv, EnvironmentAction
+from src.scheduler.random_scheduler import RandomScheduler
+from tests.strategies.env_strategies.basic_env_st import BasicGymEnvironmentStrategies
+
+
+def expected_capacity_kpis(machines: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    machines = np.asarray(machines, dtype=np.float64)
+    n_resources = machines.shape[1] if machines.ndim > 1 else 1
+    utilization, fragmentation = [], []
+    for r_idx in range(n_resources):
+        free = []
+        for machine in machines:
+            if not np.all(np.isfinite(machine)):
+                continue
+            now = machine if machine.ndim == 0 else machine[r_idx, ..., 0]
+            free.append(float(np.mean(now)))
+        utilization.append(1.0 - np.mean(free) if free else 0.0)
+        total = sum(free)
+        fragmentation.append(1.0 - max(free) / total if total > 0 else 0.0)
+    return np.array(utilization), np.array(fragmentation)
+
+
+@settings(deadline=None, max_examples=50)
+@given(env=BasicGymEnvironmentStrategies.creation(), seed=st.integers(0, 10_000))
+def test_kpi_information_matches_cluster_scan(env: BasicClusterEnv, seed: int) -> None:
+    random.seed(seed)
+    env._info_builder = KPIInformationExtractor()
+    env._info_builder.attach(env._cluster)
+    obs, info = env.reset(seed=seed)
+    cluster = env._cluster
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    waits: list[int] = []
+
+    terminated = False
+    while not terminated:
+        pending = [
+            j for j, job in enumerate(cluster._jobs) if job.status == Status.Pending
+        ]
+        utilization, fragmentation = expected_capacity_kpis(obs["machines"])
+
+        assert info["queue_length"] == len(pending)
+        assert info["mean_wait_time"] == (np.mean(waits) if waits else 0.0)
+        np.testing.assert_allclose(info["utilization_per_resource"], utilization)
+        np.testing.assert_allclose(info["fragmentation"], fragmentation, atol=1e-12)
+        running = [
+            j for j, job in enumerate(cluster._jobs) if job.status == Status.Running
+        ]
+        assert info["running_jobs_per_machine"].sum() == len(running)
+
+        match scheduler.schedule(cluster._machines, cluster._jobs):
+            case None:
+                action = EnvironmentAction(True, (-1, -1))
+            case m_idx, j_idx:
+                action = EnvironmentAction(False, (m_idx, j_idx))
+                job = cluster._jobs[j_idx]
+                waits.append(cluster._current_tick - job.arrival_time)
+        obs, _, terminated, _, info = env.step(action)
@@ -0,0 +1,58 @@
+import random
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.extractors.reward import (
+    DifferentInPendingJobsRewardCaculator,
+    MakespanRewardCaculator,
+    QueueLengthRewardCaculator,
+    SlowdownRewardCaculator,
+    UtilizationRewardCaculator,
+    WeightedRewardCaculator,
+)
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.basic import BasicClusterEnv, EnvironmentAction
+from src.scheduler.random_scheduler import RandomScheduler
+from tests.strategies.env_strategies.basic_env_st import BasicGymEnvironmentStrategies
+
+
+@settings(deadline=None, max_examples=50)
+@given(env=BasicGymEnvironmentStrategies.creation(), seed=st.integers(0, 10_000))
+def test_rewards_match_per_job_loops(env: BasicClusterEnv, seed: int) -> None:
+    random.seed(seed)
+    _, prev_info = env.reset(seed=seed)
+    cluster = env._cluster
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+    slowdown, makespan = SlowdownRewardCaculator(), MakespanRewardCaculator()
+    queue, utilization = QueueLengthRewardCaculator(), UtilizationRewardCaculator()
+    weighted = WeightedRewardCaculator([(1.0, slowdown), (0.5, queue)])
+
+    np.testing.assert_array_equal(
+        prev_info["jobs_length"], [job.length for job in cluster._jobs]
+    )
+    terminated = False
+    while not terminated:
+        prev_statuses = [job.status for job in cluster._jobs]
+        match scheduler.schedule(cluster._machines, cluster._jobs):
+            case None:
+                action = EnvironmentAction(True, (-1, -1))
+            case m_idx, j_idx:
+                action = EnvironmentAction(False, (m_idx, j_idx))
+        _, reward, terminated, _, info = env.step(action)
+        elapsed = int(action.should_schedule)
+
+        assert reward == DifferentInPendingJobsRewardCaculator()(prev_info, info)
+        expected_slowdown = -elapsed * sum(
+            1 / max(job.length, 1)
+            for job, status in zip(cluster._jobs, prev_statuses)
+            if status in (Status.Pending, Status.Running)
+        )
+        assert np.isclose(slowdown(prev_info, info), expected_slowdown)
+        all_done = all(status == Status.Completed for status in prev_statuses)
+        assert makespan(prev_info, info) == (0.0 if all_done else -elapsed)
+        pending = sum(job.status == Status.Pending for job in cluster._jobs)
+        assert queue(prev_info, info) == -pending
+        assert 0.0 <= utilization(prev_info, info) <= 1.0
+        assert np.isclose(weighted(prev_info, info), expected_slowdown - 0.5 * pending)
+        prev_info = info
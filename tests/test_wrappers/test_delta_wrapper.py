@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.actions import EnvironmentAction
+from src.envs.cluster_simulator.basic import BasicClusterEnv
+from src.scheduler.random_scheduler import RandomScheduler
+from src.wrappers.cluster_simulator.delta_wrapper import (
+    DeltaObservationDecoder,
+    DeltaObservationWrapper,
+)
+from tests.strategies.env_strategies.basic_env_st import BasicGymEnvironmentStrategies
+
+
+@settings(deadline=None, max_examples=50)
+@given(env=BasicGymEnvironmentStrategies.creation(), seed=st.integers(0, 10_000))
+def test_decoded_deltas_match_full_observations(env: BasicClusterEnv, seed: int):
+    random.seed(seed)
+    wrapper = DeltaObservationWrapper(env)
+    decoder = DeltaObservationDecoder()
+    cluster = env._cluster
+    scheduler = RandomScheduler(cluster.is_allocation_possible)
+
+    for episode in range(2):
+        delta, _ = wrapper.reset(seed=seed + episode)
+        assert delta["keyframe"]
+        decoded = decoder.apply(delta)
+        terminated = False
+        while True:
+            expected = env._obs_creator.create(cluster)
+            assert decoded.keys() == expected.keys()
+            for key, value in expected.items():
+                np.testing.assert_array_equal(decoded[key], value)
+            if terminated:
+                break
+            match scheduler.schedule(cluster._machines, cluster._jobs):
+                case None:
+                    action = EnvironmentAction(True, (-1, -1))
+                case m_idx, j_idx:
+                    action = EnvironmentAction(False, (m_idx, j_idx))
+            delta, _, terminated, _, _ = wrapper.step(action)
+            assert not delta["keyframe"]
+            if not action.should_schedule:
+                assert delta["machine_indices"].tolist() in ([], [action.schedule[0]])
+                assert delta["job_indices"].tolist() == [action.schedule[1]]
+            decoded = decoder.apply(delta)
+
+
+def test_decoder_requires_keyframe_first():
+    decoder = DeltaObservationDecoder()
+    with pytest.raises(ValueError):
+        decoder.apply(
+            dict(
+                keyframe=False,
+                machine_indices=np.zeros(0, dtype=np.int64),
+                machines=np.zeros((0, 2)),
+                job_indices=np.zeros(0, dtype=np.int64),
+                jobs_status=np.zeros(0),
+                changed={},
+            )
+        )
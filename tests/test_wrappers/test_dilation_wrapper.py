@@ -8,6 +8,7 @@ from src.envs.cluster_simulator.metric_based.internal.dilation import MetricBase
 from src.wrappers.cluster_simulator.dilation_wrapper import (
     DilatorWrapper,
     DilationEnvironmentAction,
+    DilationDiscreteActionConvertor,
 )
 from typing import Tuple, Type
 from hypothesis import given, settings, HealthCheck, assume
@@ -19,7 +20,17 @@ from src.scheduler.random_scheduler import RandomScheduler
 from tests.strategies.dilation_strategies.metric_cluster_dilator_st import (
     MetricClusterDilationStrategies,
 )
-from src.envs.cluster_simulator.metric_based import MetricMachines
+from src.envs.cluster_simulator.metric_based import MetricMachines, MetricClusterCreator
+from src.envs import BasicClusterEnv
+from src.envs.cluster_simulator.base.extractors.information import (
+    BaceClusterInformationExtractor,
+)
+from src.envs.cluster_simulator.base.extractors.reward import (
+    DifferentInPendingJobsRewardCaculator,
+)
+from src.envs.cluster_simulator.metric_based.observation import (
+    MetricClusterObservationCreator,
+)
 import numpy.typing as npt
 
 DILATOR_CLASS_OPTIONS: Tuple[Type[AbstractDilation], ...] = (MetricBasedDilator,)
@@ -80,3 +91,135 @@ def test_example_simple_run(env: DilatorWrapper):
         job.status in (Status.Running, Status.Completed) for job in cluster._jobs
     )
     logging.info("All jobs are completed")
+
+
+def create_auto_descend_env(n_machines: int) -> DilatorWrapper:
+    cluster = MetricClusterCreator.generate_default(
+        n_machines=n_machines, n_jobs=4, n_resources=2, n_ticks=3, seed=0
+    )
+    base_env = BasicClusterEnv(
+        cluster,
+        reward_caculator=DifferentInPendingJobsRewardCaculator(),
+        info_builder=BaceClusterInformationExtractor(),
+        obs_extractor=MetricClusterObservationCreator(),
+    )
+    return DilatorWrapper(
+        base_env,
+        dilator_cls=MetricBasedDilator,
+        auto_descend=True,
+        kernel=(2, 2),
+        operation=np.max,
+    )
+
+
+def observe_single_free_machine(env: DilatorWrapper, m_idx: int) -> None:
+    cluster = env.env._cluster
+    cluster._machines._machines_usage[:] = 0.0
+    cluster._machines._machines_usage[m_idx] = 1.0
+    env.update_and_convert_observation(env.env._obs_creator.create(cluster))
+
+
+def test_auto_descend_reaches_single_free_machine():
+    env = create_auto_descend_env(n_machines=64)
+    env.reset(seed=0)
+    observe_single_free_machine(env, m_idx=37)
+
+    assert isinstance(env._dilator.state, DilationState.FullyExpanded)
+    (cell,) = np.argwhere(env._dilator.get_candidate_cells())
+    assert env._dilator.get_selected_machine(tuple(cell)) == 37
+
+
+def test_auto_descend_keeps_levels_with_several_choices():
+    env = create_auto_descend_env(n_machines=64)
+    obs, _ = env.reset(seed=0)
+
+    assert isinstance(env._dilator.state, DilationState.Initial)
+    assert np.count_nonzero(env._dilator.get_candidate_cells()) == 4
+
+
+def test_auto_descend_contract_climbs_over_trivial_levels():
+    env = create_auto_descend_env(n_machines=64)
+    env.reset(seed=0)
+    observe_single_free_machine(env, m_idx=37)
+
+    env.step(DilationEnvironmentAction((0, 0), 0, False, True))
+
+    assert isinstance(env._dilator.state, DilationState.Initial)
+
+
+def test_padded_cells_are_not_candidates():
+    env = create_auto_descend_env(n_machines=5)
+    env.reset(seed=0)
+
+    expected_mask = np.array([[True, False], [True, False]])
+    assert np.array_equal(env._dilator.get_window_mask(), expected_mask)
+    assert np.array_equal(env._dilator.get_candidate_cells(), expected_mask)
+
+
+def test_feasibility_heatmap_pools_pending_jobs_with_or():
+    cluster = MetricClusterCreator.generate_default(
+        n_machines=16, n_jobs=3, n_resources=2, n_ticks=3, seed=0
+    )
+    base_env = BasicClusterEnv(
+        cluster,
+        reward_caculator=DifferentInPendingJobsRewardCaculator(),
+        info_builder=BaceClusterInformationExtractor(),
+        obs_extractor=MetricClusterObservationCreator(),
+    )
+    env = DilatorWrapper(
+        base_env,
+        dilator_cls=MetricBasedDilator,
+        feasibility=True,
+        kernel=(2, 2),
+        operation=np.max,
+    )
+    obs, _ = env.reset(seed=0)
+    usage = cluster._machines._machines_usage
+    usage[:] = 0.0
+    usage[13] = 1.0
+    obs = env.update_and_convert_observation(base_env._obs_creator.create(cluster))
+
+    pending = np.array([job.status == Status.Pending for job in cluster._jobs])
+    feasible_jobs = obs["feasible_jobs"]
+    assert env.observation_space["feasible_jobs"].contains(feasible_jobs)
+    # Machine 13 sits on grid cell (3, 1) that belongs to the top-level block (1, 0)
+    assert np.array_equal(feasible_jobs[1, 0], pending)
+    assert not feasible_jobs[0, 0].any()
+    assert not feasible_jobs[:, 1].any()
+
+    obs, *_ = env.step(DilationEnvironmentAction((1, 0), 0, False, False))
+    assert np.array_equal(obs["feasible_jobs"][1, 1], pending)
+    assert np.count_nonzero(obs["feasible_jobs"].any(axis=-1)) == 1
+
+
+def test_discrete_actions_match_tuple_actions():
+    cluster = MetricClusterCreator.generate_default(
+        n_machines=16, n_jobs=3, n_resources=2, n_ticks=3, seed=0
+    )
+    base_env = BasicClusterEnv(
+        cluster,
+        reward_caculator=DifferentInPendingJobsRewardCaculator(),
+        info_builder=BaceClusterInformationExtractor(),
+        obs_extractor=MetricClusterObservationCreator(),
+    )
+    env = DilatorWrapper(
+        base_env,
+        dilator_cls=MetricBasedDilator,
+        discrete_actions=True,
+        kernel=(2, 2),
+        operation=np.max,
+    )
+    env.reset(seed=0)
+    assert env.action_space.n == 2 + 2 * 2 * 3
+
+    expand = env._discrete_convertor.encode(
+        DilationEnvironmentAction((1, 0), 0, False, False)
+    )
+    obs, *_ = env.step(expand)
+    assert isinstance(env._dilator.state, DilationState.FullyExpanded)
+
+    obs, *_ = env.step(DilationDiscreteActionConvertor.CONTRACT)
+    assert isinstance(env._dilator.state, DilationState.Initial)
+
+    _, _, _, _, info = env.step(DilationDiscreteActionConvertor.SKIP_TIME)
+    assert info["current_tick"] == 1
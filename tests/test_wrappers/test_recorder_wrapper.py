@@ -0,0 +1,63 @@
+import random
+import tempfile
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.actions import EnvironmentAction
+from src.envs.cluster_simulator.basic import BasicClusterEnv
+from src.scheduler.random_scheduler import RandomScheduler
+from src.wrappers.cluster_simulator.recorder_wrapper import (
+    TrajectoryRecorderWrapper,
+    load_trajectories,
+)
+from tests.strategies.env_strategies.basic_env_st import BasicGymEnvironmentStrategies
+
+
+@settings(deadline=None, max_examples=30)
+@given(
+    env=BasicGymEnvironmentStrategies.creation(),
+    chunk_size=st.integers(1, 16),
+    seed=st.integers(0, 10_000),
+)
+def test_recorded_trajectories_round_trip(
+    env: BasicClusterEnv, chunk_size: int, seed: int
+) -> None:
+    random.seed(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = TrajectoryRecorderWrapper(env, directory, chunk_size=chunk_size)
+        cluster = env._cluster
+        scheduler = RandomScheduler(cluster.is_allocation_possible)
+        observations, actions, rewards, episodes = [], [], [], []
+
+        for episode in range(2):
+            observation, _ = recorder.reset(seed=seed + episode)
+            observations.append({k: np.copy(v) for k, v in observation.items()})
+            actions.append([])
+            rewards.append(0.0)
+            episodes.append(episode)
+            terminated = False
+            while not terminated:
+                match scheduler.schedule(cluster._machines, cluster._jobs):
+                    case None:
+                        action = EnvironmentAction(True, (-1, -1))
+                    case m_idx, j_idx:
+                        action = EnvironmentAction(False, (m_idx, j_idx))
+                observation, reward, terminated, _, _ = recorder.step(action)
+                observations.append({k: np.copy(v) for k, v in observation.items()})
+                actions.append([int(action[0]), *action[1]])
+                rewards.append(float(reward))
+                episodes.append(episode)
+        recorder.close()
+
+        loaded = load_trajectories(directory)
+
+    assert loaded["episode"].tolist() == episodes
+    assert loaded["is_first"].tolist() == [not a for a in actions]
+    assert loaded["terminated"].sum() == 2
+    np.testing.assert_array_equal(loaded["reward"], rewards)
+    assert [a.tolist() for a in loaded["actions"]] == actions
+    for key, values in loaded["observations"].items():
+        expected = np.stack([observation[key] for observation in observations])
+        assert values.dtype == expected.dtype
+        np.testing.assert_array_equal(values, expected)
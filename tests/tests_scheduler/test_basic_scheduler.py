@@ -1 +1,82 @@
-## TODO: Implement
+import random
+
+import numpy as np
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.cluster import ClusterAction
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from src.scheduler import (
+    BestFitScheduler,
+    FCFSScheduler,
+    FirstFitScheduler,
+    RoundRobinScheduler,
+    SJFScheduler,
+)
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+scheduler_types = st.sampled_from(
+    [BestFitScheduler, FCFSScheduler, FirstFitScheduler, SJFScheduler]
+)
+
+
+@settings(deadline=None)
+@given(
+    params=MetricClusterStrategies.initialization_parameters(),
+    seed=st.integers(0, 10_000),
+    scheduler_type=scheduler_types,
+)
+def test_schedule_batch_matches_step_by_step(params, seed, scheduler_type):
+    batched = MetricClusterCreator.generate_default(**params, seed=seed)
+    stepped = MetricClusterCreator.generate_default(**params, seed=seed)
+    batch_scheduler = scheduler_type(batched.is_allocation_possible, batched.allocation)
+    step_scheduler = scheduler_type(stepped.is_allocation_possible)
+
+    while not stepped.has_completed():
+        m_indices, j_indices = batch_scheduler.schedule_batch(
+            batched._machines, batched._jobs
+        )
+        expected = []
+        while (
+            output := step_scheduler.schedule(stepped._machines, stepped._jobs)
+        ) is not None:
+            assert stepped.schedule(*output)
+            expected.append(output)
+
+        assert list(zip(m_indices.tolist(), j_indices.tolist())) == expected
+        assert batched.execute(ClusterAction.ScheduleBatch(m_indices, j_indices)).all()
+        assert np.allclose(
+            batched._machines._machines_usage, stepped._machines._machines_usage
+        )
+        batched.execute_clock_tick()
+        stepped.execute_clock_tick()
+
+
+@given(cluster=clusters)
+def test_schedule_batch_leaves_collections_untouched(cluster: MetricCluster):
+    random.seed(0)
+    scheduler = RoundRobinScheduler(cluster.is_allocation_possible, cluster.allocation)
+    usage = cluster._machines._machines_usage.copy()
+    statuses = [job.status for job in cluster._jobs]
+
+    m_indices, j_indices = scheduler.schedule_batch(cluster._machines, cluster._jobs)
+
+    assert m_indices.shape == j_indices.shape
+    assert len(set(j_indices.tolist())) == len(j_indices)
+    assert np.array_equal(cluster._machines._machines_usage, usage)
+    assert [job.status for job in cluster._jobs] == statuses
+
+
+def test_schedule_batch_requires_allocate_func():
+    cluster = MetricClusterCreator.generate_default(
+        n_machines=2, n_jobs=2, n_resources=1, n_ticks=2, seed=0
+    )
+    with pytest.raises(ValueError):
+        FCFSScheduler(cluster.is_allocation_possible).schedule_batch(
+            cluster._machines, cluster._jobs
+        )
@@ -0,0 +1,33 @@
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from src.scheduler.best_fit_scheduler import BestFitScheduler
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+
+
+@settings(deadline=None)
+@given(cluster=clusters)
+def test_best_fit_places_job_on_tightest_machine(cluster: MetricCluster):
+    scheduler = BestFitScheduler(cluster.is_allocation_possible)
+    while not cluster.has_completed():
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if output is None:
+            cluster.execute_clock_tick()
+            continue
+
+        m_idx, j_idx = output
+        feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+        free_capacity = cluster._machines._machines_usage.sum(axis=(1, 2))
+        tightest = free_capacity[feasibility[:, j_idx]].min()
+        assert free_capacity[m_idx] == tightest
+        assert cluster.schedule(m_idx, j_idx)
+
+    assert all(job.status == Status.Completed for job in cluster._jobs)
@@ -0,0 +1,73 @@
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from src.envs.cluster_simulator.metric_based.internal.jobs import MetricJobs
+from src.envs.cluster_simulator.metric_based.internal.machines import MetricMachines
+from src.scheduler.easy_backfilling_scheduler import EASYBackfillingScheduler
+from src.scheduler.first_come_first_served_scheduler import FCFSScheduler
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+
+
+def job_usage(value: float, length: int, n_ticks: int = 4) -> np.ndarray:
+    usage = np.zeros((1, n_ticks))
+    usage[:, :length] = value
+    return usage
+
+
+def create_blocked_head_cluster() -> MetricCluster:
+    cluster = MetricClusterCreator.generate_default(
+        n_machines=1, n_jobs=3, n_resources=1, n_ticks=4, seed=0
+    )
+    # A running job holds half of the machine for the next two ticks
+    free_space = np.array([[[0.5, 0.5, 1.0, 1.0]]])
+    jobs = np.stack([job_usage(0.8, 2), job_usage(0.3, 4), job_usage(0.3, 2)])
+    cluster._machines = MetricMachines(free_space)
+    cluster._jobs = MetricJobs(
+        jobs, np.array([Status.Pending] * 3), np.array([0, 1, 2])
+    )
+    return cluster
+
+
+def test_backfills_only_jobs_that_keep_the_head_reservation():
+    cluster = create_blocked_head_cluster()
+    scheduler = EASYBackfillingScheduler(cluster.is_allocation_possible)
+
+    output = scheduler.schedule(cluster._machines, cluster._jobs)
+
+    assert scheduler.reservation == (0, 0, 2)
+    # Job 1 fits now but would still hold the machine when job 0 is due
+    assert output == (0, 2)
+    assert FCFSScheduler(cluster.is_allocation_possible).schedule(
+        cluster._machines, cluster._jobs
+    ) == (0, 1)
+
+
+@settings(deadline=None)
+@given(cluster=clusters)
+def test_head_job_starts_by_its_reservation(cluster: MetricCluster):
+    scheduler = EASYBackfillingScheduler(cluster.is_allocation_possible)
+    due: dict[int, int] = {}
+
+    while not cluster.has_completed():
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        reservation = scheduler.reservation
+        if reservation is not None:
+            deadline = cluster._current_tick + reservation.offset
+            due[reservation.job] = min(due.get(reservation.job, deadline), deadline)
+        if output is None:
+            for j_idx, deadline in due.items():
+                if cluster._jobs[j_idx].status == Status.Pending:
+                    assert cluster._current_tick < deadline
+            cluster.execute_clock_tick()
+        else:
+            assert cluster.schedule(*output)
+
+    assert all(job.status == Status.Completed for job in cluster._jobs)
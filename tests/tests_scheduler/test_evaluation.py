@@ -0,0 +1,45 @@
+import gymnasium as gym
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.scheduler import FCFSScheduler, SJFScheduler, TetrisScheduler
+from src.scheduler.evaluation import EvaluationReport, evaluate, run_episode
+
+ENV_IDS = [
+    "ClusterScheduling-single-slot-v1",
+    "ClusterScheduling-deeprm-v1",
+    "ClusterScheduling-metric-online-v1",
+]
+
+
+@settings(deadline=None, max_examples=20)
+@given(
+    env_id=st.sampled_from(ENV_IDS),
+    scheduler_cls=st.sampled_from([FCFSScheduler, SJFScheduler, TetrisScheduler]),
+    seed=st.integers(0, 10_000),
+)
+def test_episode_metrics_are_consistent(env_id, scheduler_cls, seed):
+    env = gym.make(env_id).unwrapped
+    result = run_episode(env, scheduler_cls, seed)
+
+    assert result.completed
+    assert result.seed == seed
+    assert result.makespan == env._cluster._current_tick
+    assert result.mean_slowdown >= 1.0
+    assert 0.0 <= result.utilization <= 1.0
+    assert result.n_decisions >= result.makespan
+
+
+def test_evaluate_over_process_pool_matches_in_process():
+    seeds = range(6)
+    pooled = evaluate(FCFSScheduler, ENV_IDS[2], seeds, n_workers=2)
+    local = evaluate(FCFSScheduler, ENV_IDS[2], seeds, n_workers=1)
+
+    assert isinstance(pooled, EvaluationReport)
+    assert pooled.n_episodes == 6
+    assert [e.seed for e in pooled.episodes] == list(seeds)
+    assert pooled.makespan == pytest.approx(local.makespan)
+    assert pooled.mean_slowdown == pytest.approx(local.mean_slowdown)
+    assert pooled.utilization == pytest.approx(local.utilization)
+    assert pooled.completion_rate == 1.0
+    assert pooled.decisions_per_second > 0
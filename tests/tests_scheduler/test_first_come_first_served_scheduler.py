@@ -1 +1,43 @@
-## TODO: Implement
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+from src.scheduler.first_come_first_served_scheduler import FCFSScheduler
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+
+
+def schedulable_jobs(cluster: MetricCluster) -> list[int]:
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+    return [
+        j_idx
+        for j_idx, job in enumerate(cluster._jobs)
+        if job.status == Status.Pending and feasibility[:, j_idx].any()
+    ]
+
+
+def first_machine(cluster: MetricCluster, j_idx: int) -> int:
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+    return int(np.flatnonzero(feasibility[:, j_idx])[0])
+
+
+@settings(deadline=None)
+@given(cluster=clusters)
+def test_fcfs_schedules_earliest_arrival_on_first_machine(cluster: MetricCluster):
+    scheduler = FCFSScheduler(cluster.is_allocation_possible)
+    while (output := scheduler.schedule(cluster._machines, cluster._jobs)) is None:
+        if cluster.has_completed():
+            return
+        cluster.execute_clock_tick()
+
+    m_idx, j_idx = output
+    candidates = schedulable_jobs(cluster)
+    earliest = min(cluster._jobs[idx].arrival_time for idx in candidates)
+    assert cluster._jobs[j_idx].arrival_time == earliest
+    assert m_idx == first_machine(cluster, j_idx)
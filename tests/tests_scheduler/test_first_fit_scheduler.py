@@ -0,0 +1,36 @@
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from src.scheduler.first_fit_scheduler import FirstFitScheduler
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+
+
+@settings(deadline=None)
+@given(cluster=clusters)
+def test_first_fit_places_earliest_job_on_lowest_machine(cluster: MetricCluster):
+    scheduler = FirstFitScheduler(cluster.is_allocation_possible)
+    while not cluster.has_completed():
+        feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if output is None:
+            assert not any(
+                feasibility[:, j_idx].any()
+                for j_idx, job in enumerate(cluster._jobs)
+                if job.status == Status.Pending
+            )
+            cluster.execute_clock_tick()
+            continue
+
+        m_idx, j_idx = output
+        assert m_idx == int(np.flatnonzero(feasibility[:, j_idx])[0])
+        assert cluster.schedule(m_idx, j_idx)
+
+    assert all(job.status == Status.Completed for job in cluster._jobs)
@@ -0,0 +1,97 @@
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.cluster import ClusterABC
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.deep_rm import DeepRMCreators
+from src.envs.cluster_simulator.metric_based import MetricClusterCreator
+from src.scheduler import DotProductScheduler, L2NormDiffScheduler, TetrisScheduler
+from tests.strategies.cluster_strategies import (
+    DeepRMStrategies,
+    MetricClusterStrategies,
+)
+
+clusters = st.one_of(
+    st.builds(
+        lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+        MetricClusterStrategies.initialization_parameters(),
+        st.integers(0, 10_000),
+    ),
+    st.builds(
+        lambda params, seed: DeepRMCreators.generate_default_cluster(
+            **params, seed=seed
+        ),
+        DeepRMStrategies.initialization_parameters(),
+        st.integers(0, 10_000),
+    ),
+)
+
+
+def tetris_score(free_space, usage, job):
+    free_now = free_space.reshape(-1, free_space.shape[-1])[:, 0]
+    peak = usage.reshape(-1, usage.shape[-1]).max(axis=-1)
+    return float(free_now @ peak) - 0.5 * job.length
+
+
+def dot_product_score(free_space, usage, job):
+    return float(np.sum(free_space * usage))
+
+
+def l2_norm_diff_score(free_space, usage, job):
+    return -float(np.sum((free_space - usage) ** 2))
+
+
+schedulers = st.sampled_from(
+    [
+        (
+            lambda *args, **kwargs: TetrisScheduler(
+                *args, duration_weight=0.5, **kwargs
+            ),
+            tetris_score,
+        ),
+        (DotProductScheduler, dot_product_score),
+        (L2NormDiffScheduler, l2_norm_diff_score),
+    ]
+)
+
+
+def best_pair_by_loop(cluster: ClusterABC, score_func) -> float:
+    scores = [
+        score_func(
+            np.asarray(machine.free_space, dtype=np.float64),
+            np.asarray(job.usage, dtype=np.float64),
+            job,
+        )
+        for machine in iter(cluster._machines)
+        for job in cluster._jobs
+        if job.status == Status.Pending and cluster.is_allocation_possible(machine, job)
+    ]
+    return max(scores, default=None)
+
+
+@settings(deadline=None)
+@given(cluster=clusters, scheduler=schedulers)
+def test_packing_scheduler_picks_best_scoring_pair(cluster: ClusterABC, scheduler):
+    scheduler_type, score_func = scheduler
+    vectorized = scheduler_type(
+        cluster.is_allocation_possible, feasibility_func=cluster.feasibility_matrix
+    )
+    looped = scheduler_type(cluster.is_allocation_possible)
+
+    while not cluster.has_completed():
+        output = vectorized.schedule(cluster._machines, cluster._jobs)
+        assert output == looped.schedule(cluster._machines, cluster._jobs)
+        best = best_pair_by_loop(cluster, score_func)
+        if output is None:
+            assert best is None
+            cluster.execute_clock_tick()
+            continue
+
+        m_idx, j_idx = output
+        chosen = score_func(
+            np.asarray(cluster._machines[m_idx].free_space, dtype=np.float64),
+            np.asarray(cluster._jobs[j_idx].usage, dtype=np.float64),
+            cluster._jobs[j_idx],
+        )
+        assert np.isclose(chosen, best)
+        assert cluster.schedule(m_idx, j_idx)
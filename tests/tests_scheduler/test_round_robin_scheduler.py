@@ -1 +1,46 @@
-## TODO: Implement
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+from src.scheduler.round_robin_scheduler import RoundRobinScheduler
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+
+
+def schedulable_jobs(cluster: MetricCluster) -> list[int]:
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+    return [
+        j_idx
+        for j_idx, job in enumerate(cluster._jobs)
+        if job.status == Status.Pending and feasibility[:, j_idx].any()
+    ]
+
+
+def first_machine(cluster: MetricCluster, j_idx: int) -> int:
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+    return int(np.flatnonzero(feasibility[:, j_idx])[0])
+
+
+@settings(deadline=None)
+@given(cluster=clusters)
+def test_round_robin_schedules_next_index_after_last(cluster: MetricCluster):
+    scheduler = RoundRobinScheduler(cluster.is_allocation_possible)
+    while not cluster.has_completed():
+        last_job_idx = scheduler._last_job_idx
+        candidates = schedulable_jobs(cluster)
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        if output is None:
+            assert not candidates
+            cluster.execute_clock_tick()
+            continue
+
+        _, j_idx = output
+        after = [idx for idx in candidates if idx > last_job_idx]
+        assert j_idx == (after or candidates)[0]
+        assert cluster.schedule(*output)
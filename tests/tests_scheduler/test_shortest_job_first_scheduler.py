@@ -1 +1,58 @@
-## TODO: Implement
+import random
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from src.envs.cluster_simulator.base.internal.job import Status
+from src.envs.cluster_simulator.metric_based import MetricCluster, MetricClusterCreator
+from tests.strategies.cluster_strategies import MetricClusterStrategies
+from src.scheduler.shortest_job_first_scheduler import SJFScheduler
+
+clusters = st.builds(
+    lambda params, seed: MetricClusterCreator.generate_default(**params, seed=seed),
+    MetricClusterStrategies.initialization_parameters(),
+    st.integers(0, 10_000),
+)
+
+
+def schedulable_jobs(cluster: MetricCluster) -> list[int]:
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+    return [
+        j_idx
+        for j_idx, job in enumerate(cluster._jobs)
+        if job.status == Status.Pending and feasibility[:, j_idx].any()
+    ]
+
+
+def first_machine(cluster: MetricCluster, j_idx: int) -> int:
+    feasibility = cluster.feasibility_matrix(cluster._machines, cluster._jobs)
+    return int(np.flatnonzero(feasibility[:, j_idx])[0])
+
+
+@settings(deadline=None)
+@given(cluster=clusters, seed=st.integers(0, 10_000))
+def test_sjf_schedules_shortest_runnable_job(cluster: MetricCluster, seed: int):
+    random.seed(seed)
+    scheduler = SJFScheduler(cluster.is_allocation_possible)
+    while not cluster.has_completed():
+        output = scheduler.schedule(cluster._machines, cluster._jobs)
+        candidates = schedulable_jobs(cluster)
+        if output is None:
+            assert not candidates
+            cluster.execute_clock_tick()
+            continue
+
+        m_idx, j_idx = output
+        shortest = min(candidates, key=lambda idx: (cluster._jobs[idx].length, idx))
+        assert j_idx == shortest
+        assert m_idx == first_machine(cluster, j_idx)
+        assert cluster.schedule(m_idx, j_idx)
+
+
+def test_job_length_counts_ticks():
+    cluster = MetricClusterCreator.generate_default(
+        n_machines=1, n_jobs=4, n_resources=3, n_ticks=5, seed=0
+    )
+    for job in cluster._jobs:
+        active_ticks = np.flatnonzero(job.usage.any(axis=0))
+        assert job.length == active_ticks[-1] - active_ticks[0] + 1